@@ -8,6 +8,8 @@ A DSPy-native multi-agent orchestration framework.
 from agenthelm.core import (
     tool,
     TOOL_REGISTRY,
+    ToolCache,
+    BlobStore,
     Event,
     TokenUsage,
     ApprovalHandler,
@@ -35,6 +37,8 @@ from agenthelm.memory import (
 from agenthelm.agent import (
     BaseAgent,
     AgentResult,
+    LLMCache,
+    PlanCache,
     Plan,
     PlanStep,
     StepStatus,
@@ -61,6 +65,8 @@ __all__ = [
     # Core
     "tool",
     "TOOL_REGISTRY",
+    "ToolCache",
+    "BlobStore",
     "Event",
     "TokenUsage",
     "ApprovalHandler",
@@ -84,6 +90,8 @@ __all__ = [
     # Agents
     "BaseAgent",
     "AgentResult",
+    "LLMCache",
+    "PlanCache",
     "Plan",
     "PlanStep",
     "StepStatus",
@@ -15,6 +15,8 @@ Example usage:
 
 from agenthelm.agent.base import BaseAgent
 from agenthelm.agent.result import AgentResult
+from agenthelm.agent.llm_cache import LLMCache
+from agenthelm.agent.plan_cache import PlanCache
 from agenthelm.agent.plan import Plan, PlanStep, StepStatus
 from agenthelm.agent.tool_agent import ToolAgent
 from agenthelm.agent.planner import PlannerAgent
@@ -23,6 +25,8 @@ __all__ = [
     # Base
     "BaseAgent",
     "AgentResult",
+    "LLMCache",
+    "PlanCache",
     # Planning
     "Plan",
     "PlanStep",
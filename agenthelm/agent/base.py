@@ -4,6 +4,9 @@ from typing import Callable
 import dspy
 
 from agenthelm import MemoryHub, ExecutionTracer, TOOL_REGISTRY
+from agenthelm.agent.llm_cache import CachedLM, LLMCache, resolve_llm_cache
+from agenthelm.core.cost import BaseCostTracker, CostTracker
+from agenthelm.core.usage import UsageRecorder
 
 
 class BaseAgent(ABC):
@@ -17,6 +20,10 @@ class BaseAgent(ABC):
         memory: Optional MemoryHub for context persistence
         tracer: Optional ExecutionTracer for tool call logging
         role: Optional role/persona description that influences behavior
+        llm_cache: Optional LLMCache for identical LM calls (True for the
+            default cache in ~/.agenthelm/llm_cache.db)
+        cost_tracker: Prices the agent's LM usage and keeps totals across
+            runs (default: a CostTracker with the built-in pricing)
     """
 
     def __init__(
@@ -27,6 +34,8 @@ class BaseAgent(ABC):
         memory: MemoryHub | None = None,
         tracer: ExecutionTracer | None = None,
         role: str | None = None,
+        llm_cache: LLMCache | bool | None = None,
+        cost_tracker: BaseCostTracker | None = None,
     ):
         self.name = name
         self.lm = lm
@@ -34,6 +43,22 @@ class BaseAgent(ABC):
         self.memory = memory
         self.tracer = tracer
         self.role = role
+        self.llm_cache = resolve_llm_cache(llm_cache)
+        self.cost_tracker = cost_tracker or CostTracker()
+
+    @property
+    def _run_lm(self) -> dspy.BaseLM:
+        """The LM to run with: self.lm, behind the LLM cache if one is set."""
+        if self.llm_cache is None:
+            return self.lm
+        cached = getattr(self, "_cached_lm", None)
+        if cached is None or cached.lm is not self.lm:
+            cached = self._cached_lm = CachedLM(self.lm, self.llm_cache)
+        return cached
+
+    def _usage_recorder(self) -> UsageRecorder:
+        """A recorder for one run, forwarding to any usage tracker already set."""
+        return UsageRecorder(self.cost_tracker, parent=dspy.settings.usage_tracker)
 
     @abstractmethod
     def run(self, task: str): ...
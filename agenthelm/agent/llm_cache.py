@@ -0,0 +1,331 @@
+"""LLMCache - Exact-match cache for agent LM calls."""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Generator
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import dspy
+
+try:
+    from dspy.clients._deprecation import adapter_message_call
+except ImportError:  # DSPy < 3.4 doesn't warn about messages=
+
+    def adapter_message_call(lm: Any, messages: Any) -> Any:
+        return nullcontext()
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_PATH = Path.home() / ".agenthelm" / "llm_cache.db"
+
+
+@dataclass
+class LLMCacheStats:
+    """LLM cache activity during one agent run."""
+
+    hits: int = 0
+    misses: int = 0
+    saved_seconds: float = 0.0
+    saved_usd: float = 0.0
+
+    @property
+    def cache_hit(self) -> bool:
+        """Whether every LM call in the run was served from cache."""
+        return self.hits > 0 and self.misses == 0
+
+
+_run_stats: ContextVar[LLMCacheStats | None] = ContextVar(
+    "agenthelm_llm_cache_stats", default=None
+)
+
+
+@contextmanager
+def track_llm_cache() -> Generator[LLMCacheStats]:
+    """Collect LLM cache hits and misses for the calls made inside the block."""
+    stats = LLMCacheStats()
+    token = _run_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _run_stats.reset(token)
+
+
+class LLMCache:
+    """
+    Two-tier exact-match cache of LM completions.
+
+    Entries are keyed by the model, the rendered messages and the request
+    parameters. DSPy renders the signature, inputs, role and tool set into
+    the messages, so any change to those is a miss. An in-process LRU tier
+    sits in front of an optional SQLite tier that persists across runs.
+    Each entry remembers how long the original call took and what it cost,
+    so hits can report saved latency and spend.
+
+    Example:
+        cache = LLMCache(ttl=7 * 86400)  # ~/.agenthelm/llm_cache.db
+        agent = ToolAgent(name="assistant", lm=lm, tools=tools, llm_cache=cache)
+
+        result = agent.run("What time is it in Tokyo?")
+        result.llm_cache_hits, result.llm_cache_saved_seconds
+    """
+
+    def __init__(
+        self,
+        ttl: float = 7 * 86400,
+        maxsize: int = 1024,
+        db_path: str | Path | None = DEFAULT_DB_PATH,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Seconds an entry stays valid (0 for no expiration)
+            maxsize: Max entries in the in-process tier before the least
+                recently used is evicted
+            db_path: SQLite file for the persistent tier (None keeps
+                entries in process only)
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.db_path = Path(db_path).expanduser() if db_path else None
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        self._lock = threading.Lock()
+        if self.db_path is not None:
+            self._create_table_if_not_exists(self.db_path)
+
+    @staticmethod
+    def _connect(db_path: Path) -> sqlite3.Connection:
+        """Open a connection to the persistent tier."""
+        return sqlite3.connect(db_path, timeout=30)
+
+    def _create_table_if_not_exists(self, db_path: Path) -> None:
+        """Create the SQLite table and its parent directory."""
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect(db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    expires_at REAL,
+                    created_at REAL NOT NULL
+                )
+            """)
+        conn.close()
+
+    @staticmethod
+    def key(model: str, messages: Any, kwargs: dict[str, Any]) -> str:
+        """Cache key for a request."""
+        request = {"model": model, "messages": messages, "kwargs": kwargs}
+        encoded = json.dumps(request, sort_keys=True, default=str).encode()
+        return hashlib.sha256(encoded).hexdigest()
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """
+        Return a cached entry (outputs, latency, cost) or None on a miss.
+
+        Entries found only in SQLite are promoted to the in-process tier.
+        """
+        now = time.time()
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and (not cached[0] or cached[0] > now):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached[1]
+            self._entries.pop(key, None)
+
+        entry = None
+        if self.db_path is not None:
+            with self._connect(self.db_path) as conn:
+                row = conn.execute(
+                    "SELECT value, expires_at FROM llm_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None and row[1] and row[1] <= now:
+                    conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                    row = None
+            conn.close()
+            if row is not None:
+                entry = json.loads(row[0])
+                self._remember(key, entry, row[1] or 0.0)
+
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return entry
+
+    def _remember(self, key: str, entry: dict, expires: float) -> None:
+        """Store an entry in the in-process tier, evicting the LRU."""
+        with self._lock:
+            self._entries[key] = (expires, entry)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def put(self, key: str, entry: dict[str, Any]) -> None:
+        """Store an entry in both tiers."""
+        expires = time.time() + self.ttl if self.ttl else 0.0
+        self._remember(key, entry, expires)
+        if self.db_path is None:
+            return
+
+        try:
+            value = json.dumps(entry)
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Not persisting LLM cache entry: {e}")
+            return
+        with self._connect(self.db_path) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, expires_at, created_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, value, expires or None, time.time()),
+            )
+        conn.close()
+
+    def clear(self) -> None:
+        """Drop every entry from both tiers."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+        if self.db_path is not None:
+            with self._connect(self.db_path) as conn:
+                conn.execute("DELETE FROM llm_cache")
+            conn.close()
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Hit and miss counts since creation, and in-process entry count."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "size": len(self._entries),
+        }
+
+
+def resolve_llm_cache(cache: "LLMCache | bool | None") -> LLMCache | None:
+    """Turn an llm_cache option into an LLMCache (True for the defaults)."""
+    if cache is None or cache is False:
+        return None
+    if cache is True:
+        return LLMCache()
+    return cache
+
+
+class CachedLM(dspy.BaseLM):
+    """
+    Wraps a DSPy LM so identical calls are answered from an LLMCache.
+
+    Misses are forwarded to the wrapped LM unchanged. Hits return the
+    recorded outputs without a request, so they add nothing to the wrapped
+    LM's history or usage.
+    """
+
+    def __init__(self, lm: dspy.BaseLM, cache: LLMCache):
+        """
+        Initialize the wrapper.
+
+        Args:
+            lm: The LM to forward misses to
+            cache: Where completions are stored
+        """
+        super().__init__(model=lm.model, model_type=lm.model_type, cache=False)
+        self.lm = lm
+        self.llm_cache = cache
+        self.kwargs = lm.kwargs
+
+    @property
+    def supports_function_calling(self) -> bool:
+        return self.lm.supports_function_calling
+
+    @property
+    def supports_reasoning(self) -> bool:
+        return self.lm.supports_reasoning
+
+    @property
+    def supports_response_schema(self) -> bool:
+        return self.lm.supports_response_schema
+
+    @property
+    def supported_params(self) -> set[str]:
+        return self.lm.supported_params
+
+    def _key(self, prompt: Any, messages: Any, kwargs: dict[str, Any]) -> str:
+        """Cache key for a call, including the LM's default parameters."""
+        request = {"prompt": prompt, "messages": messages}
+        return self.llm_cache.key(self.model, request, {**self.lm.kwargs, **kwargs})
+
+    def _hit(self, entry: dict[str, Any]) -> list:
+        """Record a hit for the current run and return its outputs."""
+        stats = _run_stats.get()
+        if stats is not None:
+            stats.hits += 1
+            stats.saved_seconds += entry.get("latency", 0.0)
+            stats.saved_usd += entry.get("cost") or 0.0
+        return list(entry["outputs"])
+
+    def _cost_of(self, outputs: list) -> float | None:
+        """
+        Cost of the call that returned outputs.
+
+        The wrapped LM may be shared by other threads, so the newest history
+        entry can belong to another call; the entry of this call is the one
+        holding the very outputs list it returned.
+        """
+        for entry in reversed(list(self.lm.history)):
+            if entry.get("outputs") is outputs:
+                return entry.get("cost")
+        return None
+
+    def _store(self, key: str, outputs: list, latency: float) -> None:
+        """Cache a fresh completion and record a miss for the current run."""
+        cost = self._cost_of(outputs)
+        self.llm_cache.put(
+            key, {"outputs": list(outputs), "latency": latency, "cost": cost}
+        )
+        stats = _run_stats.get()
+        if stats is not None:
+            stats.misses += 1
+
+    def __call__(self, prompt=None, *, messages=None, **kwargs):
+        key = self._key(prompt, messages, kwargs)
+        entry = self.llm_cache.get(key)
+        if entry is not None:
+            return self._hit(entry)
+
+        start = time.monotonic()
+        # Forward adapter messages the way DSPy's adapters pass them
+        with adapter_message_call(self.lm, messages):
+            outputs = self.lm(prompt, messages=messages, **kwargs)
+        self._store(key, outputs, time.monotonic() - start)
+        return outputs
+
+    async def acall(self, prompt=None, *, messages=None, **kwargs):
+        key = self._key(prompt, messages, kwargs)
+        entry = self.llm_cache.get(key)
+        if entry is not None:
+            return self._hit(entry)
+
+        start = time.monotonic()
+        with adapter_message_call(self.lm, messages):
+            outputs = await self.lm.acall(prompt, messages=messages, **kwargs)
+        self._store(key, outputs, time.monotonic() - start)
+        return outputs
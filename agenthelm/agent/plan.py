@@ -5,6 +5,8 @@ from typing import Any
 
 from pydantic import BaseModel, Field
 
+from agenthelm.core.cost import TokenUsage
+
 
 class StepStatus(str, Enum):
     """Status of a plan step."""
@@ -65,6 +67,18 @@ class Plan(BaseModel):
     goal: str = Field(description="The goal this plan aims to achieve")
     steps: list[PlanStep] = Field(default_factory=list, description="Ordered steps")
     reasoning: str = Field(default="", description="LLM reasoning for this plan")
+    cache_hit: bool = Field(
+        default=False, description="Whether the plan came from a cache"
+    )
+    cache_score: float | None = Field(
+        default=None, description="Similarity of the task a cached plan was made for"
+    )
+    token_usage: TokenUsage | None = Field(
+        default=None, description="LM tokens spent generating the plan"
+    )
+    estimated_cost_usd: float = Field(
+        default=0.0, description="Estimated cost of generating the plan"
+    )
 
     # Execution state
     approved: bool = Field(
@@ -0,0 +1,355 @@
+"""PlanCache - Reuse stored plans for semantically similar tasks."""
+
+import difflib
+import hashlib
+import json
+import logging
+import re
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+from agenthelm.agent.plan import Plan, PlanStep
+from agenthelm.core.loop import BackgroundLoop
+from agenthelm.memory.base import BaseSemanticMemory
+
+logger = logging.getLogger(__name__)
+
+PlanValidator = Callable[[str, Plan], bool]
+
+_TOKEN = re.compile(r"\S+")
+_STRIP = ".,;:!?\"'()$€£"
+_IDENTIFIER_CHARS = set("-_./@#:")
+
+
+class Unbindable(ValueError):
+    """A cached plan can't be safely re-bound to a new task."""
+
+
+def _is_entity(tokens: list[str], start: int, end: int) -> bool:
+    """
+    Whether tokens[start:end] look like a parameter rather than prose.
+
+    Numbers, identifiers (ids, paths, emails), quoted strings and
+    capitalized names count; a capital at the start of a sentence doesn't,
+    so verbs like "Delete" and function words like "to" are never bound.
+    """
+    words = [t.strip(_STRIP) for t in tokens[start:end]]
+    if not all(words):
+        return False
+    text = " ".join(words)
+    if any(ch.isdigit() for ch in text) or _IDENTIFIER_CHARS & set(text):
+        return True
+    if tokens[start][0] in "\"'" and tokens[end - 1][-1] in "\"'":
+        return True
+    sentence_start = start == 0 or tokens[start - 1][-1] in ".!?"
+    return not sentence_start and all(w[0].isupper() for w in words)
+
+
+def task_bindings(cached_task: str, task: str) -> tuple[dict[str, str], list[str]]:
+    """
+    Compare two tasks word by word.
+
+    Returns:
+        (bindings, unbound) - bindings maps entity-like spans of cached_task
+        to their replacements, so "weather in Paris tomorrow" against
+        "weather in Tokyo tomorrow" gives {"Paris": "Tokyo"}. unbound lists
+        the other changed words of cached_task (verbs, function words),
+        which are never rewritten. Pure insertions are ignored.
+    """
+    old = _TOKEN.findall(cached_task)
+    new = _TOKEN.findall(task)
+    matcher = difflib.SequenceMatcher(a=old, b=new, autojunk=False)
+
+    bindings = {}
+    unbound = []
+    for op, i1, i2, j1, j2 in matcher.get_opcodes():
+        if op == "equal" or i1 == i2:
+            continue
+        source = " ".join(old[i1:i2]).strip(_STRIP)
+        target = " ".join(new[j1:j2]).strip(_STRIP)
+        if source == target:
+            continue
+        if op == "replace" and _is_entity(old, i1, i2) and _is_entity(new, j1, j2):
+            bindings[source] = target
+        else:
+            unbound.append(source)
+    return bindings, unbound
+
+
+def _pattern(source: str) -> re.Pattern:
+    """Whole-word pattern for a binding source."""
+    return re.compile(rf"(?<!\w){re.escape(source)}(?!\w)", re.IGNORECASE)
+
+
+def _mentions(value: Any, source: str) -> bool:
+    """Whether source appears as a whole word in any scalar inside value."""
+    if isinstance(value, dict):
+        return any(_mentions(v, source) for v in value.values())
+    if isinstance(value, list):
+        return any(_mentions(v, source) for v in value)
+    if value is None or isinstance(value, bool):
+        return False
+    return bool(_pattern(source).search(str(value)))
+
+
+def rebind(value: Any, bindings: dict[str, str]) -> Any:
+    """
+    Apply bindings to every scalar inside value (dicts and lists included).
+
+    Strings are rewritten on whole words. Numbers are matched by their
+    string form and keep their type, so {"amount": 100} with
+    {"100": "1000"} becomes {"amount": 1000}.
+
+    Raises:
+        Unbindable: If a number's replacement isn't a number
+    """
+    if isinstance(value, bool) or value is None:
+        return value
+    if isinstance(value, (int, float)):
+        target = bindings.get(str(value))
+        if target is None:
+            return value
+        try:
+            return type(value)(target.replace(",", ""))
+        except ValueError:
+            raise Unbindable(f"Can't bind {value!r} to {target!r}") from None
+    if isinstance(value, str):
+        if value in bindings:
+            return bindings[value]
+        # Longest first so "New York" wins over "York"
+        for source in sorted(bindings, key=len, reverse=True):
+            value = _pattern(source).sub(lambda _, s=source: bindings[s], value)
+        return value
+    if isinstance(value, dict):
+        return {k: rebind(v, bindings) for k, v in value.items()}
+    if isinstance(value, list):
+        return [rebind(v, bindings) for v in value]
+    return value
+
+
+def check_bindable(
+    steps: list[dict[str, Any]], bindings: dict[str, str], unbound: list[str]
+) -> None:
+    """
+    Check that a stored plan can be re-bound to a new task.
+
+    Raises:
+        Unbindable: If a changed word names a step's tool (the new task
+            asks for a different action), a changed word that isn't bound
+            appears in an arg, or a binding has no arg to apply to (the
+            plan doesn't take that value as a parameter)
+    """
+    tool_words = set()
+    for step in steps:
+        for name in (step["tool_name"], step.get("compensate_tool") or ""):
+            tool_words.update(w for w in re.split(r"[\W_]+", name.lower()) if w)
+
+    args = [[step["args"], step.get("compensate_args", {})] for step in steps]
+    for source in [*bindings, *unbound]:
+        if tool_words & {w.lower() for w in re.split(r"[\W_]+", source) if w}:
+            raise Unbindable(f"'{source}' names a tool in the cached plan")
+    for source in unbound:
+        if _mentions(args, source):
+            raise Unbindable(f"'{source}' changed but can't be re-bound")
+    for source in bindings:
+        if not _mentions(args, source):
+            raise Unbindable(f"'{source}' isn't an argument of the cached plan")
+
+
+class PlanCache:
+    """
+    Semantic cache of plans, keyed by an embedding of the task.
+
+    PlannerAgent asks the cache before planning. The nearest stored task
+    with the same tools and role is reused if its similarity reaches the
+    threshold: its steps are copied with fresh runtime state, and values
+    that differ between the two tasks (a city, an amount, a ticket number)
+    are re-bound in the goal, step descriptions and args. Only entity-like
+    values are re-bound. If the tasks differ in a word that names a tool,
+    appears in an arg without being re-bindable, or isn't an arg at all,
+    the candidate is a miss. A validator can also reject a candidate plan,
+    which then counts as a miss.
+
+    Example:
+        cache = PlanCache(SemanticMemory(mode="local", path="./plans"))
+        planner = PlannerAgent(name="planner", lm=lm, tools=tools, plan_cache=cache)
+
+        planner.plan("Book a flight to Paris")   # LLM call, plan stored
+        planner.plan("Book a flight to Tokyo")   # Cached plan, args re-bound
+        cache.stats  # {"hits": 1, "misses": 1, "rejected": 0, "hit_rate": 0.5, ...}
+    """
+
+    def __init__(
+        self,
+        memory: BaseSemanticMemory | None = None,
+        threshold: float = 0.9,
+        validator: PlanValidator | None = None,
+        namespace: str = "plan_cache",
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            memory: Semantic memory holding the plans (default: an in-memory
+                SemanticMemory in its own collection)
+            threshold: Minimum similarity score for a stored plan to be reused
+            validator: Optional check called as validator(task, plan) on a
+                candidate plan; returning False rejects it
+            namespace: Metadata tag separating plans from other memories in
+                a shared collection
+        """
+        if memory is None:
+            from agenthelm.memory.semantic import SemanticMemory
+
+            memory = SemanticMemory(collection_name="agenthelm_plans")
+
+        self.memory = memory
+        self.threshold = threshold
+        self.validator = validator
+        self.namespace = namespace
+        self.hits = 0
+        self.misses = 0
+        self.rejected = 0
+        self.saved_seconds = 0.0
+        self._lock = threading.Lock()
+        self._loop: BackgroundLoop | None = None
+
+    def _run(self, coro: Any) -> Any:
+        """Run a memory coroutine on the cache's loop."""
+        if self._loop is None:
+            self._loop = BackgroundLoop(name="agenthelm-plancache")
+        return self._loop.run(coro)
+
+    @staticmethod
+    def scope(tool_names: list[str], role: str | None = None) -> str:
+        """Key for the planning context a plan is valid in."""
+        encoded = json.dumps({"tools": sorted(tool_names), "role": role})
+        return hashlib.sha256(encoded.encode()).hexdigest()[:32]
+
+    def lookup(self, task: str, scope: str = "") -> Plan | None:
+        """
+        Return a stored plan for a similar task, re-bound to this task.
+
+        Returns None if nothing in the scope reaches the threshold or the
+        validator rejects the candidate.
+        """
+        results = self._run(
+            self.memory.search(
+                task, top_k=1, filter={"kind": self.namespace, "scope": scope}
+            )
+        )
+        match = results[0] if results else None
+        if match is None or match.score < self.threshold:
+            self._count(hit=False)
+            return None
+
+        metadata = match.metadata or {}
+        try:
+            plan = self._load(task, match.text, metadata, match.score)
+        except Unbindable as e:
+            logger.debug(f"Plan cache candidate not reusable for task: {e}")
+            self._count(hit=False)
+            return None
+        if self.validator is not None and not self.validator(task, plan):
+            logger.debug(f"Plan cache candidate rejected for task: {task}")
+            with self._lock:
+                self.rejected += 1
+            self._count(hit=False)
+            return None
+
+        self._count(hit=True, saved=metadata.get("latency", 0.0))
+        return plan
+
+    def _load(
+        self, task: str, cached_task: str, metadata: dict[str, Any], score: float
+    ) -> Plan:
+        """
+        Rebuild a stored plan for task, with fresh step state.
+
+        Raises:
+            Unbindable: If the plan can't be safely re-bound to task
+        """
+        stored = json.loads(metadata["plan"])
+        bindings, unbound = task_bindings(cached_task, task)
+        check_bindable(stored["steps"], bindings, unbound)
+        return Plan(
+            goal=rebind(stored["goal"], bindings),
+            reasoning=stored.get("reasoning", ""),
+            steps=[
+                PlanStep(
+                    **{
+                        **step,
+                        "description": rebind(step["description"], bindings),
+                        "args": rebind(step["args"], bindings),
+                        "compensate_args": rebind(step["compensate_args"], bindings),
+                    }
+                )
+                for step in stored["steps"]
+            ],
+            cache_hit=True,
+            cache_score=score,
+        )
+
+    def _count(self, hit: bool, saved: float = 0.0) -> None:
+        """Update the hit/miss counters."""
+        with self._lock:
+            if hit:
+                self.hits += 1
+                self.saved_seconds += saved
+            else:
+                self.misses += 1
+
+    def store(
+        self, task: str, plan: Plan, scope: str = "", latency: float = 0.0
+    ) -> str:
+        """
+        Store a plan for later lookups. Returns the memory ID.
+
+        Args:
+            task: The task the plan was generated for
+            plan: The generated plan (runtime state is not stored)
+            scope: Planning context from scope()
+            latency: Seconds the plan took to generate, reported as saved
+                time on later hits
+        """
+        stored = plan.model_dump(
+            mode="json",
+            include={"goal", "reasoning", "steps"},
+            exclude={"steps": {"__all__": {"status", "result", "error"}}},
+        )
+        metadata = {
+            "kind": self.namespace,
+            "scope": scope,
+            "plan": json.dumps(stored),
+            "latency": latency,
+            "created_at": time.time(),
+        }
+        return self._run(self.memory.store(task, metadata=metadata))
+
+    def clear(self) -> None:
+        """Drop every stored plan and reset the counters."""
+        self._run(self.memory.delete_by_filter({"kind": self.namespace}))
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.rejected = 0
+            self.saved_seconds = 0.0
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Hit, miss and rejection counts, hit rate and planning time saved."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "rejected": self.rejected,
+            "hit_rate": self.hits / total if total else 0.0,
+            "saved_seconds": self.saved_seconds,
+        }
+
+    def close(self) -> None:
+        """Stop the loop used to drive the memory."""
+        if self._loop is not None:
+            self._loop.stop()
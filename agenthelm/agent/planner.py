@@ -1,13 +1,17 @@
 """PlannerAgent - Generates execution plans for tasks."""
 
 import json
+import time
 from typing import Callable
 
 import dspy
 
 from agenthelm import MemoryHub, ExecutionTracer
 from agenthelm.agent.base import BaseAgent
+from agenthelm.agent.llm_cache import LLMCache, track_llm_cache
 from agenthelm.agent.plan import Plan, PlanStep
+from agenthelm.agent.plan_cache import PlanCache
+from agenthelm.core.cost import BaseCostTracker
 
 
 class PlannerAgent(BaseAgent):
@@ -27,9 +31,13 @@ class PlannerAgent(BaseAgent):
         tracer: ExecutionTracer | None = None,
         role: str | None = None,
         max_steps: int = 10,
+        llm_cache: LLMCache | bool | None = None,
+        plan_cache: PlanCache | None = None,
+        cost_tracker: BaseCostTracker | None = None,
     ):
-        super().__init__(name, lm, tools, memory, tracer, role)
+        super().__init__(name, lm, tools, memory, tracer, role, llm_cache, cost_tracker)
         self.max_steps = max_steps
+        self.plan_cache = plan_cache
 
         # DSPy module for plan generation - include role if provided
         if self.role:
@@ -94,15 +102,30 @@ class PlannerAgent(BaseAgent):
         """
         Generate an execution plan for the given task.
 
+        With a plan_cache, a stored plan for a similar task is returned
+        instead when one matches, and new plans are stored.
+
         Args:
             task: The task to plan for
 
         Returns:
             Plan object with steps (not yet executed)
         """
+        scope = ""
+        if self.plan_cache is not None:
+            scope = PlanCache.scope([t.__name__ for t in self.tools], self.role)
+            cached = self.plan_cache.lookup(task, scope)
+            if cached is not None:
+                return cached
+
+        start = time.perf_counter()
         tool_descriptions = self._get_tool_descriptions()
 
-        with dspy.context(lm=self.lm):
+        recorder = self._usage_recorder()
+        with (
+            dspy.context(lm=self._run_lm, usage_tracker=recorder),
+            track_llm_cache() as cache_stats,
+        ):
             if self.role:
                 result = self._planning(
                     task=task,
@@ -118,11 +141,17 @@ class PlannerAgent(BaseAgent):
         # Parse the steps from LLM output
         steps = self._parse_steps(result.steps_json)
 
-        return Plan(
+        plan = Plan(
             goal=result.goal,
             reasoning=result.reasoning,
             steps=steps,
+            cache_hit=cache_stats.cache_hit,
         )
+        plan.token_usage, plan.estimated_cost_usd = recorder.take()
+        if self.plan_cache is not None and steps:
+            latency = time.perf_counter() - start
+            self.plan_cache.store(task, plan, scope, latency=latency)
+        return plan
 
     def run(self, task: str) -> Plan:
         """Generate a plan (alias for plan())."""
@@ -2,6 +2,7 @@
 
 from pydantic import BaseModel, Field
 
+from agenthelm.agent.llm_cache import LLMCacheStats
 from agenthelm.core.event import Event, TokenUsage
 
 
@@ -30,16 +31,49 @@ class AgentResult(BaseModel):
     session_id: str | None = Field(default=None, description="Session identifier")
     iterations: int = Field(default=0, description="Number of reasoning iterations")
 
+    # LLM cache
+    cache_hit: bool = Field(
+        default=False, description="Whether every LM call was served from cache"
+    )
+    llm_cache_hits: int = Field(default=0, description="LM calls served from cache")
+    llm_cache_misses: int = Field(default=0, description="LM calls sent to the model")
+    llm_cache_saved_seconds: float = Field(
+        default=0.0, description="Latency of the cached calls when first made"
+    )
+    llm_cache_saved_usd: float = Field(
+        default=0.0, description="Cost of the cached calls when first made"
+    )
+
+    def record_llm_cache(self, stats: LLMCacheStats) -> None:
+        """Record LLM cache activity for the run."""
+        self.cache_hit = stats.cache_hit
+        self.llm_cache_hits = stats.hits
+        self.llm_cache_misses = stats.misses
+        self.llm_cache_saved_seconds = stats.saved_seconds
+        self.llm_cache_saved_usd = stats.saved_usd
+
     def add_event(self, event: Event) -> None:
         """Add an event and update aggregated metrics."""
         self.events.append(event)
-        if event.estimated_cost_usd:
-            self.total_cost_usd += event.estimated_cost_usd
-        if event.token_usage:
+        self.add_usage(event.token_usage, event.estimated_cost_usd)
+
+    def add_usage(self, usage: TokenUsage | None, cost_usd: float = 0.0) -> None:
+        """Add LM usage that isn't attached to an event."""
+        if cost_usd:
+            self.total_cost_usd += cost_usd
+        if usage:
             self.token_usage = TokenUsage(
-                input_tokens=self.token_usage.input_tokens
-                + event.token_usage.input_tokens,
-                output_tokens=self.token_usage.output_tokens
-                + event.token_usage.output_tokens,
-                model=event.token_usage.model or self.token_usage.model,
+                input_tokens=self.token_usage.input_tokens + usage.input_tokens,
+                output_tokens=self.token_usage.output_tokens + usage.output_tokens,
+                model=usage.model or self.token_usage.model,
             )
+
+    def merge(self, other: "AgentResult") -> None:
+        """
+        Fold another result's events and totals into this one.
+
+        The other result's totals already include its events, so they are
+        added once rather than re-counted event by event.
+        """
+        self.events.extend(other.events)
+        self.add_usage(other.token_usage, other.total_cost_usd)
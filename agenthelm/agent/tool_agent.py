@@ -1,3 +1,4 @@
+from contextvars import ContextVar
 from typing import Callable
 
 import dspy
@@ -5,6 +6,15 @@ import dspy
 from agenthelm.agent.result import AgentResult
 from agenthelm import MemoryHub, ExecutionTracer
 from agenthelm.agent.base import BaseAgent
+from agenthelm.agent.llm_cache import LLMCache, track_llm_cache
+from agenthelm.core.cost import BaseCostTracker
+from agenthelm.core.event import Event
+
+# Events of each ToolAgent's current run, keyed by id(agent), per thread and
+# task so concurrent runs (e.g. parallel plan steps) keep their events apart
+_run_events: ContextVar[dict[int, list[Event]]] = ContextVar(
+    "agenthelm_tool_agent_events"
+)
 
 
 class ToolAgent(BaseAgent):
@@ -27,8 +37,10 @@ class ToolAgent(BaseAgent):
         tracer: ExecutionTracer | None = None,
         role: str | None = None,
         max_iters: int = 10,
+        llm_cache: LLMCache | bool | None = None,
+        cost_tracker: BaseCostTracker | None = None,
     ):
-        super().__init__(name, lm, tools, memory, tracer, role)
+        super().__init__(name, lm, tools, memory, tracer, role, llm_cache, cost_tracker)
         self.max_iters = max_iters
 
         # Build signature with optional role context
@@ -42,29 +54,55 @@ class ToolAgent(BaseAgent):
             tools=self._wrap_tools_for_tracing(),
             max_iters=self.max_iters,
         )
-        self._events = []
+
+    @property
+    def _events(self) -> tuple[Event, ...]:
+        """Events traced during the current run (empty outside a run)."""
+        return tuple(_run_events.get({}).get(id(self), ()))
+
+    def _record_event(self, event: Event) -> None:
+        """Add an event to the current run."""
+        events = _run_events.get({}).get(id(self))
+        if events is None:
+            raise RuntimeError(f"{self.name} traced a tool outside run()")
+        events.append(event)
 
     def run(self, task: str) -> AgentResult:
         """Execute the ReAct loop and return results with traced events."""
-        self._events = []  # Reset events for this run
-        result = AgentResult(success=False, session_id=self.name)
+        # Reset events for this run
+        token = _run_events.set({**_run_events.get({}), id(self): []})
         try:
-            with dspy.context(lm=self.lm):
-                if self.role:
-                    react_result = self._react(task=task, role=self.role)
-                else:
-                    react_result = self._react(task=task)
+            result = AgentResult(success=False, session_id=self.name)
+            recorder = self._usage_recorder()
+            try:
+                with (
+                    dspy.context(lm=self._run_lm, usage_tracker=recorder),
+                    recorder,
+                    track_llm_cache() as cache_stats,
+                ):
+                    if self.role:
+                        react_result = self._react(task=task, role=self.role)
+                    else:
+                        react_result = self._react(task=task)
+
+                result.success = True
+                result.answer = react_result.answer
+
+            except Exception as e:
+                result.success = False
+                result.error = str(e)
 
-            result.success = True
-            result.answer = react_result.answer
+            if self.llm_cache is not None:
+                result.record_llm_cache(cache_stats)
 
-        except Exception as e:
-            result.success = False
-            result.error = str(e)
+            # Collect events from tracer if available
+            for event in self._events:
+                result.add_event(event)
+        finally:
+            _run_events.reset(token)
 
-        # Collect events from tracer if available
-        for event in self._events:
-            result.add_event(event)
+        # LM calls not charged to a tool event (e.g. the final answer)
+        result.add_usage(*recorder.take())
 
         return result
 
@@ -76,7 +114,7 @@ class ToolAgent(BaseAgent):
             def traced_tool(*args, _tool=tool, **kwargs):
                 output, event = self._execute_tool(_tool, *args, **kwargs)
                 if event:
-                    self._events.append(event)
+                    self._record_event(event)
                 return output
 
             traced_tool.__name__ = tool.__name__
@@ -632,24 +632,37 @@ def mcp():
 @mcp.command("list-tools")
 @click.argument("command")
 @click.argument("args", nargs=-1)
-def mcp_list_tools(command: str, args: tuple):
+@click.option("--refresh", is_flag=True, help="Ignore cached tool schemas")
+def mcp_list_tools(command: str, args: tuple, refresh: bool):
     """
     List tools from an MCP server.
 
+    Tool schemas are cached under ~/.agenthelm/mcp_cache, so repeat calls
+    don't start the server.
+
     Example: agenthelm mcp list-tools uvx mcp-server-time
     """
     import asyncio
     from agenthelm import MCPClient
+    from agenthelm.mcp import ToolSchemaCache
+
+    server_config = {"command": command, "args": list(args)}
+    cache = ToolSchemaCache()
 
     async def list_tools():
-        async with MCPClient({"command": command, "args": list(args)}) as client:
+        async with MCPClient(server_config) as client:
             with console.status(f"[bold green]Connecting to {command}..."):
                 pass  # Connection happens in __aenter__
             tools = await client.list_tools()
+            cache.put(server_config, tools, client.server_version)
             return tools
 
     try:
-        tools = asyncio.run(list_tools())
+        tools = None if refresh else cache.get(server_config)
+        if tools is None:
+            tools = asyncio.run(list_tools())
+        else:
+            console.print("[dim]Using cached tool schemas (--refresh to update)[/]")
 
         table = Table(title=f"Tools from {command}")
         table.add_column("Name", style="cyan")
@@ -668,33 +681,64 @@ def mcp_list_tools(command: str, args: tuple):
         console.print(f"[red]Error:[/] {e}")
 
 
+@mcp.command("clear-cache")
+def mcp_clear_cache():
+    """Delete cached MCP tool schemas."""
+    from agenthelm.mcp import ToolSchemaCache
+
+    removed = ToolSchemaCache().clear()
+    console.print(f"[green]✓[/] Removed {removed} cached server schema(s)")
+
+
 @mcp.command("run")
-@click.argument("command")
+@click.argument("command", required=False)
 @click.argument("server_args", nargs=-1)
 @click.option("--task", "-t", required=True, help="Task to execute")
 @click.option("--model", "-m", default=None, help="LLM model")
-def mcp_run(command: str, server_args: tuple, task: str, model: str | None):
+def mcp_run(command: str | None, server_args: tuple, task: str, model: str | None):
     """
     Run a task using tools from an MCP server.
 
+    Without COMMAND, uses every server in the mcp_servers config, connected
+    in parallel with tools named server__tool.
+
     Example: agenthelm mcp run uvx mcp-server-time -t "What time is it?"
     """
     import asyncio
     import dspy
     from agenthelm import MCPToolAdapter, ToolAgent
     from agenthelm.cli.config import load_config
+    from agenthelm.mcp import MCPToolMesh
 
     cfg = load_config()
     model = model or cfg.get("default_model", "mistral/mistral-large-latest")
 
+    if command is None and not cfg.get("mcp_servers"):
+        console.print("[red]Error:[/] Give a server COMMAND or configure mcp_servers")
+        return
+
     async def run_with_mcp():
-        adapter = MCPToolAdapter({"command": command, "args": list(server_args)})
+        # Cached schemas let the agent start before the server is up
+        if command is None:
+            source = MCPToolMesh.from_config(cfg, schema_cache=True, lazy=True)
+            label = f"{len(source.adapters)} MCP servers"
+        else:
+            source = MCPToolAdapter(
+                {"command": command, "args": list(server_args)},
+                schema_cache=True,
+                lazy=True,
+            )
+            label = command
+
+        with console.status(f"[bold green]Connecting to {label}..."):
+            await source.connect()
 
-        with console.status(f"[bold green]Connecting to {command}..."):
-            await adapter.connect()
+        if isinstance(source, MCPToolMesh) and source.errors:
+            for name, error in source.errors.items():
+                console.print(f"[yellow]Warning:[/] {name}: {error}")
 
-        tools = adapter.get_tools()
-        console.print(f"[dim]Loaded {len(tools)} tools from MCP server[/]")
+        tools = source.get_tools()
+        console.print(f"[dim]Loaded {len(tools)} tools from {label}[/]")
 
         lm = dspy.LM(model)
         agent = ToolAgent(name="mcp_agent", lm=lm, tools=tools)
@@ -702,7 +746,7 @@ def mcp_run(command: str, server_args: tuple, task: str, model: str | None):
         with console.status("[bold green]Thinking..."):
             result = agent.run(task)
 
-        await adapter.close()
+        await source.close()
         return result
 
     try:
@@ -1,6 +1,8 @@
 """AgentHelm Core - The DNA of the framework."""
 
 from agenthelm.core.tool import tool, TOOL_REGISTRY
+from agenthelm.core.cache import ToolCache
+from agenthelm.core.blobs import BlobStore
 from agenthelm.core.event import Event
 from agenthelm.core.handlers import (
     ApprovalHandler,
@@ -9,6 +11,7 @@ from agenthelm.core.handlers import (
     AutoDenyHandler,
 )
 from agenthelm.core.tracer import ExecutionTracer
+from agenthelm.core.loop import BackgroundLoop
 from agenthelm.core.cost import (
     BaseCostTracker,
     CostTracker,
@@ -16,10 +19,13 @@ from agenthelm.core.cost import (
     get_cost_tracker,
     TokenUsage,
 )
+from agenthelm.core.usage import UsageRecorder
 
 __all__ = [
     "tool",
     "TOOL_REGISTRY",
+    "ToolCache",
+    "BlobStore",
     "Event",
     "TokenUsage",
     "ApprovalHandler",
@@ -27,8 +33,10 @@ __all__ = [
     "AutoApproveHandler",
     "AutoDenyHandler",
     "ExecutionTracer",
+    "BackgroundLoop",
     "BaseCostTracker",
     "CostTracker",
     "TokenOnlyCostTracker",
     "get_cost_tracker",
+    "UsageRecorder",
 ]
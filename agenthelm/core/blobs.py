@@ -0,0 +1,154 @@
+"""BlobStore - Spill large tool outputs to disk and keep a reference."""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+DEFAULT_BLOB_DIR = Path.home() / ".agenthelm" / "blobs"
+
+
+def output_text(value: Any) -> str:
+    """
+    Text form of a tool output, as stored in a blob.
+
+    Strings are kept as-is; MCP content blocks contribute their text; other
+    values are encoded as JSON.
+    """
+    if isinstance(value, str):
+        return value
+    if isinstance(value, list) and value and all(hasattr(v, "type") for v in value):
+        return "\n".join(
+            v.text if getattr(v, "type", None) == "text" else _to_json(v) for v in value
+        )
+    return _to_json(value)
+
+
+def _to_json(value: Any) -> str:
+    """Encode a value as JSON, dumping pydantic models first."""
+    if hasattr(value, "model_dump"):
+        value = value.model_dump(mode="json")
+    return json.dumps(value, default=str)
+
+
+def preview(text: str, limit: int) -> str:
+    """First `limit` characters of text, noting how much was cut."""
+    if len(text) <= limit:
+        return text
+    return f"{text[:limit]}... [{len(text) - limit} more characters]"
+
+
+def is_blob_ref(value: Any) -> bool:
+    """Whether a value is a reference returned by cap_output()."""
+    return isinstance(value, dict) and value.get("truncated") is True
+
+
+class BlobStore:
+    """
+    Content-addressed store for large tool outputs.
+
+    Each blob is a file named by the SHA-256 of its content, so storing the
+    same output twice costs nothing. Tools and traces keep a small reference
+    (id, size, preview) instead of the payload.
+
+    Example:
+        blobs = BlobStore()
+        blob_id = blobs.put(huge_listing)
+        blobs.read_text(blob_id, start=0, length=4096)
+    """
+
+    def __init__(self, root: str | Path | None = None):
+        """
+        Initialize the store.
+
+        Args:
+            root: Directory for blob files (default: ~/.agenthelm/blobs)
+        """
+        self.root = Path(root) if root else DEFAULT_BLOB_DIR
+
+    def path(self, blob_id: str) -> Path:
+        """File holding a blob."""
+        digest = blob_id.removeprefix("sha256:")
+        if not digest.isalnum():
+            raise ValueError(f"Invalid blob id: {blob_id!r}")
+        return self.root / digest
+
+    def put(self, data: str | bytes) -> str:
+        """Store data and return its blob id ("sha256:<hex>")."""
+        if isinstance(data, str):
+            data = data.encode()
+        blob_id = f"sha256:{hashlib.sha256(data).hexdigest()}"
+        path = self.path(blob_id)
+        if not path.exists():
+            self.root.mkdir(parents=True, exist_ok=True)
+            # Write then rename so readers never see a partial blob
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+        return blob_id
+
+    def read(self, blob_id: str) -> bytes:
+        """
+        Return a blob's content.
+
+        Raises:
+            FileNotFoundError: If the blob doesn't exist
+        """
+        return self.path(blob_id).read_bytes()
+
+    def read_text(self, blob_id: str, start: int = 0, length: int | None = None) -> str:
+        """Return a slice of a text blob, by character offset."""
+        text = self.read(blob_id).decode(errors="replace")
+        end = None if length is None else start + length
+        return text[start:end]
+
+    def delete(self, blob_id: str) -> None:
+        """Delete a blob."""
+        self.path(blob_id).unlink(missing_ok=True)
+
+    def clear(self) -> int:
+        """Delete every blob. Returns the number removed."""
+        if not self.root.exists():
+            return 0
+        removed = 0
+        for path in self.root.iterdir():
+            if path.is_file():
+                path.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+
+def cap_output(
+    value: Any,
+    max_bytes: int | None,
+    blob_store: BlobStore | None = None,
+    preview_chars: int = 2000,
+) -> Any:
+    """
+    Replace an output larger than max_bytes with a truncated reference.
+
+    The reference is a dict with "truncated": True, the full "size" in
+    bytes, a "preview" of the text, and, if a blob_store is given, the
+    "blob" id and "path" where the full output was written. Outputs within
+    the cap (or any output when max_bytes is None) are returned unchanged.
+    """
+    if max_bytes is None or is_blob_ref(value):
+        return value
+
+    if isinstance(value, str) and len(value) * 4 <= max_bytes:
+        return value  # Can't exceed the cap even if every char is 4 bytes
+    text = output_text(value)
+    size = len(text.encode())
+    if size <= max_bytes:
+        return value
+
+    ref: dict[str, Any] = {
+        "truncated": True,
+        "size": size,
+        "preview": preview(text, preview_chars),
+    }
+    if blob_store is not None:
+        ref["blob"] = blob_store.put(text)
+        ref["path"] = str(blob_store.path(ref["blob"]))
+    return ref
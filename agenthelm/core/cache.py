@@ -0,0 +1,240 @@
+"""ToolCache - Memoize results of idempotent tools."""
+
+import dataclasses
+import hashlib
+import inspect
+import json
+import math
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+from agenthelm.core.loop import BackgroundLoop
+
+
+def bind_arguments(func: Callable, args: tuple, kwargs: dict) -> dict[str, Any]:
+    """
+    Bind a call's arguments by parameter name, with defaults applied.
+
+    f(1), f(x=1) and f() (with x=1 as default) all bind to {"x": 1}.
+    Extra keyword arguments (**kwargs) are merged into the top level.
+    """
+    bound = inspect.signature(func).bind(*args, **kwargs)
+    bound.apply_defaults()
+    arguments = {}
+    for name, value in bound.arguments.items():
+        kind = bound.signature.parameters[name].kind
+        if kind is inspect.Parameter.VAR_KEYWORD:
+            arguments.update(value)
+        else:
+            arguments[name] = value
+    return arguments
+
+
+def _canonical(value: Any) -> Any:
+    """JSON fallback for argument types json.dumps doesn't handle."""
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=repr)
+    if hasattr(value, "model_dump"):
+        return value.model_dump(mode="json")
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    raise TypeError(f"{type(value).__name__} arguments can't be cached")
+
+
+def canonical_arguments(arguments: dict[str, Any]) -> str | None:
+    """
+    Canonical JSON for a set of arguments, or None if they can't be encoded.
+
+    Keys are sorted, so argument order never changes the result.
+    """
+    try:
+        return json.dumps(
+            arguments, sort_keys=True, separators=(",", ":"), default=_canonical
+        )
+    except (TypeError, ValueError):
+        return None
+
+
+class ToolCache:
+    """
+    TTL + LRU cache for the results of idempotent tools.
+
+    Results are keyed by tool name and the canonical JSON of the call's
+    arguments, so keyword order and omitted defaults don't cause misses.
+    Calls whose arguments can't be encoded as JSON, and calls that raise,
+    are never cached.
+
+    Entries live in process by default. Pass a short-term memory backend
+    as store to share them across processes and sessions (e.g. Redis or
+    SQLite); the backend then handles eviction and maxsize is ignored. The
+    store is driven from a private BackgroundLoop, so give the cache its
+    own backend instance.
+
+    Example:
+        @tool(cache=ToolCache(ttl=600, maxsize=256))
+        def get_timezone(city: str) -> str:
+            ...
+
+        # Shared across sessions
+        cache = ToolCache(ttl=3600, store=SqliteShortTermMemory("cache.db"))
+    """
+
+    def __init__(
+        self,
+        ttl: float = 300.0,
+        maxsize: int = 1024,
+        store: Any | None = None,
+        prefix: str = "toolcache",
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Seconds a result stays valid (0 for no expiration)
+            maxsize: Max entries kept in process before the least recently
+                used is evicted
+            store: Optional BaseShortTermMemory backend for the entries
+            prefix: Key prefix used in the store
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.store = store
+        self.prefix = prefix
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._loop: BackgroundLoop | None = None
+
+    def key(self, tool_name: str, arguments: dict[str, Any]) -> str | None:
+        """Cache key for a call, or None if the arguments can't be cached."""
+        encoded = canonical_arguments(arguments)
+        if encoded is None:
+            return None
+        digest = hashlib.sha256(encoded.encode()).hexdigest()[:32]
+        return f"{self.prefix}:{tool_name}:{digest}"
+
+    def _run(self, coro: Any) -> Any:
+        """Run a store coroutine on the cache's loop."""
+        if self._loop is None:
+            self._loop = BackgroundLoop(name="agenthelm-toolcache")
+        return self._loop.run(coro)
+
+    def get(self, tool_name: str, arguments: dict[str, Any]) -> tuple[bool, Any]:
+        """
+        Look up a cached result.
+
+        Returns:
+            (hit, value) - value is None on a miss
+        """
+        key = self.key(tool_name, arguments)
+        if key is None:
+            return False, None
+
+        if self.store is not None:
+            # Wrapped so a cached None is distinguishable from a miss
+            entry = self._run(self.store.get(key))
+            hit = isinstance(entry, dict) and "value" in entry
+            value = entry["value"] if hit else None
+        else:
+            with self._lock:
+                entry = self._entries.get(key)
+                hit = entry is not None and (not entry[0] or entry[0] > time.time())
+                if hit:
+                    value = entry[1]
+                    self._entries.move_to_end(key)
+                else:
+                    self._entries.pop(key, None)
+                    value = None
+
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return hit, value
+
+    def set(self, tool_name: str, arguments: dict[str, Any], value: Any) -> None:
+        """Store a result. Silently skips arguments that can't be cached."""
+        key = self.key(tool_name, arguments)
+        if key is None:
+            return
+
+        if self.store is not None:
+            ttl = math.ceil(self.ttl) if self.ttl else 0
+            self._run(self.store.set(key, {"value": value}, ttl=ttl))
+            return
+
+        expires = time.time() + self.ttl if self.ttl else 0.0
+        with self._lock:
+            self._entries[key] = (expires, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def call(self, func: Callable, tool_name: str, args: tuple, kwargs: dict) -> Any:
+        """Return the cached result of func(*args, **kwargs), calling it on a miss."""
+        arguments = bind_arguments(func, args, kwargs)
+        hit, value = self.get(tool_name, arguments)
+        if hit:
+            return value
+        value = func(*args, **kwargs)
+        self.set(tool_name, arguments, value)
+        return value
+
+    def invalidate(self, tool_name: str | None = None) -> None:
+        """Drop cached results for one tool, or for every tool."""
+        prefix = f"{self.prefix}:{tool_name}:" if tool_name else f"{self.prefix}:"
+        if self.store is not None:
+            self._run(self.store.delete_prefix(prefix))
+            return
+        with self._lock:
+            for key in [k for k in self._entries if k.startswith(prefix)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop every cached result and reset the hit/miss counters."""
+        self.invalidate()
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Hit and miss counts, hit rate and in-process entry count."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "size": len(self._entries),
+        }
+
+    def close(self) -> None:
+        """Stop the loop used to drive the store."""
+        if self._loop is not None:
+            self._loop.stop()
+
+
+def resolve_cache(cache: "ToolCache | bool | float | None") -> ToolCache | None:
+    """
+    Turn a cache option into a ToolCache.
+
+    True gives a ToolCache with default settings, a number gives one with
+    that TTL in seconds, and None/False disables caching.
+    """
+    if cache is None or cache is False:
+        return None
+    if cache is True:
+        return ToolCache()
+    if isinstance(cache, ToolCache):
+        return cache
+    if isinstance(cache, (int, float)):
+        return ToolCache(ttl=cache)
+    raise TypeError(f"Invalid cache option: {cache!r}")
@@ -15,6 +15,7 @@ class Event(BaseModel):
     error_state: Any error that occurred, or null if it succeeded.
     llm_reasoning_trace: (For now, this can be a placeholder string).
     confidence_score: (For now, this can be a placeholder float, like 1.0).
+    cache_hit: Whether the result was served from the tool's cache.
     """
 
     timestamp: datetime
@@ -31,3 +32,4 @@ class Event(BaseModel):
     agent_name: str | None = None
     session_id: str | None = None
     trace_id: str | None = None  # (OpenTelemetry)
+    cache_hit: bool = False
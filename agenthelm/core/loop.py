@@ -0,0 +1,135 @@
+"""BackgroundLoop - A long-lived event loop thread for calling async code from sync code."""
+
+import asyncio
+import concurrent.futures
+import threading
+from collections.abc import Coroutine
+from typing import Any, Self
+
+
+class BackgroundLoop:
+    """
+    An asyncio event loop running in a dedicated daemon thread.
+
+    Async resources that must stay on one loop (e.g. an MCP session and its
+    stdio transport) live here, and sync code (DSPy tools, worker threads)
+    submits coroutines to it. Many concurrent callers multiplex over the same
+    loop, and callers that already run their own loop don't block it.
+
+    Example:
+        loop = BackgroundLoop()
+        await asyncio.wrap_future(loop.submit(client.connect()))
+
+        # From sync code, in any thread except the loop's own
+        result = loop.run(client.call_tool("now", {}), timeout=30)
+
+        loop.stop()
+    """
+
+    def __init__(self, name: str = "agenthelm-loop"):
+        """
+        Initialize the loop. The thread starts on first use.
+
+        Args:
+            name: Thread name (shows up in debuggers and thread dumps)
+        """
+        self.name = name
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the loop thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> asyncio.AbstractEventLoop:
+        """Start the loop thread if needed and return the loop."""
+        with self._lock:
+            loop = self._loop
+            if loop is None or not self.is_running:
+                ready = threading.Event()
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=self._run_forever,
+                    args=(loop, ready),
+                    name=self.name,
+                    daemon=True,
+                )
+                self._loop, self._thread = loop, thread
+                thread.start()
+                ready.wait()
+            return loop
+
+    def _run_forever(
+        self, loop: asyncio.AbstractEventLoop, ready: threading.Event
+    ) -> None:
+        """Thread body: run the loop until stop()."""
+        asyncio.set_event_loop(loop)
+        loop.call_soon(ready.set)
+        try:
+            loop.run_forever()
+        finally:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+
+    def in_loop_thread(self) -> bool:
+        """Whether the caller is running on the loop's own thread."""
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def submit(self, coro: Coroutine[Any, Any, Any]) -> concurrent.futures.Future:
+        """
+        Schedule a coroutine on the loop from any thread.
+
+        Returns a concurrent.futures.Future; await it from another loop with
+        asyncio.wrap_future().
+        """
+        loop = self.start()
+        return asyncio.run_coroutine_threadsafe(coro, loop)
+
+    def run(self, coro: Coroutine[Any, Any, Any], timeout: float | None = None) -> Any:
+        """
+        Run a coroutine on the loop and block until it finishes.
+
+        Args:
+            coro: Coroutine to run
+            timeout: Seconds to wait (None waits forever). On timeout the
+                coroutine is cancelled and TimeoutError is raised.
+
+        Raises:
+            RuntimeError: If called from the loop's own thread (it would
+                deadlock waiting on itself)
+        """
+        if self.in_loop_thread():
+            coro.close()
+            raise RuntimeError(
+                f"BackgroundLoop.run() called from the '{self.name}' thread; "
+                "await the coroutine instead"
+            )
+
+        future = self.submit(coro)
+        try:
+            return future.result(timeout=timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise TimeoutError(f"Operation timed out after {timeout}s") from None
+
+    def stop(self, timeout: float | None = 5.0) -> None:
+        """Stop the loop and wait for its thread to exit."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            if loop is None or thread is None or not thread.is_alive():
+                return
+            loop.call_soon_threadsafe(loop.stop)
+            if thread is not threading.current_thread():
+                thread.join(timeout)
+            self._thread = None
+
+    def __enter__(self) -> Self:
+        """Context manager entry: start the loop."""
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit: stop the loop."""
+        self.stop()
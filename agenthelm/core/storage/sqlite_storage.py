@@ -30,9 +30,14 @@ class SqliteStorage(BaseStorage):
                 agent_name TEXT,
                 session_id TEXT,
                 trace_id TEXT,
+                cache_hit INTEGER DEFAULT 0,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
         """)
+        # Databases created before a column existed get it added in place
+        columns = {row[1] for row in cursor.execute("PRAGMA table_info(traces)")}
+        if "cache_hit" not in columns:
+            cursor.execute("ALTER TABLE traces ADD COLUMN cache_hit INTEGER DEFAULT 0")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_tool_name ON traces(tool_name)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_timestamp ON traces(timestamp)")
         cursor.execute(
@@ -56,8 +61,8 @@ class SqliteStorage(BaseStorage):
                 timestamp, tool_name, inputs, outputs, execution_time, 
                 error_state, llm_reasoning_trace, confidence_score,
                 token_usage, estimated_cost_usd, retry_count,
-                agent_name, session_id, trace_id
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                agent_name, session_id, trace_id, cache_hit
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         """,
             (
                 event.get("timestamp"),
@@ -76,6 +81,7 @@ class SqliteStorage(BaseStorage):
                 event.get("agent_name"),
                 event.get("session_id"),
                 event.get("trace_id"),
+                int(bool(event.get("cache_hit", False))),
             ),
         )
         conn.commit()
@@ -100,6 +106,7 @@ class SqliteStorage(BaseStorage):
                 item["outputs"] = json.loads(item["outputs"])
             if item.get("token_usage"):
                 item["token_usage"] = json.loads(item["token_usage"])
+            item["cache_hit"] = bool(item.get("cache_hit"))
             results.append(item)
         return results
 
@@ -121,6 +128,9 @@ class SqliteStorage(BaseStorage):
             if "session_id" in filters:
                 query += " AND session_id = ?"
                 params.append(filters["session_id"])
+            if "cache_hit" in filters:
+                query += " AND cache_hit = ?"
+                params.append(int(bool(filters["cache_hit"])))
             if "status" in filters:
                 if filters["status"].lower() == "success":
                     query += " AND error_state IS NULL"
@@ -144,5 +154,6 @@ class SqliteStorage(BaseStorage):
                 item["outputs"] = json.loads(item["outputs"])
             if item.get("token_usage"):
                 item["token_usage"] = json.loads(item["token_usage"])
+            item["cache_hit"] = bool(item.get("cache_hit"))
             results.append(item)
         return results
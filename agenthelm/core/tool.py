@@ -2,6 +2,8 @@ import inspect
 from functools import wraps
 from typing import Any, Callable
 
+from agenthelm.core.cache import ToolCache, resolve_cache
+
 # A central registry for all tools
 TOOL_REGISTRY: dict[str, dict[str, Any]] = {}
 
@@ -16,11 +18,16 @@ def tool(
     compensating_tool: str = None,
     timeout: float = 30.0,
     tags: list[str] = None,
+    cache: ToolCache | bool | float | None = None,
 ):
     """
     A decorator to register a function as a tool in the orchestration framework.
     If 'inputs' or 'outputs' are not provided, they will be inferred from the function's type hints.
+
+    Pass 'cache' for idempotent tools to memoize results by argument: True for
+    a default ToolCache, a number for a TTL in seconds, or a ToolCache instance.
     """
+    tool_cache = resolve_cache(cache)
 
     def tool_decorator(func: Callable) -> Callable:
         """This is the actual decorator that wraps the function and builds the contract."""
@@ -56,6 +63,7 @@ def tool(
             "compensating_tool": compensating_tool,
             "timeout": timeout,
             "tags": tags or [],
+            "cache": tool_cache,
         }
 
         # Register the tool and its contract
@@ -65,6 +73,8 @@ def tool(
         def wrapper(*args, **kwargs):
             # The orchestrator will use the registry to perform checks
             # before this wrapper is ever called.
+            if tool_cache is not None:
+                return tool_cache.call(func, tool_name, args, kwargs)
             return func(*args, **kwargs)
 
         return wrapper
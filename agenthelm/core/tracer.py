@@ -2,13 +2,24 @@ import logging
 import inspect
 import time
 import uuid
+from contextvars import ContextVar
 from datetime import datetime, timezone
 from typing import Callable
 
+from agenthelm.core.blobs import BlobStore, cap_output
+from agenthelm.core.cache import bind_arguments
 from agenthelm.core.event import Event
 from agenthelm.core.handlers import ApprovalHandler, CliHandler
 from agenthelm.core.storage.base import BaseStorage
 from agenthelm.core.tool import TOOL_REGISTRY
+from agenthelm.core.usage import take_usage
+
+# (reasoning, confidence, agent_name) for the next trace of each tracer, keyed
+# by id(tracer), per thread and task so concurrent steps sharing a tracer stay
+# apart
+_trace_contexts: ContextVar[dict[int, tuple[str | None, float, str | None]]] = (
+    ContextVar("agenthelm_trace_contexts")
+)
 
 
 class ExecutionTracer:
@@ -17,15 +28,33 @@ class ExecutionTracer:
         storage: BaseStorage,
         approval_handler: ApprovalHandler | None = None,
         session_id: str | None = None,
+        max_output_bytes: int | None = None,
+        blob_store: BlobStore | None = None,
+        preview_chars: int = 2000,
     ):
+        """
+        Initialize the tracer.
+
+        Args:
+            storage: Where events are saved
+            approval_handler: Asked before running tools that require approval
+            session_id: Session for every event (a new UUID if omitted)
+            max_output_bytes: Outputs larger than this are saved as a
+                preview plus a reference to a blob holding the full output
+                (default None stores every output in full)
+            blob_store: Where capped outputs are written in full (default:
+                a BlobStore in ~/.agenthelm/blobs when max_output_bytes is set)
+            preview_chars: Length of the preview kept in the event
+        """
+        if max_output_bytes is not None and blob_store is None:
+            blob_store = BlobStore()
+
         self.storage = storage
         self.approval_handler = approval_handler or CliHandler()
         self.session_id = session_id or str(uuid.uuid4())
-
-        # Context for next trace
-        self._current_reasoning: str | None = None
-        self._current_confidence: float = 1.0
-        self._current_agent_name: str | None = None
+        self.max_output_bytes = max_output_bytes
+        self.blob_store = blob_store
+        self.preview_chars = preview_chars
 
     def set_trace_context(
         self,
@@ -34,73 +63,99 @@ class ExecutionTracer:
         agent_name: str | None = None,
     ):
         """Sets the LLM reasoning context for the next trace event."""
-        self._current_reasoning = reasoning
-        self._current_confidence = confidence
-        self._current_agent_name = agent_name
+        # Copied, not mutated, so other contexts keep their own entries
+        contexts = dict(_trace_contexts.get({}))
+        contexts[id(self)] = (reasoning, confidence, agent_name)
+        _trace_contexts.set(contexts)
 
     def trace_and_execute(self, tool_func: Callable, *args, **kwargs):
+        tool_name = tool_func.__name__
         pargs = inspect.signature(tool_func).bind(*args, **kwargs).arguments
         timestamp = datetime.now(timezone.utc)
         start_time = time.monotonic()
         output = None
         error_state = None
         retry_count = 0
+        cache_hit = False
         trace_id = str(uuid.uuid4())  # Unique ID for this execution
 
         try:
-            contract = TOOL_REGISTRY.get(tool_func.__name__, {}).get("contract", {})
+            contract = TOOL_REGISTRY.get(tool_name, {}).get("contract", {})
             requires_approval = contract.get("requires_approval", False)
             if requires_approval:
-                user_approval = self.approval_handler.request_approval(
-                    tool_func.__name__, pargs
-                )
+                user_approval = self.approval_handler.request_approval(tool_name, pargs)
                 if not user_approval:
                     raise PermissionError("User did not approve execution.")
 
-            retries = contract.get("retries", 0)
-            for attempt in range(retries + 1):
+            # Cached tools are looked up here rather than in their wrapper,
+            # so the event can record the hit
+            cache = contract.get("cache")
+            execute = tool_func
+            if cache is not None:
+                arguments = bind_arguments(tool_func, args, kwargs)
+                cache_hit, output = cache.get(tool_name, arguments)
+                execute = getattr(tool_func, "__wrapped__", tool_func)
+
+            attempts = 0 if cache_hit else contract.get("retries", 0) + 1
+            for attempt in range(attempts):
                 try:
-                    output = tool_func(*args, **kwargs)
+                    output = execute(*args, **kwargs)
                     error_state = None  # Reset error state on success
                     break  # If successful, exit the loop
                 except Exception as e:
                     error_state = str(e)
                     retry_count = attempt + 1
                     logging.warning(
-                        f"Attempt {attempt + 1}/{retries + 1} failed: {error_state}"
+                        f"Attempt {attempt + 1}/{attempts} failed: {error_state}"
                     )
-                    if attempt < retries:
+                    if attempt < attempts - 1:
                         time.sleep(1)  # Wait 1 second before the next attempt
 
             if error_state:
                 raise RuntimeError(error_state)
+            if cache is not None and not cache_hit:
+                cache.set(tool_name, arguments, output)
 
         except Exception as e:
             error_state = str(e)
 
         execution_time = time.monotonic() - start_time
-        outputs_dict = {"result": output} if error_state is None else {}
+        outputs_dict = {}
+        if error_state is None:
+            # The caller gets the full output; the trace keeps a bounded copy
+            outputs_dict["result"] = cap_output(
+                output, self.max_output_bytes, self.blob_store, self.preview_chars
+            )
+
+        # LM calls since the previous event are the ones that led to this tool
+        token_usage, cost = take_usage()
+        contexts = _trace_contexts.get({})
+        reasoning, confidence, agent_name = contexts.get(id(self), (None, 1.0, None))
 
         event = Event(
             timestamp=timestamp,
-            tool_name=tool_func.__name__,
+            tool_name=tool_name,
             inputs=pargs,
             outputs=outputs_dict,
             execution_time=execution_time,
             error_state=error_state,
-            llm_reasoning_trace=self._current_reasoning or "",
-            confidence_score=self._current_confidence,
+            llm_reasoning_trace=reasoning or "",
+            confidence_score=confidence,
             # New v0.3.0 fields
             retry_count=retry_count,
-            agent_name=self._current_agent_name,
+            agent_name=agent_name,
             session_id=self.session_id,
             trace_id=trace_id,
+            cache_hit=cache_hit,
+            token_usage=token_usage,
+            estimated_cost_usd=cost,
         )
 
         # Clear the context for the next run
-        self._current_reasoning = None
-        self._current_confidence = 1.0
-        self._current_agent_name = None
+        if id(self) in contexts:
+            _trace_contexts.set(
+                {key: value for key, value in contexts.items() if key != id(self)}
+            )
 
         self.storage.save(event.model_dump())
 
@@ -0,0 +1,114 @@
+"""UsageRecorder - Collect and price LM token usage during an agent run."""
+
+import threading
+from contextvars import ContextVar
+from typing import Any, Self
+
+from agenthelm.core.cost import BaseCostTracker, TokenUsage
+
+
+def token_usage(model: str | None, usage: dict[str, Any]) -> TokenUsage:
+    """Build a TokenUsage from a provider usage dict (OpenAI or Anthropic keys)."""
+    input_tokens = usage.get("prompt_tokens", usage.get("input_tokens")) or 0
+    output_tokens = usage.get("completion_tokens", usage.get("output_tokens")) or 0
+    return TokenUsage(
+        input_tokens=int(input_tokens), output_tokens=int(output_tokens), model=model
+    )
+
+
+class UsageRecorder:
+    """
+    Collects the token usage of LM calls and prices it with a cost tracker.
+
+    The recorder has the interface of DSPy's usage tracker, so installing it
+    with dspy.context(usage_tracker=recorder) receives every billed call
+    (DSPy skips cache hits). Each call is priced once, when it is recorded,
+    and held as pending until take() hands it out. ExecutionTracer takes the
+    pending usage of the recorder active in the current context and charges
+    it to the tool event it is creating, i.e. to the LM calls that chose
+    that tool. The agent takes whatever remains at the end of the run.
+
+    Example:
+        recorder = UsageRecorder(CostTracker())
+        with dspy.context(usage_tracker=recorder), recorder:
+            program(question="...")
+        usage, cost = recorder.take()
+    """
+
+    def __init__(self, cost_tracker: BaseCostTracker, parent: Any | None = None):
+        """
+        Initialize the recorder.
+
+        Args:
+            cost_tracker: Prices each call and keeps running totals
+            parent: Usage tracker that was active before this one (e.g. from
+                dspy.track_usage()); calls are forwarded to it
+        """
+        self.cost_tracker = cost_tracker
+        self.parent = parent
+        self._input_tokens = 0
+        self._output_tokens = 0
+        self._cost = 0.0
+        self._model: str | None = None
+        self._lock = threading.Lock()
+        self._token = None
+
+    def add_usage(self, lm: str, usage_entry: dict[str, Any]) -> None:
+        """Record one LM call (DSPy usage tracker interface)."""
+        if self.parent is not None:
+            self.parent.add_usage(lm, usage_entry)
+
+        usage = token_usage(lm, usage_entry)
+        if not usage.total_tokens:
+            return
+        cost = self.cost_tracker.track(usage)
+        with self._lock:
+            self._input_tokens += usage.input_tokens
+            self._output_tokens += usage.output_tokens
+            self._cost += cost
+            self._model = lm
+
+    def take(self) -> tuple[TokenUsage | None, float]:
+        """
+        Return the pending usage and its cost, and clear them.
+
+        Returns:
+            (usage, cost_usd) - usage is None if nothing is pending
+        """
+        with self._lock:
+            if not (self._input_tokens or self._output_tokens):
+                return None, 0.0
+            usage = TokenUsage(
+                input_tokens=self._input_tokens,
+                output_tokens=self._output_tokens,
+                model=self._model,
+            )
+            cost = self._cost
+            self._input_tokens = 0
+            self._output_tokens = 0
+            self._cost = 0.0
+        return usage, cost
+
+    def __enter__(self) -> Self:
+        """Make this the recorder tool events are charged to."""
+        self._token = _current.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Restore the previous recorder."""
+        if self._token is not None:
+            _current.reset(self._token)
+            self._token = None
+
+
+_current: ContextVar[UsageRecorder | None] = ContextVar(
+    "agenthelm_usage_recorder", default=None
+)
+
+
+def take_usage() -> tuple[TokenUsage | None, float]:
+    """Take the pending usage of the active recorder, if any."""
+    recorder = _current.get()
+    if recorder is None:
+        return None, 0.0
+    return recorder.take()
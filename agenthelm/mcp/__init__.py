@@ -16,8 +16,14 @@ Example:
 
 from agenthelm.mcp.client import MCPClient
 from agenthelm.mcp.adapter import MCPToolAdapter
+from agenthelm.mcp.mesh import MCPToolMesh
+from agenthelm.mcp.pool import MCPClientPool
+from agenthelm.mcp.schema_cache import ToolSchemaCache
 
 __all__ = [
     "MCPClient",
+    "MCPClientPool",
     "MCPToolAdapter",
+    "MCPToolMesh",
+    "ToolSchemaCache",
 ]
@@ -1,35 +1,287 @@
 """MCPToolAdapter - Wrap MCP server tools as AgentHelm tools."""
 
 import asyncio
+import inspect
+from functools import wraps
 from typing import Callable, Any
 
 from agenthelm import TOOL_REGISTRY
-from agenthelm.mcp.client import MCPClient
+from agenthelm.core.blobs import BlobStore, cap_output
+from agenthelm.core.cache import ToolCache, resolve_cache
+from agenthelm.core.loop import BackgroundLoop
+from agenthelm.mcp.client import MCPClient, gather_calls
+from agenthelm.mcp.pool import MCPClientPool
+from agenthelm.mcp.schema_cache import ToolSchemaCache
+
+# Joins a namespace and a server tool name: "{namespace}__{tool}"
+NAMESPACE_SEPARATOR = "__"
 
 
 class MCPToolAdapter:
     """
     Wraps MCP server tools as AgentHelm-compatible callables.
 
+    The MCP session lives on a BackgroundLoop thread owned by the adapter
+    (or shared via the loop argument). The sync tool wrappers submit calls to
+    that loop and wait with a timeout, so they work from plain threads and
+    from code that already runs an event loop, and concurrent DSPy tool calls
+    multiplex over a single session.
+
+    With a schema cache, tool schemas discovered on an earlier run are
+    reused; with lazy=True as well, connect() returns the cached tools
+    without starting the server, which is spawned on the first tool call.
+
     Example:
         adapter = MCPToolAdapter({"command": "uvx", "args": ["mcp-server-time"]})
         await adapter.connect()
         tools = adapter.get_tools()
+
+        # Reuse cached schemas and start the server on first use
+        adapter = MCPToolAdapter(config, schema_cache=True, lazy=True)
+
+        # Memoize idempotent lookups for 10 minutes
+        adapter = MCPToolAdapter(config, cache={"get_current_time": 600})
+
+        # Spill outputs over 256 KiB to ~/.agenthelm/blobs, watch progress
+        adapter = MCPToolAdapter(
+            config,
+            max_output_bytes=256 * 1024,
+            on_progress=lambda tool, done, total, msg: print(tool, done, total),
+        )
     """
 
     def __init__(
         self,
         server_config: dict,
         compensations: dict[str, str] | None = None,
+        timeout: float | None = 30.0,
+        loop: BackgroundLoop | None = None,
+        pool_size: int = 1,
+        pool_spares: int = 0,
+        schema_cache: ToolSchemaCache | bool = False,
+        lazy: bool = False,
+        namespace: str | None = None,
+        cache: ToolCache | bool | float | dict | None = None,
+        max_output_bytes: int | None = None,
+        blob_store: BlobStore | None = None,
+        preview_chars: int = 2000,
+        on_progress: Callable[..., Any] | None = None,
     ):
-        self._client = MCPClient(server_config)
+        """
+        Initialize the adapter.
+
+        Args:
+            server_config: MCP server config ('command', 'args', 'env')
+            compensations: Map of tool name to its compensating tool
+            timeout: Seconds a tool call may take before TimeoutError
+                (None waits forever)
+            loop: BackgroundLoop to host the session (a private one is
+                created and stopped on close() if omitted)
+            pool_size: Server processes to spread calls over; above 1 (or
+                with spares) an MCPClientPool replaces the single client
+            pool_spares: Warm standby processes for the pool
+            schema_cache: ToolSchemaCache to reuse tool schemas across runs
+                (True for the default ~/.agenthelm/mcp_cache)
+            lazy: On a cache hit, defer starting the server to the first call
+            namespace: Prefix for registered tool names ("{namespace}__{tool}"),
+                so tools from different servers don't collide
+            cache: Result cache for idempotent tools, as for @tool(cache=...)
+                (applies to every tool), or a map of tool name to cache option
+                to cache only those tools
+            max_output_bytes: Outputs larger than this are written to the
+                blob store, and the tool returns a reference with a preview
+                instead (None returns every output in full)
+            blob_store: Where large outputs are written (default:
+                ~/.agenthelm/blobs)
+            preview_chars: Length of the preview in a large-output reference
+            on_progress: Called with (tool, progress, total, message) for
+                progress notifications from the server, on the background
+                loop thread (may be a coroutine function)
+        """
+        if pool_size > 1 or pool_spares > 0:
+            self._client = MCPClientPool(
+                server_config, size=pool_size, spares=pool_spares
+            )
+        else:
+            self._client = MCPClient(server_config)
+        self._client.on_tools_changed(self._on_tools_changed)
+        self._server_config = server_config
         self._tools: list[dict] = []
         self._compensations = compensations or {}
+        self.timeout = timeout
+        self.lazy = lazy
+        self.namespace = namespace
+        if isinstance(cache, dict):
+            self._caches = {name: resolve_cache(c) for name, c in cache.items()}
+            self._default_cache = None
+        else:
+            self._caches = {}
+            self._default_cache = resolve_cache(cache)
+        self.max_output_bytes = max_output_bytes
+        if max_output_bytes is not None and blob_store is None:
+            blob_store = BlobStore()
+        self._blob_store = blob_store
+        self.preview_chars = preview_chars
+        self.on_progress = on_progress
+        if schema_cache is True:
+            schema_cache = ToolSchemaCache()
+        self._schema_cache: ToolSchemaCache | None = schema_cache or None
+        self._connect_lock: asyncio.Lock | None = None
+        self._refresh_task: asyncio.Task | None = None
+        self._owns_loop = loop is None
+        self._loop = loop or BackgroundLoop(name="agenthelm-mcp")
+
+    async def _on_loop(self, coro: Any) -> Any:
+        """Run a coroutine on the background loop and await its result."""
+        if self._loop.in_loop_thread():
+            return await coro
+        return await asyncio.wrap_future(self._loop.submit(coro))
+
+    async def _ensure_connected(self) -> None:
+        """Connect the client once (runs on the background loop)."""
+        if self._client.connected:
+            return
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+        async with self._connect_lock:
+            if not self._client.connected:
+                await self._client.connect()
 
     async def connect(self):
-        """Connect and discover tools."""
-        await self._client.connect()
-        self._tools = await self._client.list_tools()
+        """Connect and discover tools, using the schema cache if enabled."""
+        entry = None
+        if self._schema_cache is not None:
+            entry = self._schema_cache.get_entry(self._server_config)
+        if entry is not None and self.lazy:
+            self._tools = entry["tools"]
+            return
+
+        await self._on_loop(self._ensure_connected())
+        if entry is not None and entry["server_version"] == self._client.server_version:
+            self._tools = entry["tools"]
+        else:
+            await self.refresh_tools()
+
+    async def refresh_tools(self) -> list[dict]:
+        """Re-discover tools from the server and update the schema cache."""
+        await self._on_loop(self._ensure_connected())
+        self._tools = await self._on_loop(self._client.list_tools())
+        if self._schema_cache is not None:
+            self._schema_cache.put(
+                self._server_config, self._tools, self._client.server_version
+            )
+        return self._tools
+
+    def _on_tools_changed(self) -> None:
+        """Drop cached schemas and re-list tools after list_changed."""
+        if self._schema_cache is not None:
+            self._schema_cache.invalidate(self._server_config)
+        # Called from the session's receive loop; don't block it
+        self._refresh_task = asyncio.get_running_loop().create_task(
+            self.refresh_tools()
+        )
+
+    async def _call(
+        self,
+        name: str,
+        arguments: dict,
+        on_progress: Callable[..., Any] | None = None,
+    ) -> Any:
+        """Connect if needed, then call a tool (runs on the background loop)."""
+        await self._ensure_connected()
+
+        on_progress = on_progress or self.on_progress
+        if on_progress is None:
+            content = await self._client.call_tool(name, arguments)
+        else:
+            tool_name = self.qualified_name(name)
+
+            async def relay(
+                progress: float, total: float | None, message: str | None
+            ) -> None:
+                result = on_progress(tool_name, progress, total, message)
+                if inspect.isawaitable(result):
+                    await result
+
+            content = await self._client.call_tool(name, arguments, on_progress=relay)
+
+        # Spill before the payload leaves the loop, so only the reference is kept
+        return cap_output(
+            content, self.max_output_bytes, self._blob_store, self.preview_chars
+        )
+
+    def call_tool(
+        self,
+        name: str,
+        arguments: dict,
+        on_progress: Callable[..., Any] | None = None,
+    ) -> Any:
+        """
+        Call an MCP tool from sync code and wait for the result.
+
+        With lazy=True the first call also starts the server, within the
+        same timeout. Outputs over max_output_bytes come back as a reference
+        dict ("truncated", "size", "preview", "blob", "path").
+
+        Args:
+            name: Tool name on the server
+            arguments: Tool arguments
+            on_progress: Progress callback for this call (overrides the
+                adapter's on_progress)
+
+        Raises:
+            TimeoutError: If the call takes longer than the adapter timeout
+        """
+        return self._loop.run(
+            self._call(name, arguments, on_progress), timeout=self.timeout
+        )
+
+    async def _call_with_timeout(
+        self, name: str, arguments: dict, timeout: float | None
+    ) -> Any:
+        """Call a tool, bounding only this call by timeout."""
+        return await asyncio.wait_for(self._call(name, arguments), timeout)
+
+    def call_many(
+        self,
+        calls: list[tuple[str, dict]],
+        concurrency: int = 8,
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        """
+        Call several MCP tools concurrently from sync code.
+
+        Up to `concurrency` requests are pipelined over the session (or
+        spread over the pool), and each call gets the adapter timeout.
+        Results are capped by max_output_bytes like call_tool().
+
+        Args:
+            calls: (tool name, arguments) pairs, using server tool names
+            concurrency: Max requests in flight at once
+            return_exceptions: Return errors in place of results instead of
+                raising the first one
+
+        Returns:
+            Results in the order of calls
+
+        Raises:
+            TimeoutError: If a call takes longer than the adapter timeout
+        """
+        return self._loop.run(
+            gather_calls(
+                self._call_with_timeout,
+                calls,
+                concurrency,
+                self.timeout,
+                return_exceptions,
+            )
+        )
+
+    def qualified_name(self, name: str) -> str:
+        """Registered name for a server tool name."""
+        if not self.namespace:
+            return name
+        return f"{self.namespace}{NAMESPACE_SEPARATOR}{name}"
 
     def get_tools(self) -> list[Callable]:
         """
@@ -46,39 +298,47 @@ class MCPToolAdapter:
             def make_tool_func(tool_name: str):
                 def tool_func(**kwargs) -> Any:
                     """Sync wrapper for async MCP call."""
-                    # Bridge async -> sync for DSPy compatibility
-                    loop = asyncio.get_event_loop()
-                    if loop.is_running():
-                        # If already in async context, use run_coroutine_threadsafe
-
-                        future = asyncio.run_coroutine_threadsafe(
-                            self._client.call_tool(tool_name, kwargs), loop
-                        )
-                        return future.result(timeout=30)
-                    else:
-                        return asyncio.run(self._client.call_tool(tool_name, kwargs))
+                    return self.call_tool(tool_name, kwargs)
 
                 return tool_func
 
+            qualified = self.qualified_name(name)
             func = make_tool_func(name)
-            func.__name__ = name
+            func.__name__ = qualified
             func.__doc__ = description
 
+            cache = self._caches.get(name, self._default_cache)
+            if cache is not None:
+                func = self._cached(func, qualified, cache)
+
             # Register in TOOL_REGISTRY with compensation
             compensate = self._compensations.get(name)
-            TOOL_REGISTRY[name] = {
+            if compensate:
+                compensate = self.qualified_name(compensate)
+            TOOL_REGISTRY[qualified] = {
                 "function": func,
                 "contract": {
                     "inputs": self._extract_input_schema(tool_info),
                     "outputs": {"result": "Any"},
                     "compensating_tool": compensate,
                     "tags": ["mcp"],
+                    "cache": cache,
                 },
             }
 
             callables.append(func)
         return callables
 
+    @staticmethod
+    def _cached(func: Callable, name: str, cache: ToolCache) -> Callable:
+        """Wrap a tool function to serve repeat calls from cache under name."""
+
+        @wraps(func)
+        def cached_func(**kwargs) -> Any:
+            return cache.call(func, name, (), kwargs)
+
+        return cached_func
+
     def _extract_input_schema(self, tool_info: dict) -> dict:
         """Extract input parameters from MCP tool schema."""
         input_schema = tool_info.get("inputSchema", {})
@@ -86,4 +346,8 @@ class MCPToolAdapter:
         return {k: v.get("type", "string") for k, v in properties.items()}
 
     async def close(self):
-        await self._client.close()
+        """Close the MCP session and stop the adapter's own loop."""
+        if self._loop.is_running:
+            await self._on_loop(self._client.close())
+        if self._owns_loop:
+            self._loop.stop()
@@ -1,15 +1,60 @@
 """MCPClient - Low-level MCP protocol client."""
 
+import asyncio
+import logging
 import os
-from typing import Any
+from collections.abc import Awaitable, Callable
+from contextlib import AsyncExitStack
+from typing import Any, Protocol
 
-from mcp import StdioServerParameters, stdio_client, ClientSession
+from mcp import ClientSession, StdioServerParameters, stdio_client, types
+
+logger = logging.getLogger(__name__)
+
+
+class ProgressCallback(Protocol):
+    """Awaited with (progress, total, message) for each progress notification."""
+
+    async def __call__(
+        self, progress: float, total: float | None, message: str | None
+    ) -> None: ...
+
+
+async def gather_calls(
+    call_tool: Callable[..., Awaitable[Any]],
+    calls: list[tuple[str, dict]],
+    concurrency: int,
+    timeout: float | None = None,
+    return_exceptions: bool = False,
+) -> list[Any]:
+    """
+    Run (name, arguments) calls with at most `concurrency` in flight.
+
+    Results are returned in the order of calls.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(name: str, arguments: dict) -> Any:
+        async with semaphore:
+            return await call_tool(name, arguments, timeout)
+
+    return await asyncio.gather(
+        *(run(name, arguments) for name, arguments in calls),
+        return_exceptions=return_exceptions,
+    )
 
 
 class MCPClient:
     """
     Low-level MCP protocol client.
 
+    The stdio transport and session are entered and exited by a single
+    lifetime task on the loop that called connect(), as their task groups
+    require. Use the client from that loop only; MCPToolAdapter keeps it on a
+    dedicated BackgroundLoop so sync code can call tools safely.
+
     Note: On Windows, MCP stdio transport may have issues with subprocess
     buffering and pipe handling. Using PYTHONUNBUFFERED=1 can help.
     """
@@ -24,55 +69,164 @@ class MCPClient:
         """
         self.server_config = server_config
         self._session: ClientSession | None = None
-        self._context = None
-        self._read = None
-        self._write = None
+        self._lifetime: asyncio.Task | None = None
+        self._closing: asyncio.Event | None = None
+        self._tools_changed_callbacks: list[Callable[[], Any]] = []
+        self.server_version: str | None = None
 
-    async def connect(self):
-        """Connect to the MCP server."""
+    @property
+    def connected(self) -> bool:
+        """Whether a session is open."""
+        return self._session is not None
+
+    def on_tools_changed(self, callback: Callable[[], Any]) -> None:
+        """Register a callback for notifications/tools/list_changed."""
+        self._tools_changed_callbacks.append(callback)
+
+    async def _on_message(self, message: Any) -> None:
+        """Handle server notifications delivered to the session."""
+        # mcp 1.x wraps notifications in ServerNotification(root=...)
+        notification = getattr(message, "root", message)
+        if isinstance(notification, types.ToolListChangedNotification):
+            for callback in self._tools_changed_callbacks:
+                callback()
+
+    def _server_params(self) -> StdioServerParameters:
+        """Build stdio parameters from the server config."""
         # Build environment with unbuffered Python (helps on Windows)
         env = os.environ.copy()
         env["PYTHONUNBUFFERED"] = "1"
         if self.server_config.get("env"):
             env.update(self.server_config["env"])
 
-        params = StdioServerParameters(
+        return StdioServerParameters(
             command=self.server_config["command"],
             args=self.server_config.get("args", []),
             env=env,
         )
 
-        # Store the context manager to properly close it later
-        self._context = stdio_client(params)
-        self._read, self._write = await self._context.__aenter__()
-        self._session = ClientSession(self._read, self._write)
-        await self._session.initialize()
+    async def connect(self):
+        """Connect to the MCP server."""
+        if self._lifetime is not None and not self._lifetime.done():
+            return
 
-    async def list_tools(self) -> list[dict]:
-        """List available tools from the MCP server."""
+        ready: asyncio.Future = asyncio.get_running_loop().create_future()
+        closing = self._closing = asyncio.Event()
+        self._lifetime = asyncio.create_task(self._run_session(ready, closing))
+        try:
+            await ready
+        except BaseException:
+            self._lifetime.cancel()
+            self._lifetime = None
+            raise
+
+    async def _run_session(self, ready: asyncio.Future, closing: asyncio.Event) -> None:
+        """Own the transport and session from connect() until close()."""
+        try:
+            async with AsyncExitStack() as stack:
+                read, write = await stack.enter_async_context(
+                    stdio_client(self._server_params())
+                )
+                session = await stack.enter_async_context(
+                    ClientSession(read, write, message_handler=self._on_message)
+                )
+                result = await session.initialize()
+                info = getattr(result, "server_info", None) or getattr(
+                    result, "serverInfo", None
+                )
+                self.server_version = getattr(info, "version", None)
+
+                self._session = session
+                ready.set_result(None)
+                await closing.wait()
+        except asyncio.CancelledError:
+            if not ready.done():
+                ready.cancel()
+            raise
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                command = self.server_config.get("command")
+                logger.warning(f"MCP session for '{command}' ended: {e}", exc_info=True)
+        finally:
+            self._session = None
+
+    def _require_session(self) -> ClientSession:
+        """Return the open session or raise."""
         if not self._session:
             raise RuntimeError("Not connected. Call connect() first.")
-        result = await self._session.list_tools()
+        return self._session
+
+    async def list_tools(self) -> list[dict]:
+        """List available tools from the MCP server."""
+        result = await self._require_session().list_tools()
         return [tool.model_dump() for tool in result.tools]
 
-    async def call_tool(self, name: str, arguments: dict) -> Any:
-        """Call a tool on the MCP server."""
-        if not self._session:
-            raise RuntimeError("Not connected. Call connect() first.")
-        result = await self._session.call_tool(name, arguments)
+    async def call_tool(
+        self,
+        name: str,
+        arguments: dict,
+        timeout: float | None = None,
+        on_progress: ProgressCallback | None = None,
+    ) -> Any:
+        """
+        Call a tool on the MCP server.
+
+        Args:
+            name: Tool name
+            arguments: Tool arguments
+            timeout: Seconds to wait for the result (None waits forever)
+            on_progress: Awaited with (progress, total, message) for each
+                notifications/progress the server sends for this call
+        """
+        session = self._require_session()
+        call = session.call_tool(name, arguments, progress_callback=on_progress)
+        result = await asyncio.wait_for(call, timeout)
         return result.content
 
+    async def call_many(
+        self,
+        calls: list[tuple[str, dict]],
+        concurrency: int = 8,
+        timeout: float | None = None,
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        """
+        Call several tools concurrently over this session.
+
+        MCP matches responses to requests by id, so up to `concurrency`
+        requests are pipelined on the one connection instead of waiting for
+        each response in turn.
+
+        Args:
+            calls: (tool name, arguments) pairs
+            concurrency: Max requests in flight at once
+            timeout: Seconds each call may take
+            return_exceptions: Return errors in place of results instead of
+                raising the first one
+
+        Returns:
+            Results in the order of calls
+        """
+        return await gather_calls(
+            self.call_tool, calls, concurrency, timeout, return_exceptions
+        )
+
+    async def ping(self, timeout: float | None = None) -> None:
+        """Ping the server; raises if it doesn't answer within timeout."""
+        await asyncio.wait_for(self._require_session().send_ping(), timeout)
+
     async def close(self):
         """Close the connection and clean up resources."""
-        self._session = None
-        if self._context:
-            try:
-                await self._context.__aexit__(None, None, None)
-            except Exception:
-                pass  # Ignore cleanup errors
-            self._context = None
-        self._read = None
-        self._write = None
+        lifetime, self._lifetime = self._lifetime, None
+        if lifetime is None or self._closing is None:
+            return
+        self._closing.set()
+        try:
+            await lifetime
+        except Exception:
+            pass  # Ignore cleanup errors
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -0,0 +1,235 @@
+"""MCPToolMesh - Tools from several MCP servers behind one namespace."""
+
+import asyncio
+import logging
+import re
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from agenthelm.core.blobs import BlobStore
+from agenthelm.core.loop import BackgroundLoop
+from agenthelm.mcp.adapter import NAMESPACE_SEPARATOR, MCPToolAdapter
+from agenthelm.mcp.client import gather_calls
+from agenthelm.mcp.schema_cache import ToolSchemaCache
+
+logger = logging.getLogger(__name__)
+
+# Server config keys consumed by the mesh rather than passed to the server
+_ADAPTER_KEYS = ("name", "compensations", "pool_size", "pool_spares", "cache")
+
+
+def server_name(server: dict) -> str:
+    """
+    Namespace for a server: its "name", or derived from command/args.
+
+    Names are reduced to [A-Za-z0-9_] with no double underscores, so the
+    "{server}__{tool}" separator stays unambiguous.
+    """
+    name = server.get("name")
+    if not name:
+        args = [a for a in server.get("args", []) if not a.startswith("-")]
+        name = Path(args[-1] if args else server["command"]).stem
+    name = re.sub(r"[^A-Za-z0-9_]", "_", name)
+    return re.sub(r"_{2,}", "_", name).strip("_") or "server"
+
+
+class MCPToolMesh:
+    """
+    Connects to many MCP servers at once and exposes all their tools.
+
+    Servers are connected concurrently, so startup takes as long as the
+    slowest server rather than the sum. Tools are registered as
+    "{server}__{tool}" to avoid TOOL_REGISTRY collisions, and calls are
+    routed back to the owning server. All sessions share one
+    BackgroundLoop thread.
+
+    A server that fails to connect is logged and skipped (see errors)
+    unless strict=True.
+
+    Example:
+        mesh = MCPToolMesh([
+            {"name": "time", "command": "uvx", "args": ["mcp-server-time"]},
+            {"name": "fs", "command": "npx", "args": ["-y", "server-filesystem", "."]},
+        ])
+        await mesh.connect()
+        agent = ToolAgent(name="mesh_agent", lm=lm, tools=mesh.get_tools())
+
+        # From the CLI config (mcp_servers in ~/.agenthelm/config.yaml)
+        mesh = MCPToolMesh.from_config(load_config())
+    """
+
+    def __init__(
+        self,
+        servers: list[dict],
+        timeout: float | None = 30.0,
+        schema_cache: ToolSchemaCache | bool = False,
+        lazy: bool = False,
+        strict: bool = False,
+        max_output_bytes: int | None = None,
+        blob_store: BlobStore | None = None,
+        on_progress: Callable[..., Any] | None = None,
+    ):
+        """
+        Initialize the mesh.
+
+        Args:
+            servers: Server configs ('command', 'args', 'env', optional
+                'name', 'version', 'compensations', 'pool_size',
+                'pool_spares', 'cache')
+            timeout: Seconds a tool call may take before TimeoutError
+            schema_cache: Tool schema cache shared by all servers (True for
+                the default ~/.agenthelm/mcp_cache)
+            lazy: On a cache hit, defer starting each server to its first call
+            strict: Raise if any server fails to connect
+            max_output_bytes: Spill outputs larger than this to the blob
+                store and return a reference instead
+            blob_store: Blob store shared by all servers (default:
+                ~/.agenthelm/blobs)
+            on_progress: Called with (tool, progress, total, message) for
+                server progress notifications
+        """
+        if schema_cache is True:
+            schema_cache = ToolSchemaCache()
+        if max_output_bytes is not None and blob_store is None:
+            blob_store = BlobStore()
+
+        self.strict = strict
+        self._timeout = timeout
+        self.errors: dict[str, BaseException] = {}
+        self._loop = BackgroundLoop(name="agenthelm-mcp")
+        self.adapters: dict[str, MCPToolAdapter] = {}
+
+        for server in servers:
+            name = server_name(server)
+            if name in self.adapters:
+                suffix = 2
+                while f"{name}_{suffix}" in self.adapters:
+                    suffix += 1
+                name = f"{name}_{suffix}"
+
+            config = {k: v for k, v in server.items() if k not in _ADAPTER_KEYS}
+            self.adapters[name] = MCPToolAdapter(
+                config,
+                compensations=server.get("compensations"),
+                timeout=timeout,
+                loop=self._loop,
+                pool_size=server.get("pool_size", 1),
+                pool_spares=server.get("pool_spares", 0),
+                schema_cache=schema_cache or False,
+                lazy=lazy,
+                namespace=name,
+                cache=server.get("cache"),
+                max_output_bytes=max_output_bytes,
+                blob_store=blob_store,
+                on_progress=on_progress,
+            )
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any], **kwargs: Any) -> "MCPToolMesh":
+        """Build a mesh from the mcp_servers list of an AgentHelm config."""
+        return cls(config.get("mcp_servers") or [], **kwargs)
+
+    @property
+    def servers(self) -> list[str]:
+        """Names of the servers that connected."""
+        return [name for name in self.adapters if name not in self.errors]
+
+    async def connect(self):
+        """Connect to every server concurrently and discover their tools."""
+        names = list(self.adapters)
+        results = await asyncio.gather(
+            *(self.adapters[name].connect() for name in names),
+            return_exceptions=True,
+        )
+
+        self.errors = {
+            name: result
+            for name, result in zip(names, results)
+            if isinstance(result, BaseException)
+        }
+        for name, error in self.errors.items():
+            logger.warning(f"MCP server '{name}' failed to connect: {error}")
+
+        if self.errors and (self.strict or len(self.errors) == len(names)):
+            await self.close()
+            raise next(iter(self.errors.values()))
+
+    def get_tools(self) -> list[Callable]:
+        """Return namespaced tools from every connected server."""
+        tools = []
+        for name in self.servers:
+            tools.extend(self.adapters[name].get_tools())
+        return tools
+
+    def call_tool(self, qualified_name: str, arguments: dict) -> Any:
+        """
+        Call a tool by its namespaced name ("{server}__{tool}").
+
+        Raises:
+            KeyError: If the name doesn't belong to a connected server
+        """
+        adapter, tool_name = self._route(qualified_name)
+        return adapter.call_tool(tool_name, arguments)
+
+    def _route(self, qualified_name: str) -> tuple[MCPToolAdapter, str]:
+        """Adapter and server tool name for a namespaced tool name."""
+        server, sep, tool_name = qualified_name.partition(NAMESPACE_SEPARATOR)
+        if not sep or server not in self.servers:
+            raise KeyError(f"No connected MCP server for tool '{qualified_name}'")
+        return self.adapters[server], tool_name
+
+    def call_many(
+        self,
+        calls: list[tuple[str, dict]],
+        concurrency: int = 8,
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        """
+        Call several namespaced tools concurrently, across servers.
+
+        Args:
+            calls: ("{server}__{tool}", arguments) pairs
+            concurrency: Max requests in flight at once, across all servers
+            return_exceptions: Return errors in place of results instead of
+                raising the first one
+
+        Returns:
+            Results in the order of calls
+
+        Raises:
+            KeyError: If a name doesn't belong to a connected server
+        """
+        for qualified_name, _ in calls:
+            self._route(qualified_name)  # Fail before anything is sent
+
+        async def call(qualified_name: str, arguments: dict, timeout: float | None):
+            adapter, tool_name = self._route(qualified_name)
+            return await adapter._call_with_timeout(tool_name, arguments, timeout)
+
+        return self._loop.run(
+            gather_calls(
+                call,
+                calls,
+                concurrency,
+                self._timeout,
+                return_exceptions,
+            )
+        )
+
+    async def close(self):
+        """Close every server session and stop the shared loop."""
+        await asyncio.gather(
+            *(adapter.close() for adapter in self.adapters.values()),
+            return_exceptions=True,
+        )
+        self._loop.stop()
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
@@ -0,0 +1,319 @@
+"""MCPClientPool - Several MCP server processes behind one client interface."""
+
+import asyncio
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from agenthelm.mcp.client import MCPClient, ProgressCallback, gather_calls
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Member:
+    """One server process in the pool."""
+
+    index: int
+    client: MCPClient
+    healthy: bool = False
+    in_flight: int = 0
+    restarts: int = 0
+    failures: int = 0
+    restart_task: asyncio.Task | None = None
+
+
+class MCPClientPool:
+    """
+    Pool of MCP server processes for one server config.
+
+    Spawns size + spares processes. Calls go to the least-loaded of the
+    first `size` healthy members; the rest are warm spares that take over
+    as soon as an active member dies. Dead members (failed call followed by
+    a failed ping, or a failed periodic health ping) are restarted with
+    exponential backoff and rejoin the pool.
+
+    A call that was in flight on a server that died raises; the pool never
+    retries it, since the tool may already have run.
+
+    Has the same interface as MCPClient (connect, list_tools, call_tool,
+    close), so MCPToolAdapter can use either.
+
+    Example:
+        pool = MCPClientPool(
+            {"command": "uvx", "args": ["mcp-server-time"]}, size=4, spares=1
+        )
+        await pool.connect()
+        result = await pool.call_tool("get_current_time", {"timezone": "UTC"})
+        await pool.close()
+    """
+
+    def __init__(
+        self,
+        server_config: dict,
+        size: int = 2,
+        spares: int = 0,
+        health_interval: float | None = 10.0,
+        ping_timeout: float = 5.0,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        client_factory: Callable[[dict], MCPClient] = MCPClient,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            server_config: MCP server config ('command', 'args', 'env')
+            size: Number of members that receive calls
+            spares: Extra connected members kept on standby
+            health_interval: Seconds between health pings (None disables them)
+            ping_timeout: Seconds a ping may take before a member is dead
+            backoff_base: First restart delay in seconds (doubles per failure)
+            backoff_max: Max restart delay in seconds
+            client_factory: Builds a client from server_config
+        """
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        if spares < 0:
+            raise ValueError("spares must be non-negative")
+
+        self.server_config = server_config
+        self.size = size
+        self.spares = spares
+        self.health_interval = health_interval
+        self.ping_timeout = ping_timeout
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._client_factory = client_factory
+        self._tools_changed_callbacks: list[Callable[[], Any]] = []
+        self._members = [
+            _Member(index=i, client=self._new_client()) for i in range(size + spares)
+        ]
+        self._health_task: asyncio.Task | None = None
+        self._closed = False
+
+    def _new_client(self) -> MCPClient:
+        """Build a member client wired to the pool's notification callbacks."""
+        client = self._client_factory(self.server_config)
+        client.on_tools_changed(self._notify_tools_changed)
+        return client
+
+    def _notify_tools_changed(self) -> None:
+        """Forward a tools/list_changed notification from any member."""
+        for callback in self._tools_changed_callbacks:
+            callback()
+
+    def on_tools_changed(self, callback: Callable[[], Any]) -> None:
+        """Register a callback for notifications/tools/list_changed."""
+        self._tools_changed_callbacks.append(callback)
+
+    @property
+    def server_version(self) -> str | None:
+        """Version reported by a connected member."""
+        for member in self._members:
+            if member.healthy and member.client.server_version:
+                return member.client.server_version
+        return None
+
+    @property
+    def connected(self) -> bool:
+        """Whether any member is healthy."""
+        return any(m.healthy for m in self._members)
+
+    @property
+    def stats(self) -> list[dict[str, Any]]:
+        """Per-member state: health, routing, load and restart count."""
+        active = {m.index for m in self._active()}
+        return [
+            {
+                "index": m.index,
+                "healthy": m.healthy,
+                "active": m.index in active,
+                "in_flight": m.in_flight,
+                "restarts": m.restarts,
+            }
+            for m in self._members
+        ]
+
+    def _active(self) -> list[_Member]:
+        """The first `size` healthy members; the rest are spares."""
+        return [m for m in self._members if m.healthy][: self.size]
+
+    def _pick(self) -> _Member:
+        """Pick the least-loaded active member."""
+        active = self._active()
+        if not active:
+            raise ConnectionError(
+                f"No healthy MCP servers for '{self.server_config.get('command')}'"
+            )
+        return min(active, key=lambda m: m.in_flight)
+
+    async def _start(self, member: _Member) -> None:
+        """Connect a member's client."""
+        await member.client.connect()
+        member.healthy = True
+        member.failures = 0
+
+    async def connect(self):
+        """Start every member concurrently and begin health checks."""
+        self._closed = False
+        results = await asyncio.gather(
+            *(self._start(m) for m in self._members), return_exceptions=True
+        )
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if len(errors) == len(self._members):
+            await self.close()
+            raise errors[0]
+
+        for member, result in zip(self._members, results):
+            if isinstance(result, BaseException):
+                logger.warning(
+                    f"MCP pool member {member.index} failed to start: {result}"
+                )
+                self._schedule_restart(member)
+
+        if self.health_interval and self._health_task is None:
+            self._health_task = asyncio.create_task(self._health_loop())
+
+    def _mark_dead(self, member: _Member, reason: Any) -> None:
+        """Take a member out of rotation and restart it."""
+        if not member.healthy:
+            return
+        member.healthy = False
+        logger.warning(f"MCP pool member {member.index} is unhealthy: {reason}")
+        self._schedule_restart(member)
+
+    def _schedule_restart(self, member: _Member) -> None:
+        """Start a restart task for a member unless one is running."""
+        if self._closed:
+            return
+        if member.restart_task is None or member.restart_task.done():
+            member.restart_task = asyncio.create_task(self._restart(member))
+
+    async def _restart(self, member: _Member) -> None:
+        """Replace a member's client, backing off between failed attempts."""
+        while not self._closed:
+            delay = min(self.backoff_max, self.backoff_base * 2**member.failures)
+            await asyncio.sleep(delay)
+
+            await member.client.close()
+            member.client = self._new_client()
+            try:
+                await self._start(member)
+            except Exception as e:
+                member.failures += 1
+                logger.warning(
+                    f"MCP pool member {member.index} restart failed "
+                    f"(attempt {member.failures}): {e}",
+                    exc_info=True,
+                )
+                continue
+
+            member.restarts += 1
+            logger.info(f"MCP pool member {member.index} restarted")
+            return
+
+    async def _check(self, member: _Member) -> None:
+        """Ping a member and mark it dead if it doesn't answer."""
+        try:
+            await member.client.ping(timeout=self.ping_timeout)
+        except Exception as e:
+            logger.debug(f"MCP pool member {member.index} ping failed", exc_info=True)
+            self._mark_dead(member, repr(e))
+
+    async def _health_loop(self) -> None:
+        """Ping healthy members every health_interval seconds."""
+        interval = self.health_interval
+        while interval and not self._closed:
+            await asyncio.sleep(interval)
+            await asyncio.gather(*(self._check(m) for m in self._members if m.healthy))
+
+    async def list_tools(self) -> list[dict]:
+        """List available tools from a healthy member."""
+        return await self._pick().client.list_tools()
+
+    async def call_tool(
+        self,
+        name: str,
+        arguments: dict,
+        timeout: float | None = None,
+        on_progress: ProgressCallback | None = None,
+    ) -> Any:
+        """
+        Call a tool on the least-loaded member.
+
+        Args:
+            name: Tool name
+            arguments: Tool arguments
+            timeout: Seconds to wait for the result (None waits forever)
+            on_progress: Awaited with (progress, total, message) updates
+
+        Raises:
+            ConnectionError: If no member is healthy
+        """
+        member = self._pick()
+        member.in_flight += 1
+        try:
+            return await member.client.call_tool(
+                name, arguments, timeout, on_progress=on_progress
+            )
+        except TimeoutError:
+            raise
+        except Exception:
+            # Tool errors are normal; only a failed ping takes the member out
+            await self._check(member)
+            raise
+        finally:
+            member.in_flight -= 1
+
+    async def call_many(
+        self,
+        calls: list[tuple[str, dict]],
+        concurrency: int = 8,
+        timeout: float | None = None,
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        """
+        Call several tools concurrently, spread over the pool's members.
+
+        Each call goes to the least-loaded member when it starts, and calls
+        on the same member are pipelined over its session.
+
+        Args:
+            calls: (tool name, arguments) pairs
+            concurrency: Max requests in flight at once, across all members
+            timeout: Seconds each call may take
+            return_exceptions: Return errors in place of results instead of
+                raising the first one
+
+        Returns:
+            Results in the order of calls
+        """
+        return await gather_calls(
+            self.call_tool, calls, concurrency, timeout, return_exceptions
+        )
+
+    async def close(self):
+        """Stop health checks and restarts, and close every member."""
+        self._closed = True
+        tasks = [m.restart_task for m in self._members if m.restart_task]
+        if self._health_task is not None:
+            tasks.append(self._health_task)
+            self._health_task = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        await asyncio.gather(*(m.client.close() for m in self._members))
+        for member in self._members:
+            member.healthy = False
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
@@ -0,0 +1,124 @@
+"""ToolSchemaCache - Persist MCP tool discovery results across runs."""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path.home() / ".agenthelm" / "mcp_cache"
+
+
+class ToolSchemaCache:
+    """
+    On-disk cache of MCP tool schemas, one JSON file per server.
+
+    Entries are keyed by the server command, args, env, an optional
+    "version" in the server config, and a fingerprint (path, size, mtime)
+    of the resolved executable, so upgrading or reconfiguring a server
+    misses the cache. Entries expire after ttl seconds and are dropped when
+    the server sends notifications/tools/list_changed.
+
+    Example:
+        cache = ToolSchemaCache(ttl=86400)
+        tools = cache.get(server_config)
+        if tools is None:
+            tools = await client.list_tools()
+            cache.put(server_config, tools, server_version=client.server_version)
+    """
+
+    def __init__(self, cache_dir: str | Path | None = None, ttl: float = 86400):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory for cache files (default: ~/.agenthelm/mcp_cache)
+            ttl: Seconds an entry stays valid (0 for no expiration)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.ttl = ttl
+
+    @staticmethod
+    def _fingerprint(command: str) -> list | None:
+        """Identify the installed server executable, if it can be resolved."""
+        path = shutil.which(command)
+        if path is None:
+            return None
+        stat = os.stat(path)
+        return [os.path.realpath(path), stat.st_size, stat.st_mtime_ns]
+
+    def key(self, server_config: dict) -> str:
+        """Cache key for a server config."""
+        command = server_config["command"]
+        identity = {
+            "command": command,
+            "args": list(server_config.get("args", [])),
+            "env": sorted((server_config.get("env") or {}).items()),
+            "version": server_config.get("version"),
+            "executable": self._fingerprint(command),
+        }
+        encoded = json.dumps(identity, sort_keys=True, default=str).encode()
+        return hashlib.sha256(encoded).hexdigest()[:32]
+
+    def _path(self, server_config: dict) -> Path:
+        """Cache file for a server config."""
+        return self.cache_dir / f"{self.key(server_config)}.json"
+
+    def get_entry(self, server_config: dict) -> dict[str, Any] | None:
+        """Return the cached entry (tools, server_version, cached_at) or None."""
+        path = self._path(server_config)
+        try:
+            entry = json.loads(path.read_text())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable MCP tool cache {path}: {e}")
+            return None
+
+        if self.ttl and time.time() - entry.get("cached_at", 0) > self.ttl:
+            return None
+        return entry
+
+    def get(self, server_config: dict) -> list[dict] | None:
+        """Return cached tool schemas for a server, or None on a miss."""
+        entry = self.get_entry(server_config)
+        return entry["tools"] if entry else None
+
+    def put(
+        self,
+        server_config: dict,
+        tools: list[dict],
+        server_version: str | None = None,
+    ) -> None:
+        """Store tool schemas for a server."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._path(server_config)
+        entry = {
+            "command": server_config["command"],
+            "server_version": server_version,
+            "cached_at": time.time(),
+            "tools": tools,
+        }
+        # Write then rename so concurrent readers never see a partial file
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(entry, default=str))
+        os.replace(tmp, path)
+
+    def invalidate(self, server_config: dict) -> None:
+        """Drop the cached entry for a server."""
+        self._path(server_config).unlink(missing_ok=True)
+
+    def clear(self) -> int:
+        """Delete every cache entry. Returns the number removed."""
+        if not self.cache_dir.exists():
+            return 0
+        removed = 0
+        for path in self.cache_dir.glob("*.json"):
+            path.unlink(missing_ok=True)
+            removed += 1
+        return removed
@@ -23,10 +23,13 @@ from agenthelm.memory.base import (
 )
 from agenthelm.memory.hub import MemoryHub
 from agenthelm.memory.context import MemoryContext
+from agenthelm.memory.episodic import EpisodicMemory, Turn
+from agenthelm.memory.metrics import MemoryMetrics
 from agenthelm.memory.semantic import SemanticMemory
 from agenthelm.memory.short_term import (
     InMemoryShortTermMemory,
     SqliteShortTermMemory,
+    TieredShortTermMemory,
 )
 
 __all__ = [
@@ -37,8 +40,12 @@ __all__ = [
     # High-level interfaces
     "MemoryHub",
     "MemoryContext",
+    "EpisodicMemory",
+    "Turn",
+    "MemoryMetrics",
     # Concrete implementations
     "SemanticMemory",
     "InMemoryShortTermMemory",
     "SqliteShortTermMemory",
+    "TieredShortTermMemory",
 ]
@@ -38,6 +38,16 @@ class BaseShortTermMemory(ABC):
         """Check if key exists and is not expired."""
         ...
 
+    @abstractmethod
+    async def keys(self, pattern: str = "*") -> list[str]:
+        """List keys matching a glob pattern."""
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Clear all stored data."""
+        ...
+
     async def get_many(self, keys: list[str]) -> dict[str, Any]:
         """Get multiple keys. Default implementation calls get() for each."""
         result = {}
@@ -47,6 +57,82 @@ class BaseShortTermMemory(ABC):
                 result[key] = value
         return result
 
+    async def get_many_with_ttl(
+        self, keys: list[str]
+    ) -> dict[str, tuple[Any, float | None]]:
+        """
+        Get multiple keys with their remaining TTL in seconds.
+
+        Returns {key: (value, remaining)}; remaining is None for keys that
+        don't expire. Default implementation can't see expiries and reports
+        None for every key; backends override it to read value and expiry
+        together.
+        """
+        return {
+            key: (value, None) for key, value in (await self.get_many(keys)).items()
+        }
+
+    async def set_many(self, items: dict[str, Any], ttl: int = 3600) -> None:
+        """Set multiple keys. Default implementation calls set() for each."""
+        for key, value in items.items():
+            await self.set(key, value, ttl)
+
+    async def delete_many(self, keys: list[str]) -> None:
+        """Delete multiple keys. Default implementation calls delete() for each."""
+        for key in keys:
+            await self.delete(key)
+
+    async def delete_prefix(self, prefix: str) -> int:
+        """
+        Delete every key starting with prefix. Returns the number deleted.
+
+        Default implementation lists matching keys with keys() and calls
+        delete_many(); backends override it with a native bulk delete.
+        """
+        keys = [k for k in await self.keys(f"{prefix}*") if k.startswith(prefix)]
+        await self.delete_many(keys)
+        return len(keys)
+
+    async def incr(self, key: str, amount: int = 1, ttl: int = 3600) -> int:
+        """
+        Add amount to an integer counter and return the new value.
+
+        Missing or expired keys start at 0 and get the TTL; native
+        implementations keep an existing counter's expiry. Raises TypeError
+        if the key holds a non-integer. Default implementation is get() +
+        set(), re-applies the TTL, and is NOT atomic; backends override it
+        with a single atomic operation.
+        """
+        current = await self.get(key)
+        if current is None:
+            current = 0
+        elif not isinstance(current, int) or isinstance(current, bool):
+            raise TypeError(f"Value at '{key}' is not an integer")
+        await self.set(key, current + amount, ttl)
+        return current + amount
+
+    async def compare_and_set(
+        self, key: str, expected: Any, value: Any, ttl: int = 3600
+    ) -> bool:
+        """
+        Set key to value only if it currently equals expected.
+
+        Use expected=None to require that the key is absent. Returns True if
+        the value was written. Default implementation is NOT atomic.
+        """
+        if await self.get(key) != expected:
+            return False
+        await self.set(key, value, ttl)
+        return True
+
+    async def set_if_absent(self, key: str, value: Any, ttl: int = 3600) -> bool:
+        """
+        Set key only if it is missing or expired. Returns True if written.
+
+        Default implementation is NOT atomic.
+        """
+        return await self.compare_and_set(key, None, value, ttl)
+
     async def close(self) -> None:
         """Close any connections. Override if needed."""
         pass
@@ -55,6 +141,9 @@ class BaseShortTermMemory(ABC):
 class BaseSemanticMemory(ABC):
     """Abstract base class for semantic (vector) memory."""
 
+    # Whether delete_by_filter is implemented
+    supports_filter_delete: bool = False
+
     @abstractmethod
     async def store(
         self,
@@ -80,6 +169,17 @@ class BaseSemanticMemory(ABC):
         """Delete entries by ID."""
         ...
 
+    async def delete_by_filter(self, filter: dict[str, Any]) -> None:
+        """
+        Delete entries whose metadata matches the filter.
+
+        Only available when supports_filter_delete is True; backends that
+        implement it set the flag.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support delete_by_filter"
+        )
+
     async def store_many(
         self,
         texts: list[str],
@@ -93,6 +193,9 @@ class BaseSemanticMemory(ABC):
             ids.append(id)
         return ids
 
+    def warmup(self) -> None:
+        """Load models ahead of the first request. Override if needed."""
+
     async def close(self) -> None:
         """Close any connections. Override if needed."""
         pass
@@ -93,6 +93,7 @@ class MemoryContext:
         query: str,
         top_k: int = 5,
         session_only: bool = False,
+        mode: str | None = None,
     ) -> list:
         """
         Search semantic memory.
@@ -101,6 +102,8 @@ class MemoryContext:
             query: Search query
             top_k: Number of results to return
             session_only: If True, only search within this session's memories
+            mode: Retrieval mode ("vector", "lexical", "hybrid", "auto").
+                Non-vector modes need a hub created with hybrid_search=True.
 
         Returns:
             List of SearchResult objects
@@ -109,22 +112,30 @@ class MemoryContext:
         if session_only:
             filter_dict = {"session_id": self.session_id}
 
-        return await self.hub.semantic.search(query, top_k=top_k, filter=filter_dict)
+        kwargs = {"mode": mode} if mode else {}
+        return await self.hub.semantic.search(
+            query, top_k=top_k, filter=filter_dict, **kwargs
+        )
 
     # Lifecycle management
 
     async def cleanup(self) -> None:
         """Clean up all session-scoped short-term memory keys."""
-        pattern = f"session:{self.session_id}:*"
-        keys = await self.hub.short_term.keys(pattern)
-        for key in keys:
-            await self.hub.short_term.delete(key)
+        await self.hub.short_term.delete_prefix(f"session:{self.session_id}:")
 
     async def cleanup_semantic(self) -> None:
-        """Clean up semantic memories stored in this session."""
-        if self._stored_memory_ids:
-            await self.hub.semantic.delete(self._stored_memory_ids)
-            self._stored_memory_ids.clear()
+        """
+        Clean up semantic memories stored in this session.
+
+        Deletes by session_id, so memories from earlier processes with the
+        same session are removed too.
+        """
+        semantic = self.hub.semantic
+        if semantic.supports_filter_delete:
+            await semantic.delete_by_filter({"session_id": self.session_id})
+        elif self._stored_memory_ids:
+            await semantic.delete(self._stored_memory_ids)
+        self._stored_memory_ids.clear()
 
     async def __aenter__(self) -> "MemoryContext":
         """Async context manager entry."""
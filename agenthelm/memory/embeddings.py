@@ -0,0 +1,110 @@
+"""Process-wide registry of FastEmbed models shared by SemanticMemory instances.
+
+Loading an embedding model takes seconds and holds a full copy of its weights,
+so each model is loaded at most once per process and reused by every
+SemanticMemory (and therefore every MemoryHub) that asks for it.
+
+Example:
+    from agenthelm.memory.embeddings import warmup
+
+    # At service startup, before the first request
+    warmup(["sentence-transformers/all-MiniLM-L6-v2"])
+
+    # Or without blocking startup
+    thread = warmup(["sentence-transformers/all-MiniLM-L6-v2"], background=True)
+"""
+
+import logging
+import threading
+import time
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Loaded models: {model_name: TextEmbedding}
+_models: dict[str, Any] = {}
+# Per-model locks so concurrent first requests load a model only once
+_model_locks: dict[str, threading.Lock] = {}
+_registry_lock = threading.Lock()
+
+
+def _load_model(model_name: str) -> Any:
+    """Load a FastEmbed model. Requires qdrant-client[fastembed]."""
+    from fastembed import TextEmbedding
+
+    return TextEmbedding(model_name=model_name)
+
+
+def get_embedding_model(model_name: str) -> Any:
+    """
+    Get a shared embedding model, loading it on first use.
+
+    Thread-safe: concurrent callers block until the single load completes.
+    """
+    model = _models.get(model_name)
+    if model is not None:
+        return model
+
+    with _registry_lock:
+        model_lock = _model_locks.setdefault(model_name, threading.Lock())
+
+    with model_lock:
+        model = _models.get(model_name)
+        if model is None:
+            start_time = time.monotonic()
+            model = _load_model(model_name)
+            _models[model_name] = model
+            logger.info(
+                f"Loaded embedding model {model_name} "
+                f"in {time.monotonic() - start_time:.2f}s"
+            )
+    return model
+
+
+def is_loaded(model_name: str) -> bool:
+    """Check whether a model is already loaded in this process."""
+    return model_name in _models
+
+
+def warmup(
+    model_names: list[str],
+    background: bool = False,
+) -> threading.Thread | None:
+    """
+    Load embedding models ahead of the first request.
+
+    Args:
+        model_names: FastEmbed model names to load
+        background: If True, load in a daemon thread and return it
+
+    Returns:
+        The loader thread when background=True, otherwise None
+    """
+
+    def _load_all() -> None:
+        for model_name in model_names:
+            try:
+                get_embedding_model(model_name)
+            except Exception as e:
+                logger.warning(f"Failed to warm up embedding model {model_name}: {e}")
+                if not background:
+                    raise
+
+    if not background:
+        _load_all()
+        return None
+
+    thread = threading.Thread(
+        target=_load_all, name="agenthelm-embedding-warmup", daemon=True
+    )
+    thread.start()
+    return thread
+
+
+def unload(model_name: str | None = None) -> None:
+    """Drop a loaded model (or all models) so its memory can be reclaimed."""
+    with _registry_lock:
+        if model_name is None:
+            _models.clear()
+        else:
+            _models.pop(model_name, None)
@@ -0,0 +1,338 @@
+"""Episodic (conversation) memory: a token-budgeted window of recent turns."""
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+from qdrant_client.http.exceptions import ApiException
+
+from agenthelm.memory.hub import MemoryHub
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_TYPE = "episode_summary"
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token for English text)."""
+    return max(1, len(text) // 4)
+
+
+@dataclass
+class Turn:
+    """A single conversation turn."""
+
+    seq: int
+    role: str
+    content: str
+    tokens: int
+    timestamp: float = field(default_factory=time.time)
+    metadata: dict[str, Any] | None = None
+
+
+def extractive_summary(turns: list[Turn], max_chars: int = 200) -> str:
+    """
+    Default summarizer: one truncated line per turn.
+
+    No model call is made. Pass an LLM-backed summarizer to EpisodicMemory
+    for abstractive summaries.
+    """
+    lines = []
+    for turn in turns:
+        content = " ".join(turn.content.split())
+        if len(content) > max_chars:
+            content = content[: max_chars - 3] + "..."
+        lines.append(f"{turn.role}: {content}")
+    return "\n".join(lines)
+
+
+class EpisodicMemory:
+    """
+    Conversation history for one session, with a bounded prompt footprint.
+
+    Turns are stored in a ring buffer of max_turns slots in short-term
+    memory. When the window exceeds window_tokens (or the buffer fills), the
+    oldest turns are folded into a summary, which is stored in semantic
+    memory and kept as a recent summary. context() then assembles recent
+    turns plus summaries within a token budget, so prompts stop growing with
+    session length.
+
+    Keys live under session:{session_id}:episode:, so MemoryContext cleanup
+    removes them. Folding claims turns with compare_and_set, so several
+    processes sharing a session never summarize the same turns twice.
+
+    Example:
+        episodes = EpisodicMemory(hub, session_id="user-123", window_tokens=2000)
+        await episodes.add("user", "Plan a trip to Lisbon")
+        await episodes.add("assistant", "Here's a 3-day itinerary...")
+
+        messages = await episodes.context(budget_tokens=1500)
+        # [{"role": "system", "content": "Summary of earlier conversation: ..."},
+        #  {"role": "user", "content": "..."}, ...]
+
+        # LLM summaries instead of the default extractive one
+        episodes = EpisodicMemory(hub, summarizer=lambda turns: summarize(turns))
+    """
+
+    def __init__(
+        self,
+        hub: MemoryHub,
+        session_id: str = "default",
+        window_tokens: int = 2000,
+        max_turns: int = 50,
+        fold_target: float = 0.5,
+        summarizer: Callable[[list[Turn]], str] | None = None,
+        token_counter: Callable[[str], int] | None = None,
+        max_summaries: int = 20,
+        ttl: int = 0,
+    ):
+        """
+        Initialize episodic memory.
+
+        Args:
+            hub: MemoryHub providing short-term and semantic memory
+            session_id: Session whose turns this instance reads and writes
+            window_tokens: Token budget for verbatim turns before folding
+            max_turns: Ring buffer size; the window never holds more turns
+            fold_target: Fraction of window_tokens left after a fold (folding
+                past the limit batches summarizer calls)
+            summarizer: Callable turning a list of turns into summary text
+                (runs in a worker thread; defaults to extractive_summary)
+            token_counter: Callable returning a token count for text
+                (defaults to estimate_tokens)
+            max_summaries: Recent summaries kept in short-term memory
+            ttl: TTL in seconds for stored turns and counters (0 for none)
+        """
+        if max_turns < 2:
+            raise ValueError("max_turns must be at least 2")
+        if not 0 < fold_target < 1:
+            raise ValueError("fold_target must be between 0 and 1")
+
+        self.hub = hub
+        self.session_id = session_id
+        self.window_tokens = window_tokens
+        self.max_turns = max_turns
+        self.fold_target = fold_target
+        self.summarizer = summarizer or extractive_summary
+        self.token_counter = token_counter or estimate_tokens
+        self.max_summaries = max_summaries
+        self.ttl = ttl
+        self._lock = asyncio.Lock()
+
+    def _key(self, name: str) -> str:
+        """Create a session-scoped episode key."""
+        return f"session:{self.session_id}:episode:{name}"
+
+    def _slot_key(self, seq: int) -> str:
+        """Ring buffer slot holding turn seq."""
+        return self._key(f"turn:{seq % self.max_turns}")
+
+    async def _bounds(self) -> tuple[int | None, int]:
+        """Return (raw tail, head): the window is turns [tail, head)."""
+        short_term = self.hub.short_term
+        tail = await short_term.get(self._key("tail"))
+        head = await short_term.get(self._key("head"))
+        return tail, head or 0
+
+    async def turns(self) -> list[Turn]:
+        """Return the turns in the window, oldest first."""
+        tail, head = await self._bounds()
+        tail = tail or 0
+        if head <= tail:
+            return []
+
+        keys = [self._slot_key(seq) for seq in range(tail, head)]
+        stored = await self.hub.short_term.get_many(keys)
+        turns = []
+        for key in keys:
+            data = stored.get(key)
+            # Skip slots that expired or were already reused by a newer turn
+            if data is not None and tail <= data["seq"] < head:
+                turns.append(Turn(**data))
+        return turns
+
+    async def add(
+        self, role: str, content: str, metadata: dict[str, Any] | None = None
+    ) -> Turn:
+        """
+        Append a turn, folding older turns into a summary if needed.
+
+        Args:
+            role: Speaker role ("user", "assistant", "tool", ...)
+            content: Turn text
+            metadata: Optional metadata stored with the turn
+
+        Returns:
+            The stored Turn
+        """
+        short_term = self.hub.short_term
+        async with self._lock:
+            tail, head = await self._bounds()
+            # Never overwrite a slot whose turn hasn't been folded yet
+            if head - (tail or 0) >= self.max_turns:
+                await self._fold()
+
+            seq = await short_term.incr(self._key("head"), ttl=self.ttl) - 1
+            turn = Turn(
+                seq=seq,
+                role=role,
+                content=content,
+                tokens=self.token_counter(content),
+                metadata=metadata,
+            )
+            await short_term.set(self._slot_key(seq), asdict(turn), ttl=self.ttl)
+            total = await short_term.incr(
+                self._key("tokens"), turn.tokens, ttl=self.ttl
+            )
+
+            if total > self.window_tokens:
+                await self._fold()
+        return turn
+
+    async def _fold(self) -> None:
+        """Summarize the oldest turns until the window is back under target."""
+        short_term = self.hub.short_term
+        raw_tail, _ = await self._bounds()
+        turns = await self.turns()
+
+        target_tokens = int(self.window_tokens * self.fold_target)
+        target_turns = max(1, int(self.max_turns * self.fold_target))
+        remaining = sum(t.tokens for t in turns)
+        folded: list[Turn] = []
+        # Always keep the newest turn verbatim
+        for turn in turns[:-1]:
+            kept = len(turns) - len(folded)
+            if remaining <= target_tokens and kept <= target_turns:
+                break
+            folded.append(turn)
+            remaining -= turn.tokens
+        if not folded:
+            return
+
+        summary = await asyncio.to_thread(self.summarizer, folded)
+        new_tail = folded[-1].seq + 1
+        # Another process may have folded these turns already
+        if not await short_term.compare_and_set(
+            self._key("tail"), raw_tail, new_tail, ttl=self.ttl
+        ):
+            return
+
+        folded_tokens = sum(t.tokens for t in folded)
+        await short_term.incr(self._key("tokens"), -folded_tokens, ttl=self.ttl)
+        await short_term.delete_many([self._slot_key(t.seq) for t in folded])
+
+        record = {
+            "text": summary,
+            "first_seq": folded[0].seq,
+            "last_seq": folded[-1].seq,
+        }
+        summaries = await short_term.get(self._key("summaries")) or []
+        summaries = (summaries + [record])[-self.max_summaries :]
+        await short_term.set(self._key("summaries"), summaries, ttl=self.ttl)
+
+        try:
+            await self.hub.semantic.store(
+                summary,
+                metadata={
+                    "session_id": self.session_id,
+                    "type": SUMMARY_TYPE,
+                    "first_seq": record["first_seq"],
+                    "last_seq": record["last_seq"],
+                },
+            )
+        except (ImportError, OSError, ValueError, ApiException) as e:
+            # The summary is already in short-term memory; indexing it for
+            # recall is best-effort (no embedding model, Qdrant unreachable)
+            logger.warning(f"Failed to store episode summary in semantic memory: {e}")
+
+        logger.debug(
+            f"Folded turns {record['first_seq']}-{record['last_seq']} "
+            f"({folded_tokens} tokens) for session {self.session_id}"
+        )
+
+    async def summaries(self) -> list[dict[str, Any]]:
+        """Return recent summaries, oldest first."""
+        return await self.hub.short_term.get(self._key("summaries")) or []
+
+    async def _relevant_summaries(self, query: str, top_k: int) -> list[dict]:
+        """Search semantic memory for this session's summaries."""
+        results = await self.hub.semantic.search(
+            query,
+            top_k=top_k,
+            filter={"session_id": self.session_id, "type": SUMMARY_TYPE},
+        )
+        records = [
+            {
+                "text": r.text,
+                "first_seq": (r.metadata or {}).get("first_seq", 0),
+            }
+            for r in results
+        ]
+        return sorted(records, key=lambda r: r["first_seq"])
+
+    async def context(
+        self,
+        budget_tokens: int,
+        query: str | None = None,
+        max_summaries: int = 3,
+        summary_share: float = 0.25,
+    ) -> list[dict[str, str]]:
+        """
+        Build prompt messages that fit within a token budget.
+
+        The newest turns are included verbatim, newest first, until the
+        budget is used up; up to summary_share of the budget is reserved for
+        summaries of older turns when any exist.
+
+        Args:
+            budget_tokens: Max tokens across all returned messages
+            query: If set, include the summaries most relevant to it (semantic
+                search) instead of the most recent ones
+            max_summaries: Max summaries to include
+            summary_share: Fraction of the budget reserved for summaries
+
+        Returns:
+            Chat messages ({"role", "content"}), oldest first
+        """
+        if query is not None:
+            summaries = await self._relevant_summaries(query, max_summaries)
+        else:
+            summaries = (await self.summaries())[-max_summaries:]
+
+        summary_messages = [
+            {
+                "role": "system",
+                "content": f"Summary of earlier conversation:\n{s['text']}",
+            }
+            for s in summaries
+        ]
+        summary_tokens = [self.token_counter(m["content"]) for m in summary_messages]
+        reserved = min(sum(summary_tokens), int(budget_tokens * summary_share))
+
+        selected: list[Turn] = []
+        used = 0
+        for turn in reversed(await self.turns()):
+            if used + turn.tokens > budget_tokens - reserved:
+                break
+            selected.append(turn)
+            used += turn.tokens
+
+        # Summaries fill what the turns left, newest summaries first
+        messages: list[dict[str, str]] = []
+        for message, tokens in reversed(list(zip(summary_messages, summary_tokens))):
+            if used + tokens > budget_tokens:
+                break
+            messages.insert(0, message)
+            used += tokens
+
+        messages.extend(
+            {"role": t.role, "content": t.content} for t in reversed(selected)
+        )
+        return messages
+
+    async def clear(self) -> None:
+        """Delete this session's turns, counters and recent summaries."""
+        await self.hub.short_term.delete_prefix(self._key(""))
@@ -1,8 +1,14 @@
 """MemoryHub - Unified interface to short-term and semantic memory."""
 
 from pathlib import Path
+from typing import ClassVar
 
 from agenthelm.memory.base import BaseShortTermMemory, BaseSemanticMemory
+from agenthelm.memory.metrics import (
+    InstrumentedSemanticMemory,
+    InstrumentedShortTermMemory,
+    MemoryMetrics,
+)
 from agenthelm.memory.short_term.in_memory import InMemoryShortTermMemory
 from agenthelm.memory.semantic import SemanticMemory
 
@@ -23,8 +29,19 @@ class MemoryHub:
 
         # Network mode - for production scaling
         hub = MemoryHub(redis_url="redis://...", qdrant_url="http://...")
+
+        # Per-backend latency and hit-ratio metrics
+        hub = MemoryHub(data_dir="./data", instrument=True)
+        hub.metrics.snapshot()
     """
 
+    # Metric labels for the built-in short-term backends
+    _BACKEND_NAMES: ClassVar[dict[str, str]] = {
+        "InMemoryShortTermMemory": "in_memory",
+        "SqliteShortTermMemory": "sqlite",
+        "RedisShortTermMemory": "redis",
+    }
+
     def __init__(
         self,
         # Mode selection
@@ -35,6 +52,11 @@ class MemoryHub:
         # Advanced options
         collection_name: str | None = None,
         embedding_model: str | None = None,
+        hybrid_search: bool = False,
+        short_term_codec: str = "json",
+        short_term_cache_size: int = 0,
+        short_term_write_mode: str = "through",
+        instrument: bool = False,
     ):
         """
         Initialize MemoryHub.
@@ -45,6 +67,16 @@ class MemoryHub:
             qdrant_url: Qdrant server URL. If provided, uses network Qdrant.
             collection_name: Custom Qdrant collection name.
             embedding_model: Custom embedding model for semantic memory.
+            hybrid_search: Maintain a BM25 index next to the vectors so recall
+                can run lexical, hybrid, or auto retrieval.
+            short_term_codec: Value codec for SQLite/Redis short-term memory
+                ("json", "msgpack", or "pickle" for trusted stores).
+            short_term_cache_size: Entries in an in-process L1 cache in front
+                of SQLite/Redis short-term memory (0 disables it).
+            short_term_write_mode: L1 write mode, "through" or "behind".
+            instrument: Record per-backend latency histograms, counts,
+                payload sizes and hit ratios in hub.metrics (also exported
+                through OpenTelemetry when init_metrics() was called).
         """
         self._short_term: BaseShortTermMemory | None = None
         self._semantic: BaseSemanticMemory | None = None
@@ -55,12 +87,26 @@ class MemoryHub:
         self._qdrant_url = qdrant_url
         self._collection_name = collection_name
         self._embedding_model = embedding_model
+        self._hybrid_search = hybrid_search
+        self._short_term_codec = short_term_codec
+        self._short_term_cache_size = short_term_cache_size
+        self._short_term_write_mode = short_term_write_mode
+
+        self.metrics: MemoryMetrics | None = None
+        if instrument:
+            from agenthelm.tracing.otel import get_meter
+
+            self.metrics = MemoryMetrics(meter=get_meter("agenthelm.memory"))
 
     @property
     def short_term(self) -> BaseShortTermMemory:
         """Get short-term memory backend (lazy initialization)."""
         if self._short_term is None:
             self._short_term = self._create_short_term()
+            if self.metrics is not None:
+                self._short_term = self._instrument_short_term(
+                    self._short_term, self.metrics
+                )
         return self._short_term
 
     @property
@@ -68,22 +114,59 @@ class MemoryHub:
         """Get semantic memory backend (lazy initialization)."""
         if self._semantic is None:
             self._semantic = self._create_semantic()
+            if self.metrics is not None:
+                self._semantic = InstrumentedSemanticMemory(
+                    self._semantic, self.metrics
+                )
         return self._semantic
 
+    def _instrument_short_term(
+        self, memory: BaseShortTermMemory, metrics: MemoryMetrics
+    ) -> BaseShortTermMemory:
+        """Wrap a short-term backend (and both tiers of a tiered one) in timers."""
+        from agenthelm.memory.short_term.tiered import TieredShortTermMemory
+
+        if isinstance(memory, TieredShortTermMemory):
+            memory.l1 = InstrumentedShortTermMemory(memory.l1, metrics, "l1")
+            memory.backend = self._instrument_short_term(memory.backend, metrics)
+            return InstrumentedShortTermMemory(memory, metrics, "tiered")
+
+        name = self._BACKEND_NAMES.get(type(memory).__name__, type(memory).__name__)
+        return InstrumentedShortTermMemory(memory, metrics, name)
+
     def _create_short_term(self) -> BaseShortTermMemory:
-        """Create short-term memory backend based on configuration."""
+        """Create short-term memory backend, with an L1 cache if configured."""
+        backend = self._create_short_term_backend()
+        if self._short_term_cache_size > 0 and not isinstance(
+            backend, InMemoryShortTermMemory
+        ):
+            from agenthelm.memory.short_term.tiered import TieredShortTermMemory
+
+            return TieredShortTermMemory(
+                backend,
+                l1_max_entries=self._short_term_cache_size,
+                write_mode=self._short_term_write_mode,
+            )
+        return backend
+
+    def _create_short_term_backend(self) -> BaseShortTermMemory:
+        """Create the durable short-term backend based on configuration."""
         if self._redis_url:
             # Network mode: use Redis
             from agenthelm.memory.short_term.redis import RedisShortTermMemory
 
-            return RedisShortTermMemory(url=self._redis_url)
+            return RedisShortTermMemory(
+                url=self._redis_url, codec=self._short_term_codec
+            )
         elif self._data_dir:
             # Local mode: use SQLite
             from agenthelm.memory.short_term.sqlite import SqliteShortTermMemory
 
             db_path = self._data_dir / "short_term.db"
             self._data_dir.mkdir(parents=True, exist_ok=True)
-            return SqliteShortTermMemory(db_path=str(db_path))
+            return SqliteShortTermMemory(
+                db_path=str(db_path), codec=self._short_term_codec
+            )
         else:
             # In-memory mode (default)
             return InMemoryShortTermMemory()
@@ -97,6 +180,7 @@ class MemoryHub:
                 url=self._qdrant_url,
                 collection_name=self._collection_name,
                 embedding_model=self._embedding_model,
+                hybrid=self._hybrid_search,
             )
         elif self._data_dir:
             # Local mode
@@ -107,6 +191,7 @@ class MemoryHub:
                 path=str(qdrant_path),
                 collection_name=self._collection_name,
                 embedding_model=self._embedding_model,
+                hybrid=self._hybrid_search,
             )
         else:
             # In-memory mode (default)
@@ -114,8 +199,19 @@ class MemoryHub:
                 mode="memory",
                 collection_name=self._collection_name,
                 embedding_model=self._embedding_model,
+                hybrid=self._hybrid_search,
             )
 
+    def warmup(self) -> None:
+        """
+        Load the embedding model before the first request.
+
+        Call at service startup to avoid a multi-second latency spike on the
+        first store/search. Models are shared process-wide, so warming one
+        hub warms every hub that uses the same model.
+        """
+        self.semantic.warmup()
+
     async def close(self) -> None:
         """Close all backends and release resources."""
         if self._short_term:
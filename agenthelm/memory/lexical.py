@@ -0,0 +1,158 @@
+"""In-process BM25 inverted index for lexical retrieval over semantic memory."""
+
+import math
+import re
+from collections import Counter
+from typing import Any
+
+# Identifier-like tokens stay whole ("order-123", "report.pdf") and are also
+# split into their parts so either form matches.
+_TOKEN_RE = re.compile(r"[\w]+(?:[-./:#][\w]+)*")
+_SPLIT_RE = re.compile(r"[-./:#]")
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase word/identifier tokenizer used for indexing and queries."""
+    tokens = []
+    for token in _TOKEN_RE.findall(text.lower()):
+        tokens.append(token)
+        parts = _SPLIT_RE.split(token)
+        if len(parts) > 1:
+            tokens.extend(part for part in parts if part)
+    return tokens
+
+
+def reciprocal_rank_fusion(
+    rankings: list[list[tuple[str, float]]],
+    k: int = 60,
+) -> list[tuple[str, float]]:
+    """
+    Fuse several ranked (id, score) lists with Reciprocal Rank Fusion.
+
+    Each list contributes 1 / (k + rank) per ID; raw scores are ignored, so
+    BM25 and cosine scores can be combined without normalization.
+    """
+    fused: dict[str, float] = {}
+    for ranking in rankings:
+        for rank, (doc_id, _) in enumerate(ranking, start=1):
+            fused[doc_id] = fused.get(doc_id, 0.0) + 1.0 / (k + rank)
+    return sorted(fused.items(), key=lambda item: item[1], reverse=True)
+
+
+class BM25Index:
+    """
+    BM25 inverted index kept alongside the vector store.
+
+    Stores postings {term: {doc_id: term_frequency}} plus per-document
+    metadata for exact-match filters. Queries only touch the postings of
+    their own terms, so lookups cost far less than embedding the query.
+
+    Example:
+        index = BM25Index()
+        index.add("m1", "Order ORD-1042 shipped", {"session_id": "abc"})
+        index.search("ORD-1042")  # [("m1", <bm25 score>)]
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        """
+        Initialize the index.
+
+        Args:
+            k1: Term-frequency saturation
+            b: Document-length normalization
+        """
+        self.k1 = k1
+        self.b = b
+        self._postings: dict[str, dict[str, int]] = {}
+        self._doc_terms: dict[str, Counter] = {}
+        self._doc_len: dict[str, int] = {}
+        self._metadata: dict[str, dict[str, Any]] = {}
+        self._total_len = 0
+
+    def add(
+        self, doc_id: str, text: str, metadata: dict[str, Any] | None = None
+    ) -> None:
+        """Index a document, replacing any previous version with the same ID."""
+        if doc_id in self._doc_terms:
+            self.remove([doc_id])
+
+        terms = Counter(tokenize(text))
+        for term, tf in terms.items():
+            self._postings.setdefault(term, {})[doc_id] = tf
+
+        length = sum(terms.values())
+        self._doc_terms[doc_id] = terms
+        self._doc_len[doc_id] = length
+        self._metadata[doc_id] = metadata or {}
+        self._total_len += length
+
+    def remove(self, doc_ids: list[str]) -> None:
+        """Remove documents from the index. Unknown IDs are ignored."""
+        for doc_id in doc_ids:
+            terms = self._doc_terms.pop(doc_id, None)
+            if terms is None:
+                continue
+            for term in terms:
+                postings = self._postings.get(term)
+                if postings is not None:
+                    postings.pop(doc_id, None)
+                    if not postings:
+                        del self._postings[term]
+            self._total_len -= self._doc_len.pop(doc_id)
+            self._metadata.pop(doc_id, None)
+
+    def search(
+        self,
+        query: str,
+        top_k: int = 5,
+        filter: dict[str, Any] | None = None,
+    ) -> list[tuple[str, float]]:
+        """
+        Rank documents by BM25 score.
+
+        Args:
+            query: Keyword query
+            top_k: Maximum number of results
+            filter: Exact-match metadata filter {field: value}
+
+        Returns:
+            List of (doc_id, score), best first. Only documents sharing at
+            least one term with the query are returned.
+        """
+        num_docs = len(self._doc_terms)
+        if num_docs == 0:
+            return []
+
+        avg_len = self._total_len / num_docs
+        scores: dict[str, float] = {}
+
+        for term in set(tokenize(query)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            df = len(postings)
+            idf = math.log(1 + (num_docs - df + 0.5) / (df + 0.5))
+            for doc_id, tf in postings.items():
+                if filter and not all(
+                    self._metadata[doc_id].get(k) == v for k, v in filter.items()
+                ):
+                    continue
+                norm = self.k1 * (1 - self.b + self.b * self._doc_len[doc_id] / avg_len)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (self.k1 + 1) / (
+                    tf + norm
+                )
+
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        return ranked[:top_k]
+
+    def clear(self) -> None:
+        """Remove all documents."""
+        self._postings.clear()
+        self._doc_terms.clear()
+        self._doc_len.clear()
+        self._metadata.clear()
+        self._total_len = 0
+
+    def __len__(self) -> int:
+        """Number of indexed documents."""
+        return len(self._doc_terms)
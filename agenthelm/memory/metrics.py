@@ -0,0 +1,464 @@
+"""Latency, size and hit-ratio instrumentation for memory backends.
+
+MemoryMetrics aggregates per-(backend, operation) measurements in process
+and, when given an OpenTelemetry meter, mirrors them to OTel instruments.
+The Instrumented* wrappers time every call on a backend without changing it.
+
+Example:
+    hub = MemoryHub(data_dir="./data", instrument=True)
+    await hub.short_term.get("session:abc:plan")
+    hub.metrics.snapshot()["sqlite"]["get"]["latency_ms"]["p95"]
+
+    # Export through OpenTelemetry
+    from agenthelm.tracing import init_metrics
+    init_metrics(otlp_endpoint="http://localhost:4317")
+    hub = MemoryHub(instrument=True)
+"""
+
+import bisect
+import time
+from collections.abc import Generator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from dataclasses import dataclass
+from typing import Any
+
+from agenthelm.memory.base import BaseSemanticMemory, BaseShortTermMemory
+
+# Latency histogram bucket upper bounds in milliseconds
+DEFAULT_BUCKETS_MS = (
+    0.1,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    25.0,
+    50.0,
+    100.0,
+    250.0,
+    500.0,
+    1000.0,
+    2500.0,
+    5000.0,
+)
+
+
+@dataclass
+class Measurement:
+    """Details a timed block can attach to its measurement."""
+
+    size: int | None = None
+    hit: bool | None = None
+
+
+@dataclass
+class _OperationStats:
+    """Aggregated measurements for one (backend, operation) pair."""
+
+    buckets: list[int]
+    count: int = 0
+    errors: int = 0
+    total_ms: float = 0.0
+    min_ms: float = float("inf")
+    max_ms: float = 0.0
+    total_bytes: int = 0
+    sized: int = 0
+    hits: int = 0
+    misses: int = 0
+
+
+class MemoryMetrics:
+    """
+    Per-backend, per-operation latency histograms, counts, sizes and hit ratios.
+
+    Example:
+        metrics = MemoryMetrics()
+        with metrics.time("redis", "get") as m:
+            value = await redis.get(key)
+            m.hit = value is not None
+        metrics.snapshot()
+    """
+
+    def __init__(
+        self,
+        meter: Any | None = None,
+        buckets_ms: tuple[float, ...] = DEFAULT_BUCKETS_MS,
+    ):
+        """
+        Initialize metrics.
+
+        Args:
+            meter: OpenTelemetry Meter to mirror measurements to (optional)
+            buckets_ms: Latency histogram bucket upper bounds in milliseconds
+        """
+        self.buckets_ms = tuple(buckets_ms)
+        self._stats: dict[tuple[str, str], _OperationStats] = {}
+
+        self._otel = meter is not None
+        if meter is not None:
+            self._duration = meter.create_histogram(
+                "agenthelm.memory.duration",
+                unit="ms",
+                description="Memory backend operation latency",
+            )
+            self._operations = meter.create_counter(
+                "agenthelm.memory.operations",
+                description="Memory backend operations",
+            )
+            self._payload_size = meter.create_histogram(
+                "agenthelm.memory.payload_size",
+                unit="By",
+                description="Memory payload size",
+            )
+            self._lookups = meter.create_counter(
+                "agenthelm.memory.lookups",
+                description="Memory lookups by result (hit/miss)",
+            )
+
+    def record(
+        self,
+        backend: str,
+        operation: str,
+        duration_ms: float,
+        size: int | None = None,
+        hit: bool | None = None,
+        error: bool = False,
+    ) -> None:
+        """Record one operation."""
+        stats = self._stats.get((backend, operation))
+        if stats is None:
+            stats = _OperationStats(buckets=[0] * (len(self.buckets_ms) + 1))
+            self._stats[(backend, operation)] = stats
+
+        stats.count += 1
+        stats.errors += error
+        stats.total_ms += duration_ms
+        stats.min_ms = min(stats.min_ms, duration_ms)
+        stats.max_ms = max(stats.max_ms, duration_ms)
+        stats.buckets[bisect.bisect_left(self.buckets_ms, duration_ms)] += 1
+        if size is not None:
+            stats.total_bytes += size
+            stats.sized += 1
+        if hit is not None:
+            stats.hits += hit
+            stats.misses += not hit
+
+        if self._otel:
+            attributes = {
+                "backend": backend,
+                "operation": operation,
+                "error": error,
+            }
+            self._duration.record(duration_ms, attributes)
+            self._operations.add(1, attributes)
+            if size is not None:
+                self._payload_size.record(size, attributes)
+            if hit is not None:
+                self._lookups.add(1, {**attributes, "result": "hit" if hit else "miss"})
+
+    @contextmanager
+    def time(self, backend: str, operation: str) -> Generator[Measurement, None, None]:
+        """Time a block; set .size/.hit on the yielded Measurement to record them."""
+        measurement = Measurement()
+        start = time.perf_counter()
+        error = False
+        try:
+            yield measurement
+        except Exception:
+            error = True
+            raise
+        finally:
+            self.record(
+                backend,
+                operation,
+                (time.perf_counter() - start) * 1000,
+                size=measurement.size,
+                hit=measurement.hit,
+                error=error,
+            )
+
+    def _percentile(self, stats: _OperationStats, q: float) -> float:
+        """Approximate a latency percentile as its bucket's upper bound."""
+        target = q * stats.count
+        seen = 0
+        for i, bucket_count in enumerate(stats.buckets):
+            seen += bucket_count
+            if seen >= target:
+                return self.buckets_ms[i] if i < len(self.buckets_ms) else stats.max_ms
+        return stats.max_ms
+
+    def snapshot(self) -> dict[str, dict[str, dict[str, Any]]]:
+        """
+        Return all measurements as plain data.
+
+        Returns:
+            {backend: {operation: {"count", "errors", "latency_ms", "bytes",
+            "avg_bytes", "hits", "misses", "hit_ratio"}}}. Latency holds
+            mean/min/max, approximate p50/p95/p99, and per-bucket counts
+            keyed by upper bound ("+Inf" for overflow).
+        """
+        result: dict[str, dict[str, dict[str, Any]]] = {}
+        for (backend, operation), stats in self._stats.items():
+            lookups = stats.hits + stats.misses
+            bounds = [str(b) for b in self.buckets_ms] + ["+Inf"]
+            result.setdefault(backend, {})[operation] = {
+                "count": stats.count,
+                "errors": stats.errors,
+                "latency_ms": {
+                    "mean": stats.total_ms / stats.count,
+                    "min": stats.min_ms,
+                    "max": stats.max_ms,
+                    "p50": self._percentile(stats, 0.50),
+                    "p95": self._percentile(stats, 0.95),
+                    "p99": self._percentile(stats, 0.99),
+                    "buckets": dict(zip(bounds, stats.buckets)),
+                },
+                "bytes": stats.total_bytes,
+                "avg_bytes": stats.total_bytes / stats.sized if stats.sized else None,
+                "hits": stats.hits,
+                "misses": stats.misses,
+                "hit_ratio": stats.hits / lookups if lookups else None,
+            }
+        return result
+
+    def reset(self) -> None:
+        """Drop all in-process measurements."""
+        self._stats.clear()
+
+
+def timed(
+    metrics: MemoryMetrics | None, backend: str, operation: str
+) -> AbstractContextManager:
+    """metrics.time(...) when metrics is set, otherwise a no-op context."""
+    if metrics is None:
+        return nullcontext(Measurement())
+    return metrics.time(backend, operation)
+
+
+class InstrumentedSerializer:
+    """Times a short-term backend's ValueSerializer and records encoded sizes."""
+
+    def __init__(self, serializer: Any, metrics: MemoryMetrics, backend: str):
+        """Wrap a serializer."""
+        self._serializer = serializer
+        self._metrics = metrics
+        self._backend = backend
+
+    def dumps(self, value: Any) -> bytes:
+        """Encode a value, recording time and encoded size."""
+        with self._metrics.time(self._backend, "serialize") as m:
+            data = self._serializer.dumps(value)
+            m.size = len(data)
+        return data
+
+    def loads(self, data: bytes | str) -> Any:
+        """Decode a value, recording time and encoded size."""
+        with self._metrics.time(self._backend, "deserialize") as m:
+            m.size = len(data)
+            return self._serializer.loads(data)
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate everything else to the wrapped serializer."""
+        return getattr(self._serializer, name)
+
+
+class InstrumentedShortTermMemory(BaseShortTermMemory):
+    """
+    Times every call on a short-term backend.
+
+    get/get_many/exists record hits and misses; a backend's serializer (if
+    any) is wrapped too, so encode/decode time and payload sizes show up
+    under the same backend name.
+    """
+
+    def __init__(self, backend: BaseShortTermMemory, metrics: MemoryMetrics, name: str):
+        """
+        Wrap a backend.
+
+        Args:
+            backend: Short-term backend to instrument
+            metrics: Where measurements are recorded
+            name: Backend label, e.g. "sqlite" or "redis"
+        """
+        self.backend = backend
+        self.metrics = metrics
+        self.name = name
+        from agenthelm.memory.short_term.redis import RedisShortTermMemory
+        from agenthelm.memory.short_term.sqlite import SqliteShortTermMemory
+
+        if isinstance(backend, (SqliteShortTermMemory, RedisShortTermMemory)):
+            backend.serializer = InstrumentedSerializer(
+                backend.serializer, metrics, name
+            )
+
+    async def get(self, key: str) -> Any | None:
+        """Get a value, recording a hit or miss."""
+        with self.metrics.time(self.name, "get") as m:
+            value = await self.backend.get(key)
+            m.hit = value is not None
+        return value
+
+    async def set(self, key: str, value: Any, ttl: int = 3600) -> None:
+        """Set a value."""
+        with self.metrics.time(self.name, "set"):
+            await self.backend.set(key, value, ttl)
+
+    async def delete(self, key: str) -> None:
+        """Delete a key."""
+        with self.metrics.time(self.name, "delete"):
+            await self.backend.delete(key)
+
+    async def exists(self, key: str) -> bool:
+        """Check a key, recording a hit or miss."""
+        with self.metrics.time(self.name, "exists") as m:
+            found = await self.backend.exists(key)
+            m.hit = found
+        return found
+
+    async def keys(self, pattern: str = "*") -> list[str]:
+        """List keys matching a pattern."""
+        with self.metrics.time(self.name, "keys"):
+            return await self.backend.keys(pattern)
+
+    async def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """Get multiple keys; the call counts as a hit if every key was found."""
+        with self.metrics.time(self.name, "get_many") as m:
+            result = await self.backend.get_many(keys)
+            m.hit = len(result) == len(set(keys))
+        return result
+
+    async def set_many(self, items: dict[str, Any], ttl: int = 3600) -> None:
+        """Set multiple keys."""
+        with self.metrics.time(self.name, "set_many"):
+            await self.backend.set_many(items, ttl)
+
+    async def delete_many(self, keys: list[str]) -> None:
+        """Delete multiple keys."""
+        with self.metrics.time(self.name, "delete_many"):
+            await self.backend.delete_many(keys)
+
+    async def delete_prefix(self, prefix: str) -> int:
+        """Delete every key starting with prefix."""
+        with self.metrics.time(self.name, "delete_prefix"):
+            return await self.backend.delete_prefix(prefix)
+
+    async def incr(self, key: str, amount: int = 1, ttl: int = 3600) -> int:
+        """Atomically increment a counter."""
+        with self.metrics.time(self.name, "incr"):
+            return await self.backend.incr(key, amount, ttl)
+
+    async def compare_and_set(
+        self, key: str, expected: Any, value: Any, ttl: int = 3600
+    ) -> bool:
+        """Compare-and-set, recording whether the write happened as a hit."""
+        with self.metrics.time(self.name, "compare_and_set") as m:
+            written = await self.backend.compare_and_set(key, expected, value, ttl)
+            m.hit = written
+        return written
+
+    async def set_if_absent(self, key: str, value: Any, ttl: int = 3600) -> bool:
+        """Set if absent, recording whether the write happened as a hit."""
+        with self.metrics.time(self.name, "set_if_absent") as m:
+            written = await self.backend.set_if_absent(key, value, ttl)
+            m.hit = written
+        return written
+
+    def clear(self) -> None:
+        """Clear all stored data."""
+        self.backend.clear()
+
+    async def close(self) -> None:
+        """Close the wrapped backend."""
+        await self.backend.close()
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate backend-specific attributes (stats, flush, ...)."""
+        return getattr(self.backend, name)
+
+
+class InstrumentedSemanticMemory(BaseSemanticMemory):
+    """
+    Times every call on a semantic backend.
+
+    Backends that accept a metrics attribute (SemanticMemory) additionally
+    break store/search down into embedding, Qdrant and lexical time.
+    """
+
+    def __init__(
+        self,
+        backend: BaseSemanticMemory,
+        metrics: MemoryMetrics,
+        name: str = "semantic",
+    ):
+        """
+        Wrap a backend.
+
+        Args:
+            backend: Semantic backend to instrument
+            metrics: Where measurements are recorded
+            name: Backend label
+        """
+        self.backend = backend
+        self.metrics = metrics
+        self.name = name
+        self.supports_filter_delete = backend.supports_filter_delete
+        from agenthelm.memory.semantic import SemanticMemory
+
+        if isinstance(backend, SemanticMemory):
+            backend.metrics = metrics
+
+    async def store(
+        self,
+        text: str,
+        metadata: dict[str, Any] | None = None,
+        id: str | None = None,
+    ) -> str:
+        """Store text, recording its size."""
+        with self.metrics.time(self.name, "store") as m:
+            m.size = len(text.encode())
+            return await self.backend.store(text, metadata, id)
+
+    async def store_many(
+        self,
+        texts: list[str],
+        metadatas: list[dict[str, Any]] | None = None,
+    ) -> list[str]:
+        """Store multiple texts, recording their total size."""
+        with self.metrics.time(self.name, "store_many") as m:
+            m.size = sum(len(text.encode()) for text in texts)
+            return await self.backend.store_many(texts, metadatas)
+
+    async def search(
+        self,
+        query: str,
+        top_k: int = 5,
+        filter: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> list:
+        """Search, recording a hit when any result is returned."""
+        with self.metrics.time(self.name, "search") as m:
+            results = await self.backend.search(query, top_k, filter, **kwargs)
+            m.hit = bool(results)
+        return results
+
+    async def delete(self, ids: list[str]) -> None:
+        """Delete entries by ID."""
+        with self.metrics.time(self.name, "delete"):
+            await self.backend.delete(ids)
+
+    async def delete_by_filter(self, filter: dict[str, Any]) -> None:
+        """Delete entries matching a metadata filter."""
+        with self.metrics.time(self.name, "delete_by_filter"):
+            await self.backend.delete_by_filter(filter)
+
+    def warmup(self) -> None:
+        """Warm up the wrapped backend."""
+        self.backend.warmup()
+
+    async def close(self) -> None:
+        """Close the wrapped backend."""
+        await self.backend.close()
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate backend-specific attributes (fetch_texts, lexical, ...)."""
+        return getattr(self.backend, name)
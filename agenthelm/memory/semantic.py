@@ -1,19 +1,32 @@
 """Semantic memory backend using Qdrant with three modes: memory, local, network."""
 
 import uuid
-from typing import Any
+from pathlib import Path
+from typing import Any, ClassVar
 
 from qdrant_client import QdrantClient
 from qdrant_client.models import (
+    BinaryQuantization,
+    BinaryQuantizationConfig,
     Distance,
     PointStruct,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
     VectorParams,
     Filter,
     FieldCondition,
     MatchValue,
+    FilterSelector,
+    PayloadSchemaType,
+    PayloadSelectorExclude,
 )
 
+from agenthelm.memory import embeddings
 from agenthelm.memory.base import BaseSemanticMemory, SearchResult
+from agenthelm.memory.lexical import BM25Index, reciprocal_rank_fusion
+from agenthelm.memory.metrics import MemoryMetrics, timed
+from agenthelm.memory.text_store import BaseTextStore, SqliteTextStore
 
 
 class SemanticMemory(BaseSemanticMemory):
@@ -36,10 +49,27 @@ class SemanticMemory(BaseSemanticMemory):
 
         # Network (Docker/Cloud)
         memory = SemanticMemory(mode="network", url="http://localhost:6333")
+
+        # Smaller model with int8-quantized vectors
+        memory = SemanticMemory(
+            embedding_model="BAAI/bge-small-en-v1.5", quantization="scalar"
+        )
+
+        # Text bodies kept out of Qdrant payloads, in a SQLite side store
+        memory = SemanticMemory(
+            mode="local", path="./data/qdrant", text_store="./data/texts.db"
+        )
     """
 
     DEFAULT_COLLECTION = "agenthelm_memory"
     DEFAULT_EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+    DEFAULT_INDEXED_FIELDS: ClassVar[dict[str, PayloadSchemaType]] = {
+        "session_id": PayloadSchemaType.KEYWORD,
+    }
+    supports_filter_delete = True
+
+    # Vector dimension per embedding model, probed once and shared by instances
+    _dimension_cache: ClassVar[dict[str, int]] = {}
 
     def __init__(
         self,
@@ -48,6 +78,12 @@ class SemanticMemory(BaseSemanticMemory):
         url: str | None = None,
         collection_name: str | None = None,
         embedding_model: str | None = None,
+        vector_size: int | None = None,
+        quantization: str | ScalarQuantization | BinaryQuantization | None = None,
+        eager_load: bool = False,
+        text_store: BaseTextStore | str | Path | None = None,
+        hybrid: bool = False,
+        indexed_fields: dict[str, PayloadSchemaType | str] | None = None,
     ):
         """
         Initialize SemanticMemory.
@@ -58,10 +94,39 @@ class SemanticMemory(BaseSemanticMemory):
             url: Qdrant server URL for network mode
             collection_name: Name of the Qdrant collection
             embedding_model: FastEmbed model name
+            vector_size: Embedding dimension. Probed from the model if not given.
+            quantization: "scalar" (int8), "binary", or a Qdrant quantization
+                config applied when the collection is created
+            eager_load: Start loading the embedding model in a background
+                thread right away instead of on the first store/search
+            text_store: Keep text bodies out of Qdrant payloads, in this store
+                (or a SqliteTextStore at this path). Search then moves only
+                metadata and fetches the top-k bodies in one query.
+            hybrid: Maintain a BM25 inverted index alongside the vectors,
+                enabling the "lexical", "hybrid" and "auto" search modes.
+                The index lives in this process: it is built by scrolling
+                the whole collection on the first non-vector search, then
+                only sees writes made through this instance. With several
+                workers on one network collection, other workers' writes
+                are missing from it until the next rebuild (a restart).
+            indexed_fields: Payload fields to index for fast filtering and
+                delete_by_filter, as {field: schema} (e.g. "keyword",
+                "integer"). Defaults to session_id. Network mode only; local
+                Qdrant ignores payload indexes.
         """
         self.mode = mode
         self.collection_name = collection_name or self.DEFAULT_COLLECTION
         self.embedding_model = embedding_model or self.DEFAULT_EMBEDDING_MODEL
+        self._vector_size = vector_size
+        self.quantization = quantization
+        if isinstance(text_store, (str, Path)):
+            text_store = SqliteTextStore(text_store)
+        self.text_store = text_store
+        self.lexical = BM25Index() if hybrid else None
+        self.indexed_fields = {
+            **self.DEFAULT_INDEXED_FIELDS,
+            **{k: PayloadSchemaType(v) for k, v in (indexed_fields or {}).items()},
+        }
 
         # Initialize Qdrant client based on mode
         if mode == "memory":
@@ -81,36 +146,170 @@ class SemanticMemory(BaseSemanticMemory):
 
         # Track if collection is initialized
         self._collection_initialized = False
+        # An existing collection's BM25 index is built on first lexical use
+        self._lexical_built = False
+
+        # Set by MemoryHub(instrument=True) to time embedding and search stages
+        self.metrics: MemoryMetrics | None = None
+
+        if eager_load:
+            embeddings.warmup([self.embedding_model], background=True)
+
+    def warmup(self) -> None:
+        """Load the embedding model and probe its dimension (blocking)."""
+        embeddings.warmup([self.embedding_model])
+        _ = self.vector_size
+
+    @property
+    def vector_size(self) -> int:
+        """Embedding dimension of the configured model (probed once per model)."""
+        if self._vector_size is None:
+            size = self._dimension_cache.get(self.embedding_model)
+            if size is None:
+                size = len(self._embed_text("dimension probe"))
+                self._dimension_cache[self.embedding_model] = size
+            self._vector_size = size
+        return self._vector_size
+
+    def _quantization_config(self) -> ScalarQuantization | BinaryQuantization | None:
+        """Build the collection-level quantization config."""
+        if self.quantization is None or not isinstance(self.quantization, str):
+            return self.quantization
+        if self.quantization == "scalar":
+            return ScalarQuantization(
+                scalar=ScalarQuantizationConfig(
+                    type=ScalarType.INT8, quantile=0.99, always_ram=True
+                )
+            )
+        if self.quantization == "binary":
+            return BinaryQuantization(binary=BinaryQuantizationConfig(always_ram=True))
+        raise ValueError(
+            f"Unknown quantization: {self.quantization}. Use 'scalar' or 'binary'."
+        )
+
+    def _create_collection(self, collection_name: str) -> None:
+        """Create a collection sized for the configured embedding model."""
+        self.client.create_collection(
+            collection_name=collection_name,
+            vectors_config=VectorParams(
+                size=self.vector_size, distance=Distance.COSINE
+            ),
+            quantization_config=self._quantization_config(),
+        )
+
+    def _collection_vector_size(self, collection_name: str) -> int | None:
+        """Return the vector size of an existing collection, or None if missing."""
+        if not self.client.collection_exists(collection_name):
+            return None
+        vectors = self.client.get_collection(collection_name).config.params.vectors
+        if isinstance(vectors, dict):
+            vectors = next(iter(vectors.values()))
+        return vectors.size if vectors is not None else None
 
     def _ensure_collection(self) -> None:
         """Create collection if it doesn't exist."""
         if self._collection_initialized:
             return
 
-        collections = self.client.get_collections().collections
-        exists = any(c.name == self.collection_name for c in collections)
+        existing_size = self._collection_vector_size(self.collection_name)
 
-        if not exists:
-            # Get embedding dimension from the model
-            # all-MiniLM-L6-v2 produces 384-dimensional embeddings
-            self.client.create_collection(
-                collection_name=self.collection_name,
-                vectors_config=VectorParams(size=384, distance=Distance.COSINE),
+        if existing_size is None:
+            self._create_collection(self.collection_name)
+            self._ensure_payload_indexes()
+            self._lexical_built = True  # Nothing to index yet
+        elif existing_size != self.vector_size:
+            raise ValueError(
+                f"Collection '{self.collection_name}' stores {existing_size}-dim "
+                f"vectors but '{self.embedding_model}' produces {self.vector_size}. "
+                "Use a new collection_name and call migrate_collection() to "
+                "re-embed the existing memories."
             )
+        else:
+            self._ensure_payload_indexes()
 
         self._collection_initialized = True
 
+    def _ensure_payload_indexes(self) -> None:
+        """Create payload indexes for declared filter fields that lack one."""
+        # Local Qdrant has no payload indexes (filters always scan)
+        if self.mode != "network" or not self.indexed_fields:
+            return
+
+        existing = self.client.get_collection(self.collection_name).payload_schema
+        for field, schema in self.indexed_fields.items():
+            if field not in existing:
+                self.client.create_payload_index(
+                    collection_name=self.collection_name,
+                    field_name=field,
+                    field_schema=schema,
+                )
+
+    def _rebuild_lexical_index(self, batch_size: int = 256) -> None:
+        """Index an existing collection's texts (e.g. after a restart)."""
+        lexical = self.lexical
+        if lexical is None:
+            return
+        lexical.clear()
+        offset = None
+        while True:
+            records, offset = self.client.scroll(
+                collection_name=self.collection_name,
+                limit=batch_size,
+                offset=offset,
+                with_payload=True,
+            )
+            external = {}
+            if self.text_store and records:
+                external = self.text_store.get_many([str(r.id) for r in records])
+            for record in records:
+                payload = record.payload or {}
+                text = payload.get("text", external.get(str(record.id), ""))
+                metadata = {k: v for k, v in payload.items() if k != "text"}
+                lexical.add(str(record.id), text, metadata)
+            if offset is None:
+                break
+
+    def _embed_texts(self, texts: list[str]) -> list[list[float]]:
+        """Generate embeddings for a batch of texts using FastEmbed."""
+        # Models are loaded once per process and shared across instances
+        model = embeddings.get_embedding_model(self.embedding_model)
+        with timed(self.metrics, "semantic", "embed") as m:
+            m.size = sum(len(text.encode()) for text in texts)
+            return [embedding.tolist() for embedding in model.embed(texts)]
+
     def _embed_text(self, text: str) -> list[float]:
         """Generate embedding for text using FastEmbed."""
-        # Use Qdrant's built-in embedding via the client
-        # This requires qdrant-client[fastembed]
-        from fastembed import TextEmbedding
-
-        if not hasattr(self, "_embedding_model"):
-            self._embedding_model = TextEmbedding(model_name=self.embedding_model)
+        return self._embed_texts([text])[0]
 
-        embeddings = list(self._embedding_model.embed([text]))
-        return embeddings[0].tolist()
+    def _build_payload(self, text: str, metadata: dict[str, Any] | None) -> dict:
+        """Build a point payload, leaving the text out if stored externally."""
+        payload = {} if self.text_store else {"text": text}
+        if metadata:
+            payload.update(metadata)
+        return payload
+
+    def _build_filter(self, filter: dict[str, Any] | None) -> Filter | None:
+        """Convert a {field: value} dict into a Qdrant filter."""
+        if not filter:
+            return None
+        conditions = [
+            FieldCondition(key=k, match=MatchValue(value=v)) for k, v in filter.items()
+        ]
+        return Filter(must=conditions)
+
+    def _payload_selector(
+        self, with_payload: bool | list[str], with_text: bool
+    ) -> bool | list[str] | PayloadSelectorExclude:
+        """Translate a search projection into a Qdrant payload selector."""
+        inline_text = with_text and not self.text_store
+        if with_payload is True:
+            if inline_text or self.text_store:
+                return True
+            return PayloadSelectorExclude(exclude=["text"])
+        fields = list(with_payload) if with_payload else []
+        if inline_text:
+            fields.append("text")
+        return fields or False
 
     async def store(
         self,
@@ -126,59 +325,164 @@ class SemanticMemory(BaseSemanticMemory):
 
         embedding = self._embed_text(text)
 
-        payload = {"text": text}
-        if metadata:
-            payload.update(metadata)
+        if self.text_store:
+            self.text_store.put_many({id: text})
 
-        self.client.upsert(
-            collection_name=self.collection_name,
-            points=[
-                PointStruct(
-                    id=id,
-                    vector=embedding,
-                    payload=payload,
-                )
-            ],
-        )
+        with timed(self.metrics, "semantic", "qdrant_upsert"):
+            self.client.upsert(
+                collection_name=self.collection_name,
+                points=[
+                    PointStruct(
+                        id=id,
+                        vector=embedding,
+                        payload=self._build_payload(text, metadata),
+                    )
+                ],
+            )
+
+        if self.lexical is not None:
+            self.lexical.add(id, text, metadata)
 
         return id
 
+    @staticmethod
+    def _is_keyword_query(query: str) -> bool:
+        """Heuristic: quoted queries, or short ones with identifier-like tokens."""
+        query = query.strip()
+        if len(query) > 1 and query.startswith('"') and query.endswith('"'):
+            return True
+        words = query.split()
+        if not words or len(words) > 3:
+            return False
+        return any(any(ch.isdigit() or ch in "-_./:#" for ch in word) for word in words)
+
+    def _vector_search(
+        self,
+        query: str,
+        limit: int,
+        filter: dict[str, Any] | None,
+        selector: bool | list[str] | PayloadSelectorExclude,
+    ) -> list:
+        """Embed the query and run a Qdrant nearest-neighbour search."""
+        vector = self._embed_text(query)
+        with timed(self.metrics, "semantic", "qdrant_search"):
+            return self.client.query_points(
+                collection_name=self.collection_name,
+                query=vector,
+                query_filter=self._build_filter(filter),
+                limit=limit,
+                with_payload=selector,
+            ).points
+
     async def search(
         self,
         query: str,
         top_k: int = 5,
         filter: dict[str, Any] | None = None,
+        with_payload: bool | list[str] = True,
+        with_text: bool = True,
+        mode: str = "vector",
     ) -> list[SearchResult]:
-        """Search for similar texts. Returns ranked results."""
+        """
+        Search for similar texts. Returns ranked results.
+
+        Args:
+            query: Search query
+            top_k: Number of results to return
+            filter: Exact-match metadata filter {field: value}
+            with_payload: True for all metadata, False for none, or a list of
+                metadata fields to return
+            with_text: If False, skip fetching text bodies (result text is "").
+                Fetch them later with fetch_texts().
+            mode: "vector" (default), "lexical" (BM25 only, no embedding),
+                "hybrid" (vector + BM25 fused with Reciprocal Rank Fusion), or
+                "auto" (lexical for identifier lookups, hybrid otherwise).
+                Non-vector modes require hybrid=True.
+        """
         self._ensure_collection()
+        selector = self._payload_selector(with_payload, with_text)
 
-        query_embedding = self._embed_text(query)
+        if mode == "vector":
+            points = self._vector_search(query, top_k, filter, selector)
+            hits = [(str(p.id), p.score, p.payload or {}) for p in points]
+            return self._to_results(hits, with_text)
 
-        # Build filter if provided
-        qdrant_filter = None
-        if filter:
-            conditions = [
-                FieldCondition(key=k, match=MatchValue(value=v))
-                for k, v in filter.items()
-            ]
-            qdrant_filter = Filter(must=conditions)
+        if mode not in ("lexical", "hybrid", "auto"):
+            raise ValueError(
+                f"Unknown search mode: {mode}. "
+                "Use 'vector', 'lexical', 'hybrid', or 'auto'."
+            )
+        if self.lexical is None:
+            raise ValueError(f"Search mode '{mode}' requires hybrid=True.")
+        if not self._lexical_built:
+            self._rebuild_lexical_index()
+            self._lexical_built = True
+
+        # Over-fetch candidates so fusion has something to re-rank
+        candidates = top_k * 2
+        with timed(self.metrics, "semantic", "lexical_search"):
+            lexical_ranking = self.lexical.search(
+                query, top_k=candidates, filter=filter
+            )
 
-        results = self.client.search(
-            collection_name=self.collection_name,
-            query_vector=query_embedding,
-            query_filter=qdrant_filter,
-            limit=top_k,
-        )
+        if mode == "lexical" or (
+            mode == "auto" and lexical_ranking and self._is_keyword_query(query)
+        ):
+            ranking = lexical_ranking[:top_k]
+            payloads = {}
+        else:
+            points = self._vector_search(query, candidates, filter, selector)
+            payloads = {str(p.id): p.payload or {} for p in points}
+            vector_ranking = [(str(p.id), p.score) for p in points]
+            ranking = reciprocal_rank_fusion([vector_ranking, lexical_ranking])
+            ranking = ranking[:top_k]
+
+        # Lexical-only hits still need their payloads
+        missing = [doc_id for doc_id, _ in ranking if doc_id not in payloads]
+        if missing and selector is not False:
+            for record in self.client.retrieve(
+                collection_name=self.collection_name,
+                ids=missing,
+                with_payload=selector,
+            ):
+                payloads[str(record.id)] = record.payload or {}
 
-        return [
-            SearchResult(
-                id=str(hit.id),
-                text=hit.payload.get("text", ""),
-                score=hit.score,
-                metadata={k: v for k, v in hit.payload.items() if k != "text"},
+        hits = [(doc_id, score, payloads.get(doc_id, {})) for doc_id, score in ranking]
+        return self._to_results(hits, with_text)
+
+    def _to_results(
+        self, hits: list[tuple[str, float, dict]], with_text: bool
+    ) -> list[SearchResult]:
+        """Build SearchResults from (id, score, payload) hits."""
+        # Only the top-k bodies are fetched from the side store, in one query
+        texts = {}
+        if with_text and self.text_store:
+            with timed(self.metrics, "semantic", "text_fetch"):
+                texts = self.text_store.get_many([doc_id for doc_id, _, _ in hits])
+
+        results = []
+        for doc_id, score, payload in hits:
+            text = payload.get("text", texts.get(doc_id, "")) if with_text else ""
+            results.append(
+                SearchResult(
+                    id=doc_id,
+                    text=text,
+                    score=score,
+                    metadata={k: v for k, v in payload.items() if k != "text"},
+                )
             )
-            for hit in results
-        ]
+        return results
+
+    async def fetch_texts(self, ids: list[str]) -> dict[str, str]:
+        """Fetch text bodies by ID (e.g. after a search with with_text=False)."""
+        if self.text_store:
+            return self.text_store.get_many(ids)
+
+        self._ensure_collection()
+        records = self.client.retrieve(
+            collection_name=self.collection_name, ids=ids, with_payload=["text"]
+        )
+        return {str(r.id): (r.payload or {}).get("text", "") for r in records}
 
     async def delete(self, ids: list[str]) -> None:
         """Delete entries by ID."""
@@ -188,6 +492,48 @@ class SemanticMemory(BaseSemanticMemory):
             collection_name=self.collection_name,
             points_selector=ids,
         )
+        if self.text_store:
+            self.text_store.delete_many(ids)
+        if self.lexical is not None:
+            self.lexical.remove(ids)
+
+    async def delete_by_filter(self, filter: dict[str, Any]) -> None:
+        """
+        Delete every entry whose metadata matches the filter.
+
+        Runs server-side against the payload index, so it does not depend on
+        IDs tracked in-process and stays fast as the collection grows.
+
+        Args:
+            filter: Exact-match metadata filter {field: value}
+        """
+        qdrant_filter = self._build_filter(filter)
+        if qdrant_filter is None:
+            raise ValueError("delete_by_filter requires a non-empty filter.")
+
+        self._ensure_collection()
+
+        if self.text_store is None and self.lexical is None:
+            self.client.delete(
+                collection_name=self.collection_name,
+                points_selector=FilterSelector(filter=qdrant_filter),
+            )
+            return
+
+        # Side structures are keyed by ID, so collect the matching IDs first
+        offset = None
+        while True:
+            records, offset = self.client.scroll(
+                collection_name=self.collection_name,
+                scroll_filter=qdrant_filter,
+                limit=1000,
+                offset=offset,
+                with_payload=False,
+            )
+            if records:
+                await self.delete([str(record.id) for record in records])
+            if offset is None:
+                break
 
     async def store_many(
         self,
@@ -199,38 +545,135 @@ class SemanticMemory(BaseSemanticMemory):
 
         points = []
         ids = []
+        vectors = self._embed_texts(texts) if texts else []
 
-        for i, text in enumerate(texts):
+        for i, (text, vector) in enumerate(zip(texts, vectors)):
             id = str(uuid.uuid4())
             ids.append(id)
 
-            embedding = self._embed_text(text)
-
-            payload = {"text": text}
-            if metadatas and i < len(metadatas):
-                payload.update(metadatas[i])
+            metadata = metadatas[i] if metadatas and i < len(metadatas) else None
 
             points.append(
                 PointStruct(
                     id=id,
-                    vector=embedding,
-                    payload=payload,
+                    vector=vector,
+                    payload=self._build_payload(text, metadata),
                 )
             )
 
-        self.client.upsert(
-            collection_name=self.collection_name,
-            points=points,
-        )
+        if self.text_store:
+            self.text_store.put_many(dict(zip(ids, texts)))
+
+        with timed(self.metrics, "semantic", "qdrant_upsert"):
+            self.client.upsert(
+                collection_name=self.collection_name,
+                points=points,
+            )
+
+        if self.lexical is not None:
+            for i, (id, text) in enumerate(zip(ids, texts)):
+                metadata = metadatas[i] if metadatas and i < len(metadatas) else None
+                self.lexical.add(id, text, metadata)
 
         return ids
 
+    async def migrate_collection(
+        self,
+        source_collection: str,
+        batch_size: int = 64,
+        drop_source: bool = False,
+    ) -> int:
+        """
+        Re-embed every entry of another collection into this one.
+
+        Use this after switching embedding models: point a new SemanticMemory
+        at a fresh collection name and migrate the old collection into it.
+        IDs and metadata are preserved.
+
+        Args:
+            source_collection: Collection written with the previous model
+            batch_size: Number of entries to re-embed per batch
+            drop_source: Delete the source collection once migration completes
+
+        Returns:
+            Number of migrated entries
+        """
+        if source_collection == self.collection_name:
+            raise ValueError("Cannot migrate a collection into itself.")
+
+        self._ensure_collection()
+
+        migrated = 0
+        offset = None
+        while True:
+            records, offset = self.client.scroll(
+                collection_name=source_collection,
+                limit=batch_size,
+                offset=offset,
+                with_payload=True,
+            )
+            if records:
+                external = {}
+                if self.text_store:
+                    external = self.text_store.get_many([str(r.id) for r in records])
+                payloads = [dict(r.payload or {}) for r in records]
+                texts = [
+                    payload.get("text", external.get(str(r.id), ""))
+                    for r, payload in zip(records, payloads)
+                ]
+                vectors = self._embed_texts(texts)
+                if self.text_store:
+                    # Inline texts from the source move out of the payload
+                    for payload in payloads:
+                        payload.pop("text", None)
+                    self.text_store.put_many(
+                        {str(r.id): text for r, text in zip(records, texts)}
+                    )
+                self.client.upsert(
+                    collection_name=self.collection_name,
+                    points=[
+                        PointStruct(id=record.id, vector=vector, payload=payload)
+                        for record, vector, payload in zip(records, vectors, payloads)
+                    ],
+                )
+                if self.lexical is not None:
+                    for record, text, payload in zip(records, texts, payloads):
+                        metadata = {k: v for k, v in payload.items() if k != "text"}
+                        self.lexical.add(str(record.id), text, metadata)
+                migrated += len(records)
+            if offset is None:
+                break
+
+        if drop_source:
+            self.client.delete_collection(source_collection)
+
+        return migrated
+
     async def close(self) -> None:
-        """Close the Qdrant client."""
+        """Close the Qdrant client and text store."""
         self.client.close()
+        if self.text_store:
+            self.text_store.close()
 
     def clear(self) -> None:
-        """Delete all entries in the collection."""
+        """Delete all entries in the collection, and their text bodies."""
         if self._collection_initialized:
+            if self.text_store:
+                # The text store may be shared, so only drop this collection's IDs
+                offset = None
+                while True:
+                    records, offset = self.client.scroll(
+                        collection_name=self.collection_name,
+                        limit=1000,
+                        offset=offset,
+                        with_payload=False,
+                    )
+                    if records:
+                        self.text_store.delete_many([str(r.id) for r in records])
+                    if offset is None:
+                        break
             self.client.delete_collection(self.collection_name)
             self._collection_initialized = False
+            self._lexical_built = False
+        if self.lexical is not None:
+            self.lexical.clear()
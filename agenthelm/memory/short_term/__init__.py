@@ -2,10 +2,12 @@
 
 from agenthelm.memory.short_term.in_memory import InMemoryShortTermMemory
 from agenthelm.memory.short_term.sqlite import SqliteShortTermMemory
+from agenthelm.memory.short_term.tiered import TieredShortTermMemory
 
 __all__ = [
     "InMemoryShortTermMemory",
     "SqliteShortTermMemory",
+    "TieredShortTermMemory",
 ]
 
 # RedisShortTermMemory is not exported by default to avoid redis dependency
@@ -0,0 +1,239 @@
+"""Value codecs and framing for the persistent short-term memory backends.
+
+Values are encoded by a codec (JSON, msgpack, or pickle) and optionally
+zlib-compressed. Anything other than plain uncompressed JSON is written in a
+small framed format:
+
+    b"\\x00AH" | codec id (1 byte) | flags (1 byte) | payload
+
+JSON text never starts with a NUL byte, so framed values and plain JSON
+values (including those written before codecs existed) can be told apart on
+read. A serializer only decodes its own codec and JSON: the codec id in a
+frame is written by whoever can write to the store, so it is never trusted
+to pick a decoder (a pickle frame read by a JSON store would run code).
+
+Example:
+    serializer = ValueSerializer(codec="msgpack", compress_threshold=1024)
+    data = serializer.dumps({"state": b"raw bytes"})
+    serializer.loads(data)
+"""
+
+import json
+import pickle
+import zlib
+from abc import ABC, abstractmethod
+from typing import Any, Protocol
+
+MAGIC = b"\x00AH"
+_HEADER_SIZE = len(MAGIC) + 2
+_FLAG_ZLIB = 0x01
+
+# msgpack extension type for NumPy arrays
+_NDARRAY_EXT = 1
+
+
+class Codec(ABC):
+    """Abstract base class for value codecs."""
+
+    name: str
+    codec_id: int
+
+    @abstractmethod
+    def encode(self, value: Any) -> bytes:
+        """Encode a value to bytes."""
+        ...
+
+    @abstractmethod
+    def decode(self, data: bytes) -> Any:
+        """Decode bytes produced by encode()."""
+        ...
+
+
+class JsonCodec(Codec):
+    """JSON codec. Portable and human-readable; the default."""
+
+    name = "json"
+    codec_id = 1
+
+    def encode(self, value: Any) -> bytes:
+        """Encode a JSON-serializable value."""
+        return json.dumps(value).encode()
+
+    def decode(self, data: bytes) -> Any:
+        """Decode JSON bytes."""
+        return json.loads(data)
+
+
+class MsgpackCodec(Codec):
+    """
+    msgpack codec. Compact and fast, with native bytes support.
+
+    NumPy arrays are stored as an extension type (dtype, shape, raw buffer)
+    and decoded back to arrays. Tuples decode as lists, as with JSON.
+    """
+
+    name = "msgpack"
+    codec_id = 2
+
+    def __init__(self):
+        """Initialize the codec. Requires the msgpack package."""
+        try:
+            import msgpack
+        except ImportError:
+            raise ImportError(
+                "msgpack package is required for the msgpack codec. "
+                "Install with: pip install msgpack"
+            )
+        self._msgpack = msgpack
+
+    def _default(self, obj: Any) -> Any:
+        """Encode types msgpack doesn't support natively."""
+        if hasattr(obj, "dtype") and hasattr(obj, "tobytes"):
+            payload = self._msgpack.packb(
+                [obj.dtype.str, list(obj.shape), obj.tobytes()]
+            )
+            return self._msgpack.ExtType(_NDARRAY_EXT, payload)
+        raise TypeError(f"Object of type {type(obj).__name__} is not serializable")
+
+    def _ext_hook(self, code: int, data: bytes) -> Any:
+        """Decode extension types written by _default()."""
+        if code == _NDARRAY_EXT:
+            import numpy as np
+
+            dtype, shape, buffer = self._msgpack.unpackb(data)
+            return np.frombuffer(buffer, dtype=dtype).reshape(shape).copy()
+        return self._msgpack.ExtType(code, data)
+
+    def encode(self, value: Any) -> bytes:
+        """Encode a value with msgpack."""
+        return self._msgpack.packb(value, default=self._default, use_bin_type=True)
+
+    def decode(self, data: bytes) -> Any:
+        """Decode msgpack bytes."""
+        return self._msgpack.unpackb(data, ext_hook=self._ext_hook, raw=False)
+
+
+class PickleCodec(Codec):
+    """
+    pickle codec. Round-trips arbitrary Python objects.
+
+    Only use with trusted stores: unpickling data written by an attacker
+    executes arbitrary code.
+    """
+
+    name = "pickle"
+    codec_id = 3
+
+    def encode(self, value: Any) -> bytes:
+        """Pickle a value."""
+        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def decode(self, data: bytes) -> Any:
+        """Unpickle bytes."""
+        return pickle.loads(data)
+
+
+_CODECS: dict[str, type[Codec]] = {
+    "json": JsonCodec,
+    "msgpack": MsgpackCodec,
+    "pickle": PickleCodec,
+}
+_CODEC_IDS: dict[int, type[Codec]] = {cls.codec_id: cls for cls in _CODECS.values()}
+
+
+def get_codec(codec: str | Codec) -> Codec:
+    """Resolve a codec name ("json", "msgpack", "pickle") or instance."""
+    if isinstance(codec, Codec):
+        return codec
+    if codec not in _CODECS:
+        raise ValueError(
+            f"Unknown codec '{codec}'. Expected one of: {', '.join(_CODECS)}"
+        )
+    return _CODECS[codec]()
+
+
+class Serializer(Protocol):
+    """What the persistent backends need from their serializer."""
+
+    def dumps(self, value: Any) -> bytes: ...
+
+    def loads(self, data: bytes | str) -> Any: ...
+
+
+class ValueSerializer:
+    """
+    Encodes short-term memory values with a codec and optional compression.
+
+    Reads accept values framed with the configured codec or JSON, plus
+    plain JSON (str or bytes) as written by earlier versions. Frames naming
+    any other codec are rejected; in particular pickle frames are only
+    decoded by a serializer configured with codec="pickle".
+    """
+
+    def __init__(
+        self,
+        codec: str | Codec = "json",
+        compress_threshold: int | None = 4096,
+        compression_level: int = 6,
+    ):
+        """
+        Initialize the serializer.
+
+        Args:
+            codec: Codec name or instance used for writes
+            compress_threshold: Encoded size in bytes at or above which values
+                are zlib-compressed (None disables compression)
+            compression_level: zlib compression level (1-9)
+        """
+        self.codec = get_codec(codec)
+        self.compress_threshold = compress_threshold
+        self.compression_level = compression_level
+        self._decoders: dict[int, Codec] = {
+            JsonCodec.codec_id: JsonCodec(),
+            self.codec.codec_id: self.codec,
+        }
+
+    def dumps(self, value: Any) -> bytes:
+        """Encode a value for storage."""
+        # Integers are always plain decimal text, whatever the codec, so
+        # counters stay readable by native increments (INCRBY, SQL CAST)
+        if type(value) is int:
+            return str(value).encode()
+
+        data = self.codec.encode(value)
+        flags = 0
+        if self.compress_threshold is not None and len(data) >= self.compress_threshold:
+            compressed = zlib.compress(data, self.compression_level)
+            if len(compressed) < len(data):
+                data = compressed
+                flags |= _FLAG_ZLIB
+
+        # Plain JSON stays unframed so existing readers can still parse it
+        if flags == 0 and isinstance(self.codec, JsonCodec):
+            return data
+        return MAGIC + bytes((self.codec.codec_id, flags)) + data
+
+    def loads(self, data: bytes | str) -> Any:
+        """Decode a stored value, framed or legacy JSON."""
+        if isinstance(data, str):
+            return json.loads(data)
+        if not data.startswith(MAGIC):
+            return json.loads(data)
+
+        codec_id, flags = data[len(MAGIC)], data[len(MAGIC) + 1]
+        payload = data[_HEADER_SIZE:]
+        if flags & _FLAG_ZLIB:
+            payload = zlib.decompress(payload)
+        return self._decoder(codec_id).decode(payload)
+
+    def _decoder(self, codec_id: int) -> Codec:
+        """Get the codec for a frame's codec id, if this serializer accepts it."""
+        decoder = self._decoders.get(codec_id)
+        if decoder is None:
+            if codec_id not in _CODEC_IDS:
+                raise ValueError(f"Unknown codec id {codec_id} in stored value")
+            raise ValueError(
+                f"Stored value uses the '{_CODEC_IDS[codec_id].name}' codec but "
+                f"this store is configured for '{self.codec.name}'"
+            )
+        return decoder
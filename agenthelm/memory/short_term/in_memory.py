@@ -1,42 +1,192 @@
-"""In-memory short-term memory backend with lazy TTL expiration."""
+"""In-memory short-term memory backend with heap-driven TTL expiration."""
 
+import fnmatch
+import heapq
+import sys
+import threading
 import time
+from collections import OrderedDict
 from typing import Any
 
 from agenthelm.memory.base import BaseShortTermMemory
+from agenthelm.memory.short_term.patterns import (
+    NAMESPACE_SEP,
+    is_prefix_pattern,
+    literal_prefix,
+    namespace_prefixes,
+)
+
+
+def _estimate_size(value: Any) -> int:
+    """Approximate the memory footprint of a value in bytes."""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(_estimate_size(k) + _estimate_size(v) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(_estimate_size(item) for item in value)
+    return size
 
 
 class InMemoryShortTermMemory(BaseShortTermMemory):
     """
     In-memory key-value store with TTL support.
 
-    Uses lazy expiration: expired entries are removed on access.
+    Expired entries are evicted actively: a min-heap ordered by expiry time
+    is drained on every write (amortized O(log n)), so keys that are written
+    once and never read do not accumulate. Optional max_entries/max_bytes
+    bounds evict least-recently-used entries. Keys are indexed by their
+    ':'-delimited namespaces, so keys("session:abc:*") only visits keys under
+    "session:abc:".
     No external dependencies required.
 
     Example:
         memory = InMemoryShortTermMemory()
         await memory.set("user:123:name", "Alice", ttl=3600)
         name = await memory.get("user:123:name")
+
+        # Bounded cache
+        memory = InMemoryShortTermMemory(max_entries=10_000, max_bytes=64 << 20)
+        memory.stats  # {"entries": ..., "bytes": ..., "evicted_expired": ...}
     """
 
-    def __init__(self):
-        # Storage: {key: (value, expiry_timestamp)}
+    def __init__(
+        self,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+    ):
+        """
+        Initialize in-memory short-term memory.
+
+        Args:
+            max_entries: Maximum number of live entries (LRU eviction beyond)
+            max_bytes: Approximate maximum size of stored values in bytes
+                (LRU eviction beyond)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        # Storage: {key: (value, expiry_timestamp)}, ordered by recency of use
         # expiry_timestamp is None for no expiration
-        self._store: dict[str, tuple[Any, float | None]] = {}
+        self._store: OrderedDict[str, tuple[Any, float | None]] = OrderedDict()
+        # Min-heap of (expiry_timestamp, key). Entries go stale when a key is
+        # overwritten or deleted; stale entries are skipped when popped.
+        self._expiry_heap: list[tuple[float, str]] = []
+        # Approximate value sizes, tracked only when max_bytes is set
+        self._sizes: dict[str, int] = {}
+        self._total_bytes = 0
+        # Namespace index: {"session:abc:": {keys starting with it}}
+        self._namespaces: dict[str, set[str]] = {}
+
+        self.evicted_expired = 0
+        self.evicted_lru = 0
+
+        # Guards every access to the store, heap and indexes, so the store can
+        # be shared across threads (BackgroundLoop, to_thread callers) and
+        # incr/compare_and_set stay atomic
+        self._lock = threading.Lock()
+
+    def _index_key(self, key: str) -> None:
+        """Add a new key to the namespace index."""
+        for prefix in namespace_prefixes(key):
+            self._namespaces.setdefault(prefix, set()).add(key)
+
+    def _unindex_key(self, key: str) -> None:
+        """Remove a key from the namespace index."""
+        for prefix in namespace_prefixes(key):
+            members = self._namespaces.get(prefix)
+            if members is not None:
+                members.discard(key)
+                if not members:
+                    del self._namespaces[prefix]
+
+    def _remove(self, key: str) -> None:
+        """Remove a key, its size accounting and its index entries."""
+        if self._store.pop(key, None) is not None:
+            self._unindex_key(key)
+        self._total_bytes -= self._sizes.pop(key, 0)
+
+    def _is_expired(self, expiry: float | None, now: float) -> bool:
+        """Check whether an expiry timestamp has passed."""
+        return expiry is not None and now > expiry
+
+    def _evict_expired(self, now: float | None = None) -> None:
+        """Pop every heap entry whose expiry has passed."""
+        now = time.time() if now is None else now
+        heap = self._expiry_heap
+        while heap and heap[0][0] < now:
+            expiry, key = heapq.heappop(heap)
+            entry = self._store.get(key)
+            # Skip stale heap entries for overwritten or deleted keys
+            if entry is not None and entry[1] == expiry:
+                self._remove(key)
+                self.evicted_expired += 1
+
+        # Keep stale entries from dominating the heap under heavy overwrites
+        if len(heap) > 2 * len(self._store) + 64:
+            self._expiry_heap = [
+                (exp, k) for k, (_, exp) in self._store.items() if exp is not None
+            ]
+            heapq.heapify(self._expiry_heap)
+
+    def _evict_lru(self) -> None:
+        """Evict least-recently-used entries until within bounds."""
+        while self._store and (
+            (self.max_entries is not None and len(self._store) > self.max_entries)
+            or (self.max_bytes is not None and self._total_bytes > self.max_bytes)
+        ):
+            key, _ = self._store.popitem(last=False)
+            self._unindex_key(key)
+            self._total_bytes -= self._sizes.pop(key, 0)
+            self.evicted_lru += 1
 
     async def get(self, key: str) -> Any | None:
         """Get a value by key. Returns None if not found or expired."""
+        with self._lock:
+            entry = self._store.get(key)
+            if entry is None:
+                return None
+
+            value, expiry = entry
+
+            # Check if expired
+            if self._is_expired(expiry, time.time()):
+                self._remove(key)
+                self.evicted_expired += 1
+                return None
+
+            self._store.move_to_end(key)
+            return value
+
+    def _put(self, key: str, value: Any, expiry: float | None) -> None:
+        """Store an entry with an absolute expiry (heap entry pushed by caller)."""
+        if self.max_bytes is not None:
+            size = _estimate_size(value)
+            self._total_bytes += size - self._sizes.get(key, 0)
+            self._sizes[key] = size
+
         if key not in self._store:
-            return None
+            self._index_key(key)
+        self._store[key] = (value, expiry)
+        self._store.move_to_end(key)
+        self._evict_lru()
 
-        value, expiry = self._store[key]
+    def _set(self, key: str, value: Any, ttl: int, now: float) -> None:
+        """Store a value with a TTL relative to now."""
+        self._evict_expired(now)
 
-        # Check if expired
-        if expiry is not None and time.time() > expiry:
-            del self._store[key]
-            return None
+        if ttl > 0:
+            expiry = now + ttl
+            heapq.heappush(self._expiry_heap, (expiry, key))
+        else:
+            expiry = None
+        self._put(key, value, expiry)
 
-        return value
+    def _live_entry(self, key: str, now: float) -> tuple[Any, float | None] | None:
+        """Return a key's (value, expiry), or None if missing or expired."""
+        entry = self._store.get(key)
+        if entry is None or self._is_expired(entry[1], now):
+            return None
+        return entry
 
     async def set(self, key: str, value: Any, ttl: int = 3600) -> None:
         """
@@ -47,29 +197,60 @@ class InMemoryShortTermMemory(BaseShortTermMemory):
             value: Any JSON-serializable value
             ttl: Time-to-live in seconds (default: 1 hour, 0 for no expiration)
         """
-        if ttl > 0:
-            expiry = time.time() + ttl
-        else:
-            expiry = None
+        with self._lock:
+            self._set(key, value, ttl, time.time())
 
-        self._store[key] = (value, expiry)
+    async def incr(self, key: str, amount: int = 1, ttl: int = 3600) -> int:
+        """Atomically add amount to a counter and return the new value."""
+        with self._lock:
+            now = time.time()
+            entry = self._live_entry(key, now)
+            if entry is None:
+                self._set(key, amount, ttl, now)
+                return amount
+
+            value, expiry = entry
+            if not isinstance(value, int) or isinstance(value, bool):
+                raise TypeError(f"Value at '{key}' is not an integer")
+            # Same expiry, so the key's existing heap entry stays valid
+            self._put(key, value + amount, expiry)
+            return value + amount
+
+    async def compare_and_set(
+        self, key: str, expected: Any, value: Any, ttl: int = 3600
+    ) -> bool:
+        """Atomically set key to value if it equals expected (None = absent)."""
+        with self._lock:
+            now = time.time()
+            entry = self._live_entry(key, now)
+            current = None if entry is None else entry[0]
+            if current != expected:
+                return False
+            self._set(key, value, ttl, now)
+            return True
+
+    async def set_if_absent(self, key: str, value: Any, ttl: int = 3600) -> bool:
+        """Atomically set key if it is missing or expired."""
+        return await self.compare_and_set(key, None, value, ttl)
 
     async def delete(self, key: str) -> None:
         """Delete a key if it exists."""
-        self._store.pop(key, None)
+        with self._lock:
+            self._remove(key)
 
     async def exists(self, key: str) -> bool:
         """Check if key exists and is not expired."""
-        if key not in self._store:
-            return False
-
-        _, expiry = self._store[key]
+        with self._lock:
+            entry = self._store.get(key)
+            if entry is None:
+                return False
 
-        if expiry is not None and time.time() > expiry:
-            del self._store[key]
-            return False
+            if self._is_expired(entry[1], time.time()):
+                self._remove(key)
+                self.evicted_expired += 1
+                return False
 
-        return True
+            return True
 
     async def get_many(self, keys: list[str]) -> dict[str, Any]:
         """Get multiple keys efficiently."""
@@ -80,32 +261,100 @@ class InMemoryShortTermMemory(BaseShortTermMemory):
                 result[key] = value
         return result
 
+    async def get_many_with_ttl(
+        self, keys: list[str]
+    ) -> dict[str, tuple[Any, float | None]]:
+        """Get multiple keys with their remaining TTL in seconds."""
+        now = time.time()
+        result = {}
+        with self._lock:
+            for key in keys:
+                entry = self._live_entry(key, now)
+                if entry is not None:
+                    value, expiry = entry
+                    self._store.move_to_end(key)
+                    result[key] = (value, None if expiry is None else expiry - now)
+        return result
+
+    async def delete_many(self, keys: list[str]) -> None:
+        """Delete multiple keys."""
+        with self._lock:
+            for key in keys:
+                self._remove(key)
+
+    async def delete_prefix(self, prefix: str) -> int:
+        """Delete every key starting with prefix, visiting only its namespace."""
+        namespace = prefix[: prefix.rfind(NAMESPACE_SEP) + 1]
+        now = time.time()
+        deleted = 0
+        with self._lock:
+            if namespace:
+                candidates = self._namespaces.get(namespace, ())
+            else:
+                candidates = self._store.keys()
+
+            for key in [k for k in candidates if k.startswith(prefix)]:
+                if self._is_expired(self._store[key][1], now):
+                    self.evicted_expired += 1
+                else:
+                    deleted += 1
+                self._remove(key)
+        return deleted
+
     async def keys(self, pattern: str = "*") -> list[str]:
         """
         List keys matching a pattern.
 
-        Supports simple wildcards:
+        Supports glob wildcards:
         - '*' matches everything
         - 'prefix:*' matches keys starting with 'prefix:'
         - '*:suffix' matches keys ending with ':suffix'
+
+        Patterns with a namespaced literal prefix ('session:abc:*') only
+        visit keys in that namespace.
         """
-        import fnmatch
+        prefix = literal_prefix(pattern)
+        namespace = prefix[: prefix.rfind(NAMESPACE_SEP) + 1]
+        with self._lock:
+            self._evict_expired()
+            if namespace:
+                candidates = self._namespaces.get(namespace, ())
+            else:
+                candidates = self._store.keys()
 
-        # Clean up expired keys first
-        now = time.time()
-        expired = [
-            k for k, (_, exp) in self._store.items() if exp is not None and now > exp
-        ]
-        for key in expired:
-            del self._store[key]
+            if prefix == pattern:
+                return [pattern] if pattern in candidates else []
+            if is_prefix_pattern(pattern):
+                return [k for k in candidates if k.startswith(prefix)]
+            return [
+                k
+                for k in candidates
+                if k.startswith(prefix) and fnmatch.fnmatchcase(k, pattern)
+            ]
 
-        # Match pattern
-        return [k for k in self._store.keys() if fnmatch.fnmatch(k, pattern)]
+    @property
+    def stats(self) -> dict[str, int]:
+        """Live entry count, approximate size, and eviction counters."""
+        with self._lock:
+            self._evict_expired()
+            return {
+                "entries": len(self._store),
+                "bytes": self._total_bytes,
+                "evicted_expired": self.evicted_expired,
+                "evicted_lru": self.evicted_lru,
+            }
 
     def clear(self) -> None:
         """Clear all stored data."""
-        self._store.clear()
+        with self._lock:
+            self._store.clear()
+            self._expiry_heap.clear()
+            self._sizes.clear()
+            self._namespaces.clear()
+            self._total_bytes = 0
 
     def __len__(self) -> int:
-        """Return number of stored items (including expired ones)."""
-        return len(self._store)
+        """Return number of live (unexpired) items."""
+        with self._lock:
+            self._evict_expired()
+            return len(self._store)
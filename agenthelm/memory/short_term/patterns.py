@@ -0,0 +1,48 @@
+"""Glob key-pattern helpers shared by the short-term memory backends."""
+
+_GLOB_CHARS = "*?["
+# Namespaces are ':'-delimited ("session:abc:turns")
+NAMESPACE_SEP = ":"
+
+
+def literal_prefix(pattern: str) -> str:
+    """Return the part of a glob pattern before its first wildcard."""
+    for i, char in enumerate(pattern):
+        if char in _GLOB_CHARS:
+            return pattern[:i]
+    return pattern
+
+
+def is_prefix_pattern(pattern: str) -> bool:
+    """Check whether a pattern is a plain 'prefix*' (no other wildcards)."""
+    return pattern.endswith("*") and literal_prefix(pattern) == pattern[:-1]
+
+
+def prefix_upper_bound(prefix: str) -> str | None:
+    """
+    Smallest string greater than every string starting with prefix.
+
+    Lets a prefix match be written as the range prefix <= key < bound.
+    Returns None when no such bound exists (empty prefix or max code point).
+    """
+    while prefix:
+        last = ord(prefix[-1])
+        if last < 0x10FFFF:
+            return prefix[:-1] + chr(last + 1)
+        prefix = prefix[:-1]
+    return None
+
+
+def namespace_prefixes(key: str) -> list[str]:
+    """
+    List the namespace prefixes of a key, shortest first.
+
+    Example:
+        namespace_prefixes("session:abc:turns") == ["session:", "session:abc:"]
+    """
+    prefixes = []
+    end = key.find(NAMESPACE_SEP)
+    while end != -1:
+        prefixes.append(key[: end + 1])
+        end = key.find(NAMESPACE_SEP, end + 1)
+    return prefixes
@@ -1,9 +1,30 @@
 """Redis-based short-term memory for network/production deployments."""
 
-import json
+import re
 from typing import Any
 
 from agenthelm.memory.base import BaseShortTermMemory
+from agenthelm.memory.short_term.codec import Codec, Serializer, ValueSerializer
+from agenthelm.memory.short_term.in_memory import InMemoryShortTermMemory
+
+# Characters with special meaning in Redis MATCH patterns
+_GLOB_ESCAPE_RE = re.compile(r"[*?\[\]\\]")
+
+# KEYS[1]=key, ARGV: expect_absent flag, expected bytes, new bytes, ttl
+_COMPARE_AND_SET_LUA = """
+local current = redis.call('GET', KEYS[1])
+if ARGV[1] == '1' then
+    if current then return 0 end
+elseif current ~= ARGV[2] then
+    return 0
+end
+if tonumber(ARGV[4]) > 0 then
+    redis.call('SET', KEYS[1], ARGV[3], 'EX', ARGV[4])
+else
+    redis.call('SET', KEYS[1], ARGV[3])
+end
+return 1
+"""
 
 
 class RedisShortTermMemory(BaseShortTermMemory):
@@ -13,16 +34,39 @@ class RedisShortTermMemory(BaseShortTermMemory):
     Provides scalable network storage for production deployments.
     Requires a running Redis server (Docker or managed service).
 
+    Bulk operations use one round-trip per batch: get_many uses MGET,
+    set_many pipelines SET EX, and delete_many/clear UNLINK in chunks.
+    An optional local read-through cache serves repeated reads without a
+    round-trip; it is invalidated by this instance's own writes and entries
+    expire after local_cache_ttl, bounding staleness from other writers.
+
     Example:
         memory = RedisShortTermMemory(url="redis://localhost:6379")
         await memory.set("user:123:name", "Alice", ttl=3600)
         name = await memory.get("user:123:name")
+
+        # Larger pool, with a small local cache for hot keys
+        memory = RedisShortTermMemory(
+            url="redis://localhost:6379",
+            max_connections=50,
+            local_cache_size=1000,
+            local_cache_ttl=5,
+        )
     """
 
+    # Keys per MGET/UNLINK/pipeline batch
+    _BATCH_SIZE = 500
+
     def __init__(
         self,
         url: str = "redis://localhost:6379",
         prefix: str = "agenthelm:",
+        max_connections: int | None = None,
+        local_cache_size: int = 0,
+        local_cache_ttl: int = 5,
+        client: Any | None = None,
+        codec: str | Codec = "json",
+        compress_threshold: int | None = 4096,
     ):
         """
         Initialize Redis short-term memory.
@@ -30,28 +74,73 @@ class RedisShortTermMemory(BaseShortTermMemory):
         Args:
             url: Redis connection URL
             prefix: Key prefix for namespacing
+            max_connections: Connection pool size (None for redis-py's default)
+            local_cache_size: Max entries in the local read-through cache
+                (0 disables it)
+            local_cache_ttl: Seconds a locally cached value may be served
+            client: Pre-built redis.asyncio client (overrides url and
+                max_connections); must use decode_responses=False for
+                binary codecs or compression
+            codec: Value codec: "json" (default), "msgpack", "pickle" (trusted
+                servers only), or a Codec instance
+            compress_threshold: Encoded size in bytes at or above which values
+                are zlib-compressed (None disables compression)
         """
-        try:
-            import redis.asyncio as redis
-        except ImportError:
-            raise ImportError(
-                "redis package is required for RedisShortTermMemory. "
-                "Install with: pip install redis"
+        self.prefix = prefix
+        self.serializer: Serializer = ValueSerializer(codec, compress_threshold)
+
+        # Only close the pool on close() if this instance created it
+        self._owns_pool = client is None
+        if client is not None:
+            self._redis = client
+        else:
+            try:
+                import redis.asyncio as redis
+            except ImportError:
+                raise ImportError(
+                    "redis package is required for RedisShortTermMemory. "
+                    "Install with: pip install redis"
+                )
+
+            pool = redis.ConnectionPool.from_url(
+                url, max_connections=max_connections, decode_responses=False
             )
+            self._redis = redis.Redis(connection_pool=pool)
 
-        self.prefix = prefix
-        self._redis = redis.from_url(url, decode_responses=True)
+        self._cas_script = self._redis.register_script(_COMPARE_AND_SET_LUA)
+
+        self.local_cache_ttl = local_cache_ttl
+        self._local: InMemoryShortTermMemory | None = None
+        if local_cache_size > 0:
+            self._local = InMemoryShortTermMemory(max_entries=local_cache_size)
 
     def _prefixed_key(self, key: str) -> str:
         """Add prefix to key for namespacing."""
         return f"{self.prefix}{key}"
 
+    async def _cache_put(self, key: str, value: Any) -> None:
+        """Store a value read from Redis in the local cache."""
+        if self._local is not None:
+            await self._local.set(key, value, ttl=self.local_cache_ttl)
+
+    async def _cache_invalidate(self, keys: list[str]) -> None:
+        """Drop keys from the local cache."""
+        if self._local is not None:
+            await self._local.delete_many(keys)
+
     async def get(self, key: str) -> Any | None:
         """Get a value by key. Returns None if not found or expired."""
-        value_json = await self._redis.get(self._prefixed_key(key))
-        if value_json is None:
+        if self._local is not None:
+            value = await self._local.get(key)
+            if value is not None:
+                return value
+
+        data = await self._redis.get(self._prefixed_key(key))
+        if data is None:
             return None
-        return json.loads(value_json)
+        value = self.serializer.loads(data)
+        await self._cache_put(key, value)
+        return value
 
     async def set(self, key: str, value: Any, ttl: int = 3600) -> None:
         """
@@ -59,25 +148,156 @@ class RedisShortTermMemory(BaseShortTermMemory):
 
         Args:
             key: The key to store under
-            value: Any JSON-serializable value
+            value: Any value supported by the configured codec
             ttl: Time-to-live in seconds (default: 1 hour, 0 for no expiration)
         """
-        value_json = json.dumps(value)
+        data = self.serializer.dumps(value)
         prefixed = self._prefixed_key(key)
 
-        if ttl > 0:
-            await self._redis.setex(prefixed, ttl, value_json)
-        else:
-            await self._redis.set(prefixed, value_json)
+        await self._cache_invalidate([key])
+        await self._redis.set(prefixed, data, ex=ttl if ttl > 0 else None)
 
     async def delete(self, key: str) -> None:
         """Delete a key if it exists."""
+        await self._cache_invalidate([key])
         await self._redis.delete(self._prefixed_key(key))
 
     async def exists(self, key: str) -> bool:
         """Check if key exists and is not expired."""
         return await self._redis.exists(self._prefixed_key(key)) > 0
 
+    async def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """Get multiple keys with one MGET per batch."""
+        result = {}
+        missing = list(keys)
+        if self._local is not None:
+            cached = await self._local.get_many(missing)
+            result.update(cached)
+            missing = [key for key in missing if key not in cached]
+
+        for i in range(0, len(missing), self._BATCH_SIZE):
+            chunk = missing[i : i + self._BATCH_SIZE]
+            values = await self._redis.mget([self._prefixed_key(k) for k in chunk])
+            for key, data in zip(chunk, values):
+                if data is not None:
+                    result[key] = self.serializer.loads(data)
+                    await self._cache_put(key, result[key])
+        return result
+
+    async def get_many_with_ttl(
+        self, keys: list[str]
+    ) -> dict[str, tuple[Any, float | None]]:
+        """
+        Get multiple keys with their remaining TTL in seconds.
+
+        Reads MGET and PTTL in one MULTI/EXEC per batch, so each value and
+        its TTL come from the same moment. Skips the local cache.
+        """
+        result = {}
+        for i in range(0, len(keys), self._BATCH_SIZE):
+            chunk = keys[i : i + self._BATCH_SIZE]
+            prefixed = [self._prefixed_key(k) for k in chunk]
+            pipe = self._redis.pipeline(transaction=True)
+            pipe.mget(prefixed)
+            for key in prefixed:
+                pipe.pttl(key)
+            values, *pttls = await pipe.execute()
+            for key, data, pttl in zip(chunk, values, pttls):
+                # PTTL is -1 for keys without expiry, -2 for missing keys
+                if data is not None and pttl != -2:
+                    remaining = None if pttl == -1 else pttl / 1000
+                    result[key] = (self.serializer.loads(data), remaining)
+        return result
+
+    async def set_many(self, items: dict[str, Any], ttl: int = 3600) -> None:
+        """
+        Set multiple values with one pipelined round-trip per batch.
+
+        Args:
+            items: Mapping of key to value
+            ttl: Time-to-live in seconds applied to every key (0 for no expiration)
+        """
+        keys = list(items)
+        await self._cache_invalidate(keys)
+        for i in range(0, len(keys), self._BATCH_SIZE):
+            pipe = self._redis.pipeline(transaction=False)
+            for key in keys[i : i + self._BATCH_SIZE]:
+                pipe.set(
+                    self._prefixed_key(key),
+                    self.serializer.dumps(items[key]),
+                    ex=ttl if ttl > 0 else None,
+                )
+            await pipe.execute()
+
+    async def delete_many(self, keys: list[str]) -> None:
+        """Delete multiple keys with chunked UNLINK (non-blocking on the server)."""
+        await self._cache_invalidate(keys)
+        for i in range(0, len(keys), self._BATCH_SIZE):
+            chunk = keys[i : i + self._BATCH_SIZE]
+            await self._redis.unlink(*[self._prefixed_key(k) for k in chunk])
+
+    async def incr(self, key: str, amount: int = 1, ttl: int = 3600) -> int:
+        """
+        Atomically add amount to a counter and return the new value.
+
+        Runs SET NX (to create the counter with its TTL) and INCRBY in one
+        MULTI/EXEC, so an existing counter keeps its expiry.
+        """
+        from redis.exceptions import ResponseError
+
+        prefixed = self._prefixed_key(key)
+        await self._cache_invalidate([key])
+        pipe = self._redis.pipeline(transaction=True)
+        pipe.set(prefixed, b"0", nx=True, ex=ttl if ttl > 0 else None)
+        pipe.incrby(prefixed, amount)
+        try:
+            _, value = await pipe.execute()
+        except ResponseError as e:
+            raise TypeError(f"Value at '{key}' is not an integer") from e
+        return int(value)
+
+    async def compare_and_set(
+        self, key: str, expected: Any, value: Any, ttl: int = 3600
+    ) -> bool:
+        """
+        Atomically set key to value if it equals expected (None = absent).
+
+        Runs as a Lua script comparing encoded values, so expected must
+        encode to the same bytes as the stored value (same codec, same dict
+        ordering, same compression).
+        """
+        expect_absent = expected is None
+        args = [
+            b"1" if expect_absent else b"0",
+            b"" if expect_absent else self.serializer.dumps(expected),
+            self.serializer.dumps(value),
+            max(ttl, 0),
+        ]
+        await self._cache_invalidate([key])
+        written = await self._cas_script(keys=[self._prefixed_key(key)], args=args)
+        return bool(written)
+
+    async def set_if_absent(self, key: str, value: Any, ttl: int = 3600) -> bool:
+        """Atomically set key if it is missing or expired (SET NX)."""
+        data = self.serializer.dumps(value)
+        await self._cache_invalidate([key])
+        written = await self._redis.set(
+            self._prefixed_key(key), data, nx=True, ex=ttl if ttl > 0 else None
+        )
+        return bool(written)
+
+    async def _scan_prefixed(self, pattern: str):
+        """Yield batches of full (prefixed) key names matching a pattern."""
+        cursor = 0
+        while True:
+            cursor, keys = await self._redis.scan(
+                cursor=cursor, match=self._prefixed_key(pattern), count=self._BATCH_SIZE
+            )
+            if keys:
+                yield keys
+            if cursor == 0:
+                break
+
     async def keys(self, pattern: str = "*") -> list[str]:
         """
         List keys matching a pattern.
@@ -85,22 +305,31 @@ class RedisShortTermMemory(BaseShortTermMemory):
         Uses Redis SCAN for memory-efficient iteration.
         Pattern uses Redis glob-style matching (*, ?, []).
         """
-        full_pattern = self._prefixed_key(pattern)
         matched_keys = []
-
-        # Use SCAN for efficiency with large key sets
-        cursor = 0
-        while True:
-            cursor, keys = await self._redis.scan(cursor=cursor, match=full_pattern)
+        async for keys in self._scan_prefixed(pattern):
             # Remove prefix from returned keys
             for key in keys:
+                if isinstance(key, bytes):
+                    key = key.decode()
                 if key.startswith(self.prefix):
                     matched_keys.append(key[len(self.prefix) :])
-            if cursor == 0:
-                break
-
         return matched_keys
 
+    async def _unlink_matching(self, pattern: str) -> int:
+        """UNLINK keys matching a pattern, one SCAN batch at a time."""
+        deleted = 0
+        async for keys in self._scan_prefixed(pattern):
+            deleted += await self._redis.unlink(*keys)
+        return deleted
+
+    async def delete_prefix(self, prefix: str) -> int:
+        """Delete every key starting with prefix with batched SCAN + UNLINK."""
+        escaped = _GLOB_ESCAPE_RE.sub(r"\\\g<0>", prefix)
+        deleted = await self._unlink_matching(f"{escaped}*")
+        if self._local is not None:
+            await self._local.delete_prefix(prefix)
+        return deleted
+
     def clear(self) -> None:
         """
         Clear all stored data with this prefix.
@@ -110,14 +339,10 @@ class RedisShortTermMemory(BaseShortTermMemory):
         """
         import asyncio
 
-        async def _clear():
-            keys = await self.keys("*")
-            if keys:
-                prefixed_keys = [self._prefixed_key(k) for k in keys]
-                await self._redis.delete(*prefixed_keys)
-
-        asyncio.get_event_loop().run_until_complete(_clear())
+        asyncio.get_event_loop().run_until_complete(self._unlink_matching("*"))
+        if self._local is not None:
+            self._local.clear()
 
     async def close(self) -> None:
-        """Close the Redis connection."""
-        await self._redis.close()
+        """Close the Redis connection and its pool."""
+        await self._redis.aclose(close_connection_pool=self._owns_pool)
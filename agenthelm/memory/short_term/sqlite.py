@@ -1,12 +1,20 @@
 """SQLite-based short-term memory for local persistence."""
 
+import asyncio
 import sqlite3
 import time
-import json
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
 from agenthelm.memory.base import BaseShortTermMemory
+from agenthelm.memory.short_term.codec import Codec, Serializer, ValueSerializer
+from agenthelm.memory.short_term.patterns import (
+    is_prefix_pattern,
+    literal_prefix,
+    prefix_upper_bound,
+)
 
 
 class SqliteShortTermMemory(BaseShortTermMemory):
@@ -16,26 +24,56 @@ class SqliteShortTermMemory(BaseShortTermMemory):
     Provides persistent local storage without requiring Docker or network services.
     Uses lazy TTL expiration on access.
 
+    All statements run on one long-lived WAL-mode connection owned by a
+    dedicated worker thread, so async callers never block the event loop and
+    no connection is opened per operation. get_many/set_many/delete_many run
+    as batched statements inside a single transaction.
+
     Example:
         memory = SqliteShortTermMemory(db_path="./data/short_term.db")
         await memory.set("user:123:name", "Alice", ttl=3600)
         name = await memory.get("user:123:name")
+
+        await memory.set_many({"a": 1, "b": 2}, ttl=60)
+        values = await memory.get_many(["a", "b"])
     """
 
-    def __init__(self, db_path: str | Path):
+    # SQLite's default limit on host parameters per statement
+    _MAX_PARAMS = 900
+
+    def __init__(
+        self,
+        db_path: str | Path,
+        codec: str | Codec = "json",
+        compress_threshold: int | None = 4096,
+    ):
         """
         Initialize SQLite short-term memory.
 
         Args:
             db_path: Path to the SQLite database file
+            codec: Value codec: "json" (default), "msgpack", "pickle" (trusted
+                databases only), or a Codec instance
+            compress_threshold: Encoded size in bytes at or above which values
+                are zlib-compressed (None disables compression)
         """
+        self.serializer: Serializer = ValueSerializer(codec, compress_threshold)
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._init_db()
+
+        # One worker thread serializes access to the shared connection
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="agenthelm-sqlite"
+        )
+        self._conn: sqlite3.Connection | None = None
+        self._executor.submit(self._init_db).result()
 
     def _init_db(self) -> None:
-        """Initialize the database schema."""
-        with sqlite3.connect(self.db_path) as conn:
+        """Open the connection and initialize the database schema."""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        with conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS kv_store (
                     key TEXT PRIMARY KEY,
@@ -44,32 +82,220 @@ class SqliteShortTermMemory(BaseShortTermMemory):
                 )
             """)
             conn.execute("CREATE INDEX IF NOT EXISTS idx_expiry ON kv_store(expiry)")
-            conn.commit()
+        self._conn = conn
 
-    def _get_connection(self) -> sqlite3.Connection:
-        """Get a database connection."""
-        return sqlite3.connect(self.db_path)
+    def _db(self) -> sqlite3.Connection:
+        """Return the open connection, or raise if the store was closed."""
+        if self._conn is None:
+            raise RuntimeError("SqliteShortTermMemory is closed")
+        return self._conn
 
-    async def get(self, key: str) -> Any | None:
-        """Get a value by key. Returns None if not found or expired."""
-        with self._get_connection() as conn:
+    async def _run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run a blocking function on the connection's worker thread."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, fn, *args)
+
+    def _expiry_for(self, ttl: int) -> float | None:
+        """Convert a TTL in seconds into an absolute expiry timestamp."""
+        return time.time() + ttl if ttl > 0 else None
+
+    def _get_many_sync(self, keys: list[str]) -> dict[str, tuple[Any, float | None]]:
+        """Fetch (value, expiry) in chunked IN queries, deleting expired keys."""
+        conn = self._db()
+        now = time.time()
+        result = {}
+        expired = []
+        for i in range(0, len(keys), self._MAX_PARAMS):
+            chunk = keys[i : i + self._MAX_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
             cursor = conn.execute(
-                "SELECT value, expiry FROM kv_store WHERE key = ?", (key,)
+                f"SELECT key, value, expiry FROM kv_store WHERE key IN ({placeholders})",
+                chunk,
+            )
+            for key, data, expiry in cursor:
+                if expiry is not None and now > expiry:
+                    expired.append(key)
+                else:
+                    result[key] = (self.serializer.loads(data), expiry)
+
+        if expired:
+            self._delete_many_sync(expired)
+        return result
+
+    def _set_many_sync(self, rows: list[tuple[str, bytes, float | None]]) -> None:
+        """Upsert (key, encoded_value, expiry) rows in one transaction."""
+        conn = self._db()
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO kv_store (key, value, expiry) VALUES (?, ?, ?)",
+                rows,
+            )
+
+    def _delete_many_sync(self, keys: list[str]) -> None:
+        """Delete keys in chunked IN statements within one transaction."""
+        conn = self._db()
+        with conn:
+            for i in range(0, len(keys), self._MAX_PARAMS):
+                chunk = keys[i : i + self._MAX_PARAMS]
+                placeholders = ",".join("?" * len(chunk))
+                conn.execute(
+                    f"DELETE FROM kv_store WHERE key IN ({placeholders})", chunk
+                )
+
+    def _delete_prefix_sync(self, prefix: str) -> int:
+        """Delete the primary-key range covered by prefix in one statement."""
+        conn = self._db()
+        clauses = ["key >= ?"]
+        params = [prefix]
+        upper = prefix_upper_bound(prefix)
+        if upper is not None:
+            clauses.append("key < ?")
+            params.append(upper)
+
+        where = " AND ".join(clauses)
+        with conn:
+            # Expired rows are removed too, but only live keys are counted
+            (live,) = conn.execute(
+                f"SELECT COUNT(*) FROM kv_store WHERE {where} "
+                "AND (expiry IS NULL OR expiry >= ?)",
+                [*params, time.time()],
+            ).fetchone()
+            conn.execute(f"DELETE FROM kv_store WHERE {where}", params)
+        return live
+
+    def _exists_sync(self, key: str) -> bool:
+        """Check a key's presence, deleting it if expired."""
+        conn = self._db()
+        row = conn.execute(
+            "SELECT expiry FROM kv_store WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return False
+
+        expiry = row[0]
+        if expiry is not None and time.time() > expiry:
+            self._delete_many_sync([key])
+            return False
+
+        return True
+
+    def _keys_sync(self, pattern: str) -> list[str]:
+        """List live keys matching a glob pattern."""
+        conn = self._db()
+        now = time.time()
+        clauses = ["(expiry IS NULL OR expiry >= ?)"]
+        params: list[Any] = [now]
+
+        prefix = literal_prefix(pattern)
+        if prefix == pattern:
+            clauses.append("key = ?")
+            params.append(pattern)
+        else:
+            if prefix:
+                clauses.append("key >= ?")
+                params.append(prefix)
+            upper = prefix_upper_bound(prefix)
+            if upper is not None:
+                clauses.append("key < ?")
+                params.append(upper)
+            if not is_prefix_pattern(pattern):
+                clauses.append("key GLOB ?")
+                params.append(pattern)
+
+        # Clean up expired keys first (uses idx_expiry)
+        with conn:
+            conn.execute(
+                "DELETE FROM kv_store WHERE expiry IS NOT NULL AND expiry < ?", (now,)
+            )
+        cursor = conn.execute(
+            f"SELECT key FROM kv_store WHERE {' AND '.join(clauses)}", params
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+    def _incr_sync(self, key: str, amount: int, expiry: float | None) -> int:
+        """Increment a counter with a single UPSERT ... RETURNING."""
+        conn = self._db()
+        cursor = None
+        with conn:
+            cursor = conn.execute(
+                """
+                INSERT INTO kv_store (key, value, expiry)
+                VALUES (:key, :amount_text, :expiry)
+                ON CONFLICT(key) DO UPDATE SET
+                    value = CASE WHEN kv_store.expiry < :now THEN excluded.value
+                        ELSE CAST(CAST(kv_store.value AS INTEGER) + :amount AS TEXT)
+                    END,
+                    expiry = CASE WHEN kv_store.expiry < :now THEN excluded.expiry
+                        ELSE kv_store.expiry
+                    END
+                WHERE kv_store.expiry < :now
+                    OR CAST(CAST(kv_store.value AS INTEGER) AS TEXT)
+                        = CAST(kv_store.value AS TEXT)
+                RETURNING value
+                """,
+                {
+                    "key": key,
+                    "amount": amount,
+                    "amount_text": str(amount),
+                    "expiry": expiry,
+                    "now": time.time(),
+                },
             )
             row = cursor.fetchone()
 
-            if row is None:
-                return None
+        # The WHERE clause skips the update when the stored value isn't an integer
+        if row is None:
+            raise TypeError(f"Value at '{key}' is not an integer")
+        return int(row[0])
 
-            value_json, expiry = row
+    def _compare_and_set_sync(
+        self, key: str, expected: Any, data: bytes, expiry: float | None
+    ) -> bool:
+        """Compare the decoded value and write within one IMMEDIATE transaction."""
+        conn = self._db()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT value, expiry FROM kv_store WHERE key = ?", (key,)
+            ).fetchone()
+            current = None
+            if row is not None and (row[1] is None or time.time() <= row[1]):
+                current = self.serializer.loads(row[0])
+            if current != expected:
+                return False
 
-            # Check if expired
-            if expiry is not None and time.time() > expiry:
-                conn.execute("DELETE FROM kv_store WHERE key = ?", (key,))
-                conn.commit()
-                return None
+            conn.execute(
+                "INSERT OR REPLACE INTO kv_store (key, value, expiry) VALUES (?, ?, ?)",
+                (key, data, expiry),
+            )
+            return True
 
-            return json.loads(value_json)
+    def _set_if_absent_sync(self, key: str, data: bytes, expiry: float | None) -> bool:
+        """Insert a key unless a live one exists, with a single UPSERT."""
+        conn = self._db()
+        with conn:
+            cursor = conn.execute(
+                """
+                INSERT INTO kv_store (key, value, expiry) VALUES (?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET
+                    value = excluded.value, expiry = excluded.expiry
+                WHERE kv_store.expiry IS NOT NULL AND kv_store.expiry < ?
+                RETURNING key
+                """,
+                (key, data, expiry, time.time()),
+            )
+            return cursor.fetchone() is not None
+
+    def _clear_sync(self) -> None:
+        """Delete all rows."""
+        conn = self._db()
+        with conn:
+            conn.execute("DELETE FROM kv_store")
+
+    async def get(self, key: str) -> Any | None:
+        """Get a value by key. Returns None if not found or expired."""
+        result = await self._run(self._get_many_sync, [key])
+        return result[key][0] if key in result else None
 
     async def set(self, key: str, value: Any, ttl: int = 3600) -> None:
         """
@@ -77,76 +303,103 @@ class SqliteShortTermMemory(BaseShortTermMemory):
 
         Args:
             key: The key to store under
-            value: Any JSON-serializable value
+            value: Any value supported by the configured codec
             ttl: Time-to-live in seconds (default: 1 hour, 0 for no expiration)
         """
-        if ttl > 0:
-            expiry = time.time() + ttl
-        else:
-            expiry = None
-
-        value_json = json.dumps(value)
-
-        with self._get_connection() as conn:
-            conn.execute(
-                """
-                INSERT OR REPLACE INTO kv_store (key, value, expiry) 
-                VALUES (?, ?, ?)
-                """,
-                (key, value_json, expiry),
-            )
-            conn.commit()
+        row = (key, self.serializer.dumps(value), self._expiry_for(ttl))
+        await self._run(self._set_many_sync, [row])
 
     async def delete(self, key: str) -> None:
         """Delete a key if it exists."""
-        with self._get_connection() as conn:
-            conn.execute("DELETE FROM kv_store WHERE key = ?", (key,))
-            conn.commit()
+        await self._run(self._delete_many_sync, [key])
 
     async def exists(self, key: str) -> bool:
         """Check if key exists and is not expired."""
-        with self._get_connection() as conn:
-            cursor = conn.execute("SELECT expiry FROM kv_store WHERE key = ?", (key,))
-            row = cursor.fetchone()
+        return await self._run(self._exists_sync, key)
 
-            if row is None:
-                return False
+    async def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """Get multiple keys with batched IN queries."""
+        if not keys:
+            return {}
+        rows = await self._run(self._get_many_sync, list(keys))
+        return {key: value for key, (value, _) in rows.items()}
 
-            expiry = row[0]
+    async def get_many_with_ttl(
+        self, keys: list[str]
+    ) -> dict[str, tuple[Any, float | None]]:
+        """Get multiple keys with the remaining TTL from their expiry column."""
+        if not keys:
+            return {}
+        rows = await self._run(self._get_many_sync, list(keys))
+        now = time.time()
+        return {
+            key: (value, None if expiry is None else expiry - now)
+            for key, (value, expiry) in rows.items()
+        }
 
-            if expiry is not None and time.time() > expiry:
-                conn.execute("DELETE FROM kv_store WHERE key = ?", (key,))
-                conn.commit()
-                return False
+    async def set_many(self, items: dict[str, Any], ttl: int = 3600) -> None:
+        """
+        Set multiple values in a single transaction.
 
-            return True
+        Args:
+            items: Mapping of key to value
+            ttl: Time-to-live in seconds applied to every key (0 for no expiration)
+        """
+        if not items:
+            return
+        expiry = self._expiry_for(ttl)
+        rows = [
+            (key, self.serializer.dumps(value), expiry) for key, value in items.items()
+        ]
+        await self._run(self._set_many_sync, rows)
+
+    async def delete_many(self, keys: list[str]) -> None:
+        """Delete multiple keys in a single transaction."""
+        if keys:
+            await self._run(self._delete_many_sync, list(keys))
+
+    async def delete_prefix(self, prefix: str) -> int:
+        """Delete every key starting with prefix with a single range DELETE."""
+        return await self._run(self._delete_prefix_sync, prefix)
+
+    async def incr(self, key: str, amount: int = 1, ttl: int = 3600) -> int:
+        """Atomically add amount to a counter and return the new value."""
+        return await self._run(self._incr_sync, key, amount, self._expiry_for(ttl))
+
+    async def compare_and_set(
+        self, key: str, expected: Any, value: Any, ttl: int = 3600
+    ) -> bool:
+        """Atomically set key to value if it equals expected (None = absent)."""
+        data = self.serializer.dumps(value)
+        return await self._run(
+            self._compare_and_set_sync, key, expected, data, self._expiry_for(ttl)
+        )
+
+    async def set_if_absent(self, key: str, value: Any, ttl: int = 3600) -> bool:
+        """Atomically set key if it is missing or expired."""
+        data = self.serializer.dumps(value)
+        return await self._run(
+            self._set_if_absent_sync, key, data, self._expiry_for(ttl)
+        )
 
     async def keys(self, pattern: str = "*") -> list[str]:
         """
-        List keys matching a pattern.
+        List keys matching a glob pattern ('*' and '?' wildcards).
 
-        Note: Uses SQL LIKE pattern matching (% for wildcard).
-        '*' is converted to '%' for SQL compatibility.
+        The pattern's literal prefix is turned into a primary-key range
+        (prefix <= key < upper bound), so 'session:abc:*' only reads the
+        matching rows; any remaining wildcards are checked with GLOB.
         """
-        sql_pattern = pattern.replace("*", "%")
-
-        # Clean up expired keys first
-        now = time.time()
-        with self._get_connection() as conn:
-            conn.execute(
-                "DELETE FROM kv_store WHERE expiry IS NOT NULL AND expiry < ?", (now,)
-            )
-            cursor = conn.execute(
-                "SELECT key FROM kv_store WHERE key LIKE ?", (sql_pattern,)
-            )
-            return [row[0] for row in cursor.fetchall()]
+        return await self._run(self._keys_sync, pattern)
 
     def clear(self) -> None:
         """Clear all stored data."""
-        with self._get_connection() as conn:
-            conn.execute("DELETE FROM kv_store")
-            conn.commit()
+        self._executor.submit(self._clear_sync).result()
 
     async def close(self) -> None:
-        """Close resources (no-op for SQLite, connections are per-operation)."""
-        pass
+        """Close the connection and stop the worker thread."""
+        if self._conn is None:
+            return
+        await self._run(self._conn.close)
+        self._conn = None
+        self._executor.shutdown(wait=True)
@@ -0,0 +1,325 @@
+"""Two-tier short-term memory: in-process L1 cache in front of a durable backend."""
+
+import asyncio
+import logging
+from typing import Any
+
+from agenthelm.memory.base import BaseShortTermMemory
+from agenthelm.memory.short_term.in_memory import InMemoryShortTermMemory
+
+logger = logging.getLogger(__name__)
+
+# Marks a pending delete in write-behind mode
+_TOMBSTONE = object()
+
+
+class TieredShortTermMemory(BaseShortTermMemory):
+    """
+    Bounded in-process L1 cache in front of a durable short-term backend.
+
+    Reads are served from L1 when possible and fill it on a miss. L1 entries
+    never outlive the backend's expiry: writes use their TTL, and reads use
+    the remaining TTL reported by the backend's get_many_with_ttl(). Every
+    L1 entry is also capped at l1_ttl, which bounds how long L1 can serve a
+    value that changed in the backend (e.g. written by another process).
+
+    Write modes:
+    - "through": writes go to L1 and the backend before returning.
+    - "behind": writes go to L1 and a pending buffer that is flushed to the
+      backend in batches (set_many/delete_many) every flush_interval seconds,
+      when max_pending is reached, on flush(), and on close(). Faster, but
+      writes still pending when the process dies are lost.
+
+    Example:
+        backend = SqliteShortTermMemory(db_path="./data/short_term.db")
+        memory = TieredShortTermMemory(backend, l1_max_entries=1024)
+        await memory.set("session:abc:plan", plan)
+        await memory.get("session:abc:plan")  # served from L1
+
+        # Or via MemoryHub
+        hub = MemoryHub(data_dir="./data", short_term_cache_size=1024)
+    """
+
+    def __init__(
+        self,
+        backend: BaseShortTermMemory,
+        l1_max_entries: int = 1024,
+        l1_ttl: int = 60,
+        write_mode: str = "through",
+        flush_interval: float = 0.1,
+        max_pending: int = 1000,
+    ):
+        """
+        Initialize tiered short-term memory.
+
+        Args:
+            backend: Durable backend (SQLite, Redis, ...)
+            l1_max_entries: Max entries in the L1 cache (LRU eviction beyond)
+            l1_ttl: Max seconds an entry is served from L1
+            write_mode: "through" or "behind"
+            flush_interval: Seconds between write-behind flushes
+            max_pending: Pending writes that trigger an immediate flush
+        """
+        if write_mode not in ("through", "behind"):
+            raise ValueError(
+                f"Invalid write_mode '{write_mode}'. Use 'through' or 'behind'."
+            )
+
+        self.backend = backend
+        # Typed as the base class, since MemoryHub may wrap it to record metrics
+        self.l1: BaseShortTermMemory = InMemoryShortTermMemory(
+            max_entries=l1_max_entries
+        )
+        self.l1_ttl = l1_ttl
+        self.write_mode = write_mode
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+
+        # Write-behind buffers: {key: (value, ttl) | _TOMBSTONE}
+        self._pending: dict[str, Any] = {}
+        self._inflight: dict[str, Any] = {}
+        self._flush_task: asyncio.Task | None = None
+        self._flush_lock = asyncio.Lock()
+
+    def _l1_ttl_for(self, ttl: float) -> int:
+        """TTL for an L1 entry: never past the backend's, at most l1_ttl."""
+        # Rounded down, so L1 never outlives the backend entry
+        return min(int(ttl), self.l1_ttl) if ttl > 0 else self.l1_ttl
+
+    async def _fetch(self, keys: list[str]) -> dict[str, Any]:
+        """Read keys from the backend and cache them in L1 until they expire."""
+        fetched = await self.backend.get_many_with_ttl(keys)
+        result = {}
+        for key, (value, remaining) in fetched.items():
+            result[key] = value
+            if remaining is None:
+                await self.l1.set(key, value, ttl=self.l1_ttl)
+            elif remaining >= 1:
+                # Under a second left is not cached (an L1 TTL of 0 never expires)
+                await self.l1.set(key, value, ttl=self._l1_ttl_for(remaining))
+        return result
+
+    def _buffered(self, key: str) -> Any:
+        """Return a pending write-behind entry for key, or None."""
+        if key in self._pending:
+            return self._pending[key]
+        return self._inflight.get(key)
+
+    def _schedule_flush(self) -> None:
+        """Start the periodic flush task if it isn't running."""
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.get_running_loop().create_task(
+                self._flush_later()
+            )
+
+    async def _flush_later(self) -> None:
+        """Flush pending writes after flush_interval, retrying on failure."""
+        await asyncio.sleep(self.flush_interval)
+        # Let a failed flush schedule its retry from within this task
+        self._flush_task = None
+        try:
+            await self.flush()
+        except Exception:
+            logger.exception("Write-behind flush failed, will retry")
+
+    async def _write(self, items: dict[str, Any], ttl: int) -> None:
+        """Write values to the backend or the write-behind buffer, then L1."""
+        if self.write_mode == "through":
+            await self.backend.set_many(items, ttl)
+        else:
+            for key, value in items.items():
+                self._pending[key] = (value, ttl)
+
+        l1_ttl = self._l1_ttl_for(ttl)
+        for key, value in items.items():
+            await self.l1.set(key, value, ttl=l1_ttl)
+
+        if self.write_mode == "behind":
+            await self._after_buffering()
+
+    async def _remove(self, keys: list[str]) -> None:
+        """Delete keys from L1 and the backend or the write-behind buffer."""
+        await self.l1.delete_many(keys)
+
+        if self.write_mode == "through":
+            await self.backend.delete_many(keys)
+            return
+
+        for key in keys:
+            self._pending[key] = _TOMBSTONE
+        await self._after_buffering()
+
+    async def _after_buffering(self) -> None:
+        """Flush now if the buffer is full, otherwise schedule a flush."""
+        if len(self._pending) >= self.max_pending:
+            await self.flush()
+        else:
+            self._schedule_flush()
+
+    async def flush(self) -> None:
+        """
+        Write all pending write-behind entries to the backend.
+
+        If the backend fails, the entries are re-queued, a retry is
+        scheduled, and the error is raised.
+        """
+        async with self._flush_lock:
+            if not self._pending:
+                return
+            self._inflight, self._pending = self._pending, {}
+
+            deletes = [k for k, v in self._inflight.items() if v is _TOMBSTONE]
+            writes_by_ttl: dict[int, dict[str, Any]] = {}
+            for key, entry in self._inflight.items():
+                if entry is not _TOMBSTONE:
+                    value, ttl = entry
+                    writes_by_ttl.setdefault(ttl, {})[key] = value
+
+            try:
+                if deletes:
+                    await self.backend.delete_many(deletes)
+                for ttl, items in writes_by_ttl.items():
+                    await self.backend.set_many(items, ttl)
+            except BaseException:
+                # Re-queue without clobbering newer writes
+                for key, entry in self._inflight.items():
+                    self._pending.setdefault(key, entry)
+                self._schedule_flush()
+                raise
+            finally:
+                self._inflight = {}
+
+    async def get(self, key: str) -> Any | None:
+        """Get a value, from L1 when cached."""
+        value = await self.l1.get(key)
+        if value is not None:
+            return value
+
+        entry = self._buffered(key)
+        if entry is not None:
+            return None if entry is _TOMBSTONE else entry[0]
+
+        return (await self._fetch([key])).get(key)
+
+    async def set(self, key: str, value: Any, ttl: int = 3600) -> None:
+        """
+        Set a value with TTL in seconds.
+
+        Args:
+            key: The key to store under
+            value: Any value supported by the backend
+            ttl: Time-to-live in seconds (default: 1 hour, 0 for no expiration)
+        """
+        await self._write({key: value}, ttl)
+
+    async def delete(self, key: str) -> None:
+        """Delete a key if it exists."""
+        await self._remove([key])
+
+    async def exists(self, key: str) -> bool:
+        """Check if key exists and is not expired."""
+        if await self.l1.exists(key):
+            return True
+
+        entry = self._buffered(key)
+        if entry is not None:
+            return entry is not _TOMBSTONE
+
+        return await self.backend.exists(key)
+
+    async def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """Get multiple keys, fetching only L1 misses from the backend."""
+        result = await self.l1.get_many(keys)
+
+        missing = []
+        for key in keys:
+            if key in result:
+                continue
+            entry = self._buffered(key)
+            if entry is None:
+                missing.append(key)
+            elif entry is not _TOMBSTONE:
+                result[key] = entry[0]
+
+        if missing:
+            result.update(await self._fetch(missing))
+        return result
+
+    async def get_many_with_ttl(
+        self, keys: list[str]
+    ) -> dict[str, tuple[Any, float | None]]:
+        """Get multiple keys with their backend TTL (flushes pending writes first)."""
+        await self.flush()
+        return await self.backend.get_many_with_ttl(keys)
+
+    async def set_many(self, items: dict[str, Any], ttl: int = 3600) -> None:
+        """Set multiple values with the same TTL."""
+        await self._write(items, ttl)
+
+    async def delete_many(self, keys: list[str]) -> None:
+        """Delete multiple keys."""
+        await self._remove(keys)
+
+    async def delete_prefix(self, prefix: str) -> int:
+        """Delete every key starting with prefix in both tiers."""
+        for key in [k for k in self._pending if k.startswith(prefix)]:
+            del self._pending[key]
+        # Let an in-progress flush land before deleting behind it
+        async with self._flush_lock:
+            await self.l1.delete_prefix(prefix)
+            return await self.backend.delete_prefix(prefix)
+
+    async def _settle(self, key: str) -> None:
+        """Flush a buffered write for key so the backend sees the latest value."""
+        if self._buffered(key) is not None:
+            await self.flush()
+
+    async def incr(self, key: str, amount: int = 1, ttl: int = 3600) -> int:
+        """Atomically increment a counter in the backend; L1 is invalidated."""
+        await self._settle(key)
+        value = await self.backend.incr(key, amount, ttl)
+        await self.l1.delete(key)
+        return value
+
+    async def compare_and_set(
+        self, key: str, expected: Any, value: Any, ttl: int = 3600
+    ) -> bool:
+        """Atomically compare-and-set in the backend; L1 is invalidated."""
+        await self._settle(key)
+        written = await self.backend.compare_and_set(key, expected, value, ttl)
+        await self.l1.delete(key)
+        return written
+
+    async def set_if_absent(self, key: str, value: Any, ttl: int = 3600) -> bool:
+        """Atomically set a missing key in the backend; L1 is invalidated."""
+        await self._settle(key)
+        written = await self.backend.set_if_absent(key, value, ttl)
+        await self.l1.delete(key)
+        return written
+
+    async def keys(self, pattern: str = "*") -> list[str]:
+        """List keys matching a pattern (flushes pending writes first)."""
+        await self.flush()
+        return await self.backend.keys(pattern)
+
+    def clear(self) -> None:
+        """Clear both tiers and drop pending writes."""
+        self._pending.clear()
+        self.l1.clear()
+        self.backend.clear()
+
+    async def close(self) -> None:
+        """
+        Flush pending writes and close the backend.
+
+        The backend is closed even if the flush fails; the flush error is
+        raised and its writes are lost.
+        """
+        try:
+            await self.flush()
+        finally:
+            # flush() waits for any in-progress flush, so the task is idle
+            # here; a failed flush scheduled a retry, which is dropped too
+            if self._flush_task is not None and not self._flush_task.done():
+                self._flush_task.cancel()
+            await self.backend.close()
@@ -0,0 +1,98 @@
+"""Side stores that keep semantic memory text bodies out of Qdrant payloads."""
+
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+
+class BaseTextStore(ABC):
+    """Abstract base class for out-of-line text storage keyed by memory ID."""
+
+    @abstractmethod
+    def put_many(self, texts: dict[str, str]) -> None:
+        """Store text bodies by ID, replacing existing entries."""
+        ...
+
+    @abstractmethod
+    def get_many(self, ids: list[str]) -> dict[str, str]:
+        """Fetch text bodies by ID. Missing IDs are omitted."""
+        ...
+
+    @abstractmethod
+    def delete_many(self, ids: list[str]) -> None:
+        """Delete text bodies by ID."""
+        ...
+
+    def close(self) -> None:
+        """Close any connections. Override if needed."""
+
+
+class SqliteTextStore(BaseTextStore):
+    """
+    SQLite-backed text store.
+
+    Uses one long-lived connection; all access is serialized by a lock so the
+    store can be shared by threads.
+
+    Example:
+        store = SqliteTextStore("./data/semantic_text.db")
+        memory = SemanticMemory(mode="local", path="./data/qdrant", text_store=store)
+    """
+
+    # SQLite's default limit on host parameters per statement
+    _MAX_PARAMS = 900
+
+    def __init__(self, db_path: str | Path = ":memory:"):
+        """
+        Initialize the text store.
+
+        Args:
+            db_path: Path to the SQLite database file, or ":memory:"
+        """
+        if str(db_path) != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.db_path = str(db_path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS texts (id TEXT PRIMARY KEY, body TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+    def put_many(self, texts: dict[str, str]) -> None:
+        """Store text bodies by ID in a single transaction."""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO texts (id, body) VALUES (?, ?)",
+                texts.items(),
+            )
+
+    def get_many(self, ids: list[str]) -> dict[str, str]:
+        """Fetch text bodies by ID."""
+        result = {}
+        with self._lock:
+            for i in range(0, len(ids), self._MAX_PARAMS):
+                chunk = ids[i : i + self._MAX_PARAMS]
+                placeholders = ",".join("?" * len(chunk))
+                cursor = self._conn.execute(
+                    f"SELECT id, body FROM texts WHERE id IN ({placeholders})", chunk
+                )
+                result.update(cursor.fetchall())
+        return result
+
+    def delete_many(self, ids: list[str]) -> None:
+        """Delete text bodies by ID in a single transaction."""
+        with self._lock, self._conn:
+            for i in range(0, len(ids), self._MAX_PARAMS):
+                chunk = ids[i : i + self._MAX_PARAMS]
+                placeholders = ",".join("?" * len(chunk))
+                self._conn.execute(
+                    f"DELETE FROM texts WHERE id IN ({placeholders})", chunk
+                )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
@@ -7,20 +7,29 @@ from typing import Any
 from agenthelm.agent.base import BaseAgent
 from agenthelm.agent.plan import Plan, PlanStep, StepStatus
 from agenthelm.agent.result import AgentResult
-from agenthelm.core.event import Event
 from agenthelm.core.tool import TOOL_REGISTRY
 from agenthelm.orchestration.registry import AgentRegistry
 
 logger = logging.getLogger(__name__)
 
 
+class _StepFailed(RuntimeError):
+    """A step's agent reported failure; keeps its result for the totals."""
+
+    def __init__(self, result: AgentResult):
+        super().__init__(result.error or "Agent execution failed")
+        self.result = result
+
+
 class Orchestrator:
     """
     Executes plans by routing steps to registered agents.
 
     Supports:
     - Sequential execution (steps with dependencies)
-    - Parallel execution (independent steps)
+    - Parallel execution (independent steps run in worker threads, so their
+      tool calls overlap; MCP calls from parallel steps are pipelined over
+      the shared session)
     - Saga pattern: rollback on failure via compensating actions
     - Error handling and step failure tracking
 
@@ -38,6 +47,7 @@ class Orchestrator:
         registry: AgentRegistry,
         default_agent: BaseAgent | None = None,
         enable_rollback: bool = True,
+        max_parallel: int | None = None,
     ):
         """
         Initialize orchestrator.
@@ -46,10 +56,14 @@ class Orchestrator:
             registry: Registry of named agents
             default_agent: Fallback agent for steps without agent_name
             enable_rollback: If True, run compensating actions on failure
+            max_parallel: Max steps running at once (None for no limit)
         """
+        if max_parallel is not None and max_parallel < 1:
+            raise ValueError("max_parallel must be at least 1")
         self.registry = registry
         self.default_agent = default_agent
         self.enable_rollback = enable_rollback
+        self.max_parallel = max_parallel
 
     async def execute(self, plan: Plan) -> AgentResult:
         """
@@ -62,14 +76,17 @@ class Orchestrator:
             plan: The plan to execute
 
         Returns:
-            AgentResult with aggregated events and metrics
+            AgentResult with aggregated events and metrics. Token usage and
+            cost cover generating the plan, every step (failed ones too)
+            and any rollback.
         """
         if not plan.approved:
             raise ValueError("Plan must be approved before execution")
 
         result = AgentResult(success=False)
-        all_events: list[Event] = []
+        result.add_usage(plan.token_usage, plan.estimated_cost_usd)
         failed = False
+        limit = asyncio.Semaphore(self.max_parallel) if self.max_parallel else None
 
         while not plan.is_complete:
             ready_steps = plan.get_ready_steps()
@@ -82,7 +99,7 @@ class Orchestrator:
 
             # Execute ready steps in parallel
             step_results = await asyncio.gather(
-                *[self._execute_step(step) for step in ready_steps],
+                *[self._execute_step(step, limit) for step in ready_steps],
                 return_exceptions=True,
             )
 
@@ -90,11 +107,13 @@ class Orchestrator:
             for step, step_result in zip(ready_steps, step_results):
                 if isinstance(step_result, Exception):
                     plan.mark_failed(step.id, str(step_result))
+                    if isinstance(step_result, _StepFailed):
+                        result.merge(step_result.result)
                     failed = True
                 else:
-                    output, events = step_result
+                    output, agent_result = step_result
                     plan.mark_completed(step.id, result=output)
-                    all_events.extend(events)
+                    result.merge(agent_result)
 
             # On first failure, break and rollback
             if failed:
@@ -102,13 +121,11 @@ class Orchestrator:
 
         # Saga: rollback completed steps on failure
         if failed and self.enable_rollback:
-            rollback_events = await self._rollback(plan)
-            all_events.extend(rollback_events)
+            for agent_result in await self._rollback(plan):
+                result.merge(agent_result)
 
         # Build final result
         result.success = plan.success
-        for event in all_events:
-            result.add_event(event)
 
         if not result.success and not result.error:
             failed_steps = [s for s in plan.steps if s.status == StepStatus.FAILED]
@@ -117,7 +134,7 @@ class Orchestrator:
 
         return result
 
-    async def _rollback(self, plan: Plan) -> list[Event]:
+    async def _rollback(self, plan: Plan) -> list[AgentResult]:
         """
         Run compensating actions for completed steps in reverse order.
 
@@ -129,9 +146,9 @@ class Orchestrator:
             plan: The plan to rollback
 
         Returns:
-            List of events from compensation actions
+            Results of the compensation runs
         """
-        events: list[Event] = []
+        results: list[AgentResult] = []
         completed = [s for s in plan.steps if s.status == StepStatus.COMPLETED]
 
         for step in reversed(completed):
@@ -149,14 +166,13 @@ class Orchestrator:
                 agent = self._get_agent_for_step(step)
                 task = f"Compensate: {compensate_tool} with args {compensate_args}"
 
-                agent_result = agent.run(task)
-                events.extend(agent_result.events)
+                results.append(agent.run(task))
 
             except Exception as e:
                 logger.error(f"Rollback failed for step {step.id}: {e}")
                 # Continue rolling back other steps
 
-        return events
+        return results
 
     def _get_compensate_tool(self, step: PlanStep) -> str | None:
         """Get the compensating tool for a step (step-level overrides tool-level)."""
@@ -169,16 +185,23 @@ class Orchestrator:
         contract = tool_info.get("contract", {})
         return contract.get("compensating_tool")
 
-    async def _execute_step(self, step: PlanStep) -> tuple[Any, list[Event]]:
+    async def _execute_step(
+        self, step: PlanStep, limit: asyncio.Semaphore | None = None
+    ) -> tuple[Any, AgentResult]:
         """
         Execute a single plan step.
 
         Args:
             step: The step to execute
+            limit: Semaphore bounding how many steps run at once
 
         Returns:
-            Tuple of (result, events)
+            Tuple of (answer, agent result)
         """
+        if limit is not None:
+            async with limit:
+                return await self._execute_step(step)
+
         step.status = StepStatus.RUNNING
 
         # Find the agent to execute this step
@@ -187,13 +210,14 @@ class Orchestrator:
         # Build the task from step description and args
         task = self._build_task(step)
 
-        # Execute via agent
-        agent_result = agent.run(task)
+        # Execute via agent. run() is sync (DSPy), so it runs in a worker
+        # thread to let the other ready steps proceed at the same time.
+        agent_result = await asyncio.to_thread(agent.run, task)
 
         if not agent_result.success:
-            raise RuntimeError(agent_result.error or "Agent execution failed")
+            raise _StepFailed(agent_result)
 
-        return agent_result.answer, agent_result.events
+        return agent_result.answer, agent_result
 
     def _get_agent_for_step(self, step: PlanStep) -> BaseAgent:
         """Get the appropriate agent for a step."""
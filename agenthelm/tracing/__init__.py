@@ -2,7 +2,9 @@
 
 from agenthelm.tracing.otel import (
     init_tracing,
+    init_metrics,
     get_tracer,
+    get_meter,
     trace_tool,
     trace_agent,
     shutdown,
@@ -10,7 +12,9 @@ from agenthelm.tracing.otel import (
 
 __all__ = [
     "init_tracing",
+    "init_metrics",
     "get_tracer",
+    "get_meter",
     "trace_tool",
     "trace_agent",
     "shutdown",
@@ -4,10 +4,15 @@ from contextlib import contextmanager
 from typing import Any, Generator
 import logging
 
-from opentelemetry import trace
+from opentelemetry import metrics, trace
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.resources import Resource
 from opentelemetry.sdk.trace.export import BatchSpanProcessor
+from opentelemetry.exporter.otlp.proto.grpc.metric_exporter import (
+    OTLPMetricExporter,
+)
 from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
 from opentelemetry.trace import Status, StatusCode
 
@@ -16,6 +21,7 @@ logger = logging.getLogger(__name__)
 # Global tracer instance
 _tracer: trace.Tracer | None = None
 _initialized = False
+_metrics_initialized = False
 
 
 def init_tracing(
@@ -81,6 +87,60 @@ def get_tracer() -> trace.Tracer:
     return _tracer
 
 
+def init_metrics(
+    service_name: str = "agenthelm",
+    otlp_endpoint: str = "http://localhost:4317",
+    enabled: bool = True,
+    export_interval_ms: int = 60_000,
+) -> metrics.Meter:
+    """
+    Initialize OpenTelemetry metrics with periodic OTLP export.
+
+    Args:
+        service_name: Name to identify this service
+        otlp_endpoint: OTLP gRPC endpoint
+        enabled: If False, returns a no-op meter
+        export_interval_ms: How often metrics are exported
+
+    Returns:
+        Meter for AgentHelm instruments
+    """
+    global _metrics_initialized
+
+    if _metrics_initialized or not enabled:
+        _metrics_initialized = True
+        return metrics.get_meter(service_name)
+
+    resource = Resource.create(
+        {
+            "service.name": service_name,
+            "service.version": "0.3.0",
+        }
+    )
+
+    readers = []
+    try:
+        exporter = OTLPMetricExporter(endpoint=otlp_endpoint, insecure=True)
+        readers.append(
+            PeriodicExportingMetricReader(
+                exporter, export_interval_millis=export_interval_ms
+            )
+        )
+        logger.info(f"OpenTelemetry metrics initialized: exporting to {otlp_endpoint}")
+    except Exception as e:
+        logger.warning(f"Failed to configure OTLP metric exporter: {e}", exc_info=True)
+
+    metrics.set_meter_provider(MeterProvider(resource=resource, metric_readers=readers))
+    _metrics_initialized = True
+
+    return metrics.get_meter(service_name)
+
+
+def get_meter(name: str = "agenthelm") -> metrics.Meter:
+    """Get a meter from the global provider (no-op unless init_metrics ran)."""
+    return metrics.get_meter(name)
+
+
 @contextmanager
 def trace_tool(
     tool_name: str,
@@ -143,7 +203,10 @@ def trace_agent(
 
 
 def shutdown():
-    """Flush and shutdown the tracer provider."""
+    """Flush and shutdown the tracer and meter providers."""
     provider = trace.get_tracer_provider()
     if hasattr(provider, "shutdown"):
         provider.shutdown()
+    meter_provider = metrics.get_meter_provider()
+    if isinstance(meter_provider, MeterProvider):
+        meter_provider.shutdown()
@@ -0,0 +1,104 @@
+"""
+MCP Throughput Benchmark
+
+Measures tool calls/sec against a local stdio echo server: one call at a
+time, pipelined with MCPClient.call_many at several concurrency levels, and
+sync MCPToolAdapter calls from worker threads sharing one session.
+
+    python benchmarks/mcp_throughput.py
+    python benchmarks/mcp_throughput.py --calls 2000 --latency 0.01
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+def serve() -> None:
+    """Run the echo server (the benchmark spawns itself with --serve)."""
+    try:
+        from mcp.server.mcpserver import MCPServer as Server
+    except ImportError:
+        from mcp.server.fastmcp import FastMCP as Server
+
+    server = Server("agenthelm-bench")
+
+    @server.tool()
+    async def echo(text: str, latency: float = 0.0) -> str:
+        """Return the text, after simulating server-side latency."""
+        if latency:
+            await asyncio.sleep(latency)
+        return text
+
+    server.run()
+
+
+def _report(label: str, calls: int, elapsed: float) -> None:
+    print(f"  {label:<28} {calls / elapsed:>10,.0f} calls/sec")
+
+
+async def bench_client(config: dict, calls: int, latency: float) -> None:
+    from agenthelm.mcp import MCPClient
+
+    args = {"text": "ping", "latency": latency}
+    async with MCPClient(config) as client:
+        await client.call_tool("echo", args)  # Warm up
+
+        start = time.perf_counter()
+        for _ in range(calls):
+            await client.call_tool("echo", args)
+        _report("sequential call_tool", calls, time.perf_counter() - start)
+
+        for concurrency in (1, 8, 32):
+            start = time.perf_counter()
+            await client.call_many([("echo", args)] * calls, concurrency=concurrency)
+            elapsed = time.perf_counter() - start
+            _report(f"call_many (concurrency={concurrency})", calls, elapsed)
+
+
+def bench_adapter(config: dict, calls: int, latency: float, threads: int) -> None:
+    from agenthelm.mcp import MCPToolAdapter
+
+    args = {"text": "ping", "latency": latency}
+    adapter = MCPToolAdapter(config)
+    asyncio.run(adapter.connect())
+    try:
+        adapter.call_tool("echo", args)  # Warm up
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(threads) as pool:
+            list(pool.map(lambda _: adapter.call_tool("echo", args), range(calls)))
+        _report(f"adapter, {threads} threads", calls, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        adapter.call_many([("echo", args)] * calls, concurrency=threads)
+        _report(f"adapter.call_many ({threads})", calls, time.perf_counter() - start)
+    finally:
+        asyncio.run(adapter.close())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=500)
+    parser.add_argument(
+        "--latency", type=float, default=0.005, help="Server-side delay per call"
+    )
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--serve", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve()
+        return
+
+    config = {"command": sys.executable, "args": [__file__, "--serve"]}
+    print(f"MCPClient ({args.calls} calls, {args.latency * 1000:g}ms latency)")
+    asyncio.run(bench_client(config, args.calls, args.latency))
+    print("MCPToolAdapter")
+    bench_adapter(config, args.calls, args.latency, args.threads)
+
+
+if __name__ == "__main__":
+    main()
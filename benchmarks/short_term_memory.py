@@ -0,0 +1,74 @@
+"""
+Short-Term Memory Benchmark
+
+Measures ops/sec for single-key and batched operations on the short-term
+memory backends.
+
+    python benchmarks/short_term_memory.py
+    python benchmarks/short_term_memory.py --ops 20000 --batch 200
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+from agenthelm.memory import InMemoryShortTermMemory, SqliteShortTermMemory
+
+
+async def _timed(label: str, ops: int, coro) -> None:
+    start = time.perf_counter()
+    await coro
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<24} {ops / elapsed:>12,.0f} ops/sec")
+
+
+async def bench(memory, ops: int, batch: int) -> None:
+    keys = [f"session:bench:{i}" for i in range(ops)]
+
+    async def set_each():
+        for key in keys:
+            await memory.set(key, {"value": key})
+
+    async def get_each():
+        for key in keys:
+            await memory.get(key)
+
+    async def set_batched():
+        for i in range(0, ops, batch):
+            await memory.set_many({k: {"value": k} for k in keys[i : i + batch]})
+
+    async def get_batched():
+        for i in range(0, ops, batch):
+            await memory.get_many(keys[i : i + batch])
+
+    async def delete_batched():
+        for i in range(0, ops, batch):
+            await memory.delete_many(keys[i : i + batch])
+
+    await _timed("set", ops, set_each())
+    await _timed("get", ops, get_each())
+    await _timed(f"set_many (x{batch})", ops, set_batched())
+    await _timed(f"get_many (x{batch})", ops, get_batched())
+    await _timed(f"delete_many (x{batch})", ops, delete_batched())
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--ops", type=int, default=5000)
+    parser.add_argument("--batch", type=int, default=100)
+    args = parser.parse_args()
+
+    print("InMemoryShortTermMemory")
+    await bench(InMemoryShortTermMemory(), args.ops, args.batch)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print("SqliteShortTermMemory")
+        memory = SqliteShortTermMemory(db_path=Path(tmp) / "bench.db")
+        await bench(memory, args.ops, args.batch)
+        await memory.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,46 @@
+"""Shared fixtures: a deterministic fake embedding model for SemanticMemory."""
+
+import hashlib
+import math
+
+import numpy as np
+import pytest
+
+from agenthelm.memory import embeddings
+from agenthelm.memory.semantic import SemanticMemory
+
+
+class FakeEmbeddingModel:
+    """Stand-in for fastembed.TextEmbedding: normalized bag-of-words vectors."""
+
+    def __init__(self, dim: int):
+        self.dim = dim
+
+    def embed(self, texts):
+        for text in texts:
+            vector = np.zeros(self.dim)
+            for word in text.lower().split():
+                vector[int(hashlib.md5(word.encode()).hexdigest(), 16) % self.dim] += 1
+            yield vector / (math.sqrt(float(vector @ vector)) or 1.0)
+
+
+@pytest.fixture
+def fake_embedder(monkeypatch):
+    """
+    Serve every embedding model as a 32-dim FakeEmbeddingModel.
+
+    Call the fixture value with another dimension to switch models mid-test,
+    e.g. fake_embedder(64).
+    """
+
+    def install(dim: int = 32) -> None:
+        monkeypatch.setattr(
+            embeddings, "_load_model", lambda name: FakeEmbeddingModel(dim)
+        )
+        embeddings.unload()
+        SemanticMemory._dimension_cache.clear()
+
+    install()
+    yield install
+    embeddings.unload()
+    SemanticMemory._dimension_cache.clear()
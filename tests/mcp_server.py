@@ -0,0 +1,56 @@
+"""Tiny stdio MCP server used as a test fixture (run as a subprocess)."""
+
+import asyncio
+import os
+
+try:
+    from mcp.server.mcpserver import Context
+    from mcp.server.mcpserver import MCPServer as Server
+except ImportError:
+    from mcp.server.fastmcp import Context
+    from mcp.server.fastmcp import FastMCP as Server
+
+server = Server("agenthelm-test")
+
+
+@server.tool()
+async def echo(text: str) -> str:
+    """Return the text unchanged."""
+    return text
+
+
+@server.tool()
+async def pid() -> str:
+    """Return the server's process id."""
+    return str(os.getpid())
+
+
+@server.tool()
+async def sleep(seconds: float) -> str:
+    """Sleep, then return the server's process id."""
+    await asyncio.sleep(seconds)
+    return str(os.getpid())
+
+
+@server.tool()
+async def big(size: int) -> str:
+    """Return a string of `size` characters."""
+    return "x" * size
+
+
+@server.tool()
+async def count(steps: int, ctx: Context) -> str:
+    """Report progress for each step, then return the step count."""
+    for step in range(1, steps + 1):
+        await ctx.report_progress(step, steps, f"step {step}")
+    return str(steps)
+
+
+@server.tool()
+async def crash() -> str:
+    """Exit the server process immediately."""
+    os._exit(1)
+
+
+if __name__ == "__main__":
+    server.run()
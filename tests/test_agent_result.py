@@ -108,3 +108,37 @@ class TestAgentResult:
 
         result.add_event(event)
         assert result.total_cost_usd == 0.0
+
+    def test_add_usage(self):
+        """Usage outside events adds to the totals."""
+        result = AgentResult(success=True)
+        result.add_usage(TokenUsage(input_tokens=10, output_tokens=5, model="m"), 0.02)
+        result.add_usage(None)
+
+        assert result.token_usage.total_tokens == 15
+        assert result.token_usage.model == "m"
+        assert result.total_cost_usd == pytest.approx(0.02)
+
+    def test_merge_does_not_double_count(self):
+        """Merging takes the other result's totals once, events included."""
+        step = AgentResult(success=True)
+        step.add_event(
+            Event(
+                timestamp=datetime.now(timezone.utc),
+                tool_name="search",
+                inputs={},
+                outputs={},
+                execution_time=0.1,
+                token_usage=TokenUsage(input_tokens=100, output_tokens=50),
+                estimated_cost_usd=0.001,
+            )
+        )
+        step.add_usage(TokenUsage(input_tokens=20, output_tokens=10), 0.0002)
+
+        result = AgentResult(success=True)
+        result.merge(step)
+
+        assert len(result.events) == 1
+        assert result.token_usage.input_tokens == 120
+        assert result.token_usage.output_tokens == 60
+        assert result.total_cost_usd == pytest.approx(0.0012)
@@ -0,0 +1,95 @@
+"""Tests for agenthelm.core.loop - BackgroundLoop."""
+
+import asyncio
+import threading
+
+import pytest
+
+from agenthelm.core.loop import BackgroundLoop
+
+
+@pytest.fixture
+def loop():
+    """Create a background loop and stop it after the test."""
+    background = BackgroundLoop(name="test-loop")
+    yield background
+    background.stop()
+
+
+async def current_thread_name() -> str:
+    """Return the name of the thread running the coroutine."""
+    return threading.current_thread().name
+
+
+class TestBackgroundLoop:
+    """Tests for BackgroundLoop."""
+
+    def test_starts_lazily(self, loop):
+        """The thread starts on first use."""
+        assert not loop.is_running
+        assert loop.run(current_thread_name()) == "test-loop"
+        assert loop.is_running
+
+    def test_reuses_one_loop(self, loop):
+        """Every call runs on the same loop."""
+
+        async def running_loop():
+            return asyncio.get_running_loop()
+
+        assert loop.run(running_loop()) is loop.run(running_loop())
+
+    @pytest.mark.asyncio
+    async def test_run_inside_running_loop(self, loop):
+        """Blocking run() from a thread with its own loop doesn't deadlock."""
+        assert loop.run(current_thread_name(), timeout=5) == "test-loop"
+
+    @pytest.mark.asyncio
+    async def test_submit_awaitable_from_other_loop(self, loop):
+        """submit() futures can be awaited from another loop."""
+        future = loop.submit(asyncio.sleep(0.01, result="done"))
+        assert await asyncio.wrap_future(future) == "done"
+
+    def test_concurrent_callers_multiplex(self, loop):
+        """Calls from many threads run concurrently on the loop."""
+        results = []
+
+        def call():
+            results.append(loop.run(asyncio.sleep(0.2, result=1), timeout=5))
+
+        threads = [threading.Thread(target=call) for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=1.5)
+        assert results == [1] * 10
+
+    def test_timeout_cancels(self, loop):
+        """A timed-out coroutine is cancelled and TimeoutError raised."""
+        cancelled = threading.Event()
+
+        async def slow():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with pytest.raises(TimeoutError):
+            loop.run(slow(), timeout=0.1)
+        assert cancelled.wait(timeout=1)
+
+    def test_run_from_loop_thread_raises(self, loop):
+        """run() on the loop's own thread raises instead of deadlocking."""
+
+        async def nested():
+            return loop.run(asyncio.sleep(0))
+
+        with pytest.raises(RuntimeError, match="await the coroutine"):
+            loop.run(nested(), timeout=5)
+
+    def test_stop_and_restart(self, loop):
+        """A stopped loop restarts on the next call."""
+        loop.run(asyncio.sleep(0))
+        loop.stop()
+        assert not loop.is_running
+        assert loop.run(current_thread_name()) == "test-loop"
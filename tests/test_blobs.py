@@ -0,0 +1,79 @@
+"""Tests for agenthelm.core.blobs - BlobStore and output caps."""
+
+import pytest
+from mcp import types
+
+from agenthelm import BlobStore
+from agenthelm.core.blobs import cap_output, is_blob_ref, output_text, preview
+
+
+class TestBlobStore:
+    """Test the content-addressed blob store."""
+
+    def test_put_and_read(self, tmp_path):
+        """Blobs round-trip and are named by their content hash."""
+        blobs = BlobStore(tmp_path)
+        blob_id = blobs.put("hello world")
+
+        assert blob_id.startswith("sha256:")
+        assert blobs.read(blob_id) == b"hello world"
+        assert blobs.read_text(blob_id, start=6, length=3) == "wor"
+        assert blobs.put(b"hello world") == blob_id
+        assert len(list(tmp_path.iterdir())) == 1
+
+    def test_invalid_id(self, tmp_path):
+        """Ids that could escape the root are rejected."""
+        with pytest.raises(ValueError):
+            BlobStore(tmp_path).path("sha256:../../etc/passwd")
+
+    def test_delete_and_clear(self, tmp_path):
+        """delete() drops one blob; clear() drops all."""
+        blobs = BlobStore(tmp_path)
+        first = blobs.put("a")
+        blobs.put("b")
+
+        blobs.delete(first)
+        with pytest.raises(FileNotFoundError):
+            blobs.read(first)
+        assert blobs.clear() == 1
+        assert BlobStore(tmp_path / "missing").clear() == 0
+
+
+class TestCapOutput:
+    """Test size caps on tool outputs."""
+
+    def test_small_output_unchanged(self):
+        """Outputs within the cap are returned as-is."""
+        value = {"rows": [1, 2, 3]}
+        assert cap_output(value, 1024) is value
+        assert cap_output("x" * 5000, None) == "x" * 5000
+
+    def test_large_output_truncated(self):
+        """Outputs over the cap become a reference with a preview."""
+        ref = cap_output("x" * 5000, 1000, preview_chars=10)
+
+        assert is_blob_ref(ref)
+        assert ref["size"] == 5000
+        assert ref["preview"] == "x" * 10 + "... [4990 more characters]"
+        assert "blob" not in ref
+
+    def test_large_output_spilled(self, tmp_path):
+        """With a blob store, the full output is written to disk."""
+        blobs = BlobStore(tmp_path)
+        ref = cap_output(["line"] * 1000, 1000, blobs)
+
+        assert blobs.read_text(ref["blob"]) == output_text(["line"] * 1000)
+        assert ref["path"] == str(blobs.path(ref["blob"]))
+        assert cap_output(ref, 10, blobs) is ref
+
+    def test_mcp_content_text(self):
+        """MCP text blocks are stored as their text."""
+        content = [
+            types.TextContent(type="text", text="first"),
+            types.TextContent(type="text", text="second"),
+        ]
+        assert output_text(content) == "first\nsecond"
+
+    def test_preview(self):
+        """Short text is not marked as cut."""
+        assert preview("short", 10) == "short"
@@ -0,0 +1,183 @@
+"""Tests for EpisodicMemory (conversation window with summarization)."""
+
+import pytest
+
+from agenthelm.memory import EpisodicMemory, MemoryContext, MemoryHub
+
+
+@pytest.fixture
+def hub(fake_embedder):
+    """Create an in-memory hub with a fake embedder."""
+    return MemoryHub()
+
+
+def word_count(text: str) -> int:
+    """Count tokens as words, for predictable budgets."""
+    return len(text.split())
+
+
+class TestEpisodicMemory:
+    """Tests for the turn window, folding and context assembly."""
+
+    @pytest.mark.asyncio
+    async def test_turns_in_order(self, hub):
+        """Turns are returned oldest first."""
+        episodes = EpisodicMemory(hub, session_id="s1")
+        await episodes.add("user", "hello")
+        await episodes.add("assistant", "hi there")
+
+        turns = await episodes.turns()
+        assert [(t.seq, t.role, t.content) for t in turns] == [
+            (0, "user", "hello"),
+            (1, "assistant", "hi there"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_folds_when_over_token_window(self, hub):
+        """Exceeding window_tokens folds the oldest turns into a summary."""
+        episodes = EpisodicMemory(
+            hub, session_id="s1", window_tokens=20, token_counter=word_count
+        )
+        for i in range(6):
+            await episodes.add("user", f"turn {i} " + "word " * 3)
+
+        turns = await episodes.turns()
+        assert sum(t.tokens for t in turns) <= 20
+        assert turns[-1].content.startswith("turn 5")
+
+        summaries = await episodes.summaries()
+        assert summaries[0]["first_seq"] == 0
+        assert "user: turn 0" in summaries[0]["text"]
+        # Every turn is either verbatim or folded, exactly once
+        folded = sum(s["last_seq"] - s["first_seq"] + 1 for s in summaries)
+        assert folded + len(turns) == 6
+
+    @pytest.mark.asyncio
+    async def test_ring_buffer_folds_when_full(self, hub):
+        """The buffer folds before reusing a slot."""
+        episodes = EpisodicMemory(hub, session_id="s1", max_turns=4)
+        for i in range(10):
+            await episodes.add("user", f"message {i}")
+
+        turns = await episodes.turns()
+        assert len(turns) <= 4
+        assert [t.content for t in turns][-1] == "message 9"
+        assert len(await hub.short_term.keys("session:s1:episode:turn:*")) <= 4
+
+    @pytest.mark.asyncio
+    async def test_summaries_stored_in_semantic_memory(self, hub):
+        """Folded summaries are searchable and tagged with the session."""
+        episodes = EpisodicMemory(
+            hub, session_id="s1", window_tokens=10, token_counter=word_count
+        )
+        for i in range(4):
+            await episodes.add("user", f"lisbon itinerary day {i} plans")
+
+        results = await hub.semantic.search(
+            "lisbon itinerary", filter={"session_id": "s1"}
+        )
+        assert results
+        assert results[0].metadata["type"] == "episode_summary"
+
+    @pytest.mark.asyncio
+    async def test_semantic_failure_keeps_summary(self, hub, monkeypatch):
+        """Folding still works when the summary can't be indexed."""
+
+        async def unavailable(*args, **kwargs):
+            raise ImportError("fastembed is not installed")
+
+        monkeypatch.setattr(hub.semantic, "store", unavailable)
+        episodes = EpisodicMemory(
+            hub, session_id="s1", window_tokens=10, token_counter=word_count
+        )
+        for i in range(4):
+            await episodes.add("user", f"lisbon itinerary day {i} plans")
+
+        assert await episodes.summaries()
+
+    @pytest.mark.asyncio
+    async def test_custom_summarizer(self, hub):
+        """A custom summarizer receives the folded turns."""
+        calls = []
+
+        def summarize(turns):
+            calls.append([t.seq for t in turns])
+            return f"{len(turns)} turns"
+
+        episodes = EpisodicMemory(
+            hub,
+            session_id="s1",
+            window_tokens=4,
+            token_counter=word_count,
+            summarizer=summarize,
+        )
+        for i in range(3):
+            await episodes.add("user", "one two three")
+
+        assert calls
+        assert (await episodes.summaries())[0]["text"] == f"{len(calls[0])} turns"
+
+    @pytest.mark.asyncio
+    async def test_context_respects_budget(self, hub):
+        """context() fits summaries and newest turns within the budget."""
+        episodes = EpisodicMemory(
+            hub, session_id="s1", window_tokens=12, token_counter=word_count
+        )
+        for i in range(8):
+            await episodes.add("user" if i % 2 == 0 else "assistant", f"msg {i} a b")
+
+        messages = await episodes.context(budget_tokens=40)
+        total = sum(word_count(m["content"]) for m in messages)
+        assert total <= 40
+        assert messages[0]["role"] == "system"
+        assert messages[0]["content"].startswith("Summary of earlier conversation")
+        assert messages[-1]["content"] == "msg 7 a b"
+
+    @pytest.mark.asyncio
+    async def test_context_drops_oldest_turns_first(self, hub):
+        """A small budget keeps only the newest turns."""
+        episodes = EpisodicMemory(hub, session_id="s1", token_counter=word_count)
+        for i in range(5):
+            await episodes.add("user", f"turn {i}")
+
+        messages = await episodes.context(budget_tokens=4)
+        assert [m["content"] for m in messages] == ["turn 3", "turn 4"]
+
+    @pytest.mark.asyncio
+    async def test_context_with_query(self, hub):
+        """A query selects summaries by relevance."""
+        episodes = EpisodicMemory(
+            hub, session_id="s1", window_tokens=6, token_counter=word_count
+        )
+        for i in range(4):
+            await episodes.add("user", f"topic {i} details")
+
+        messages = await episodes.context(budget_tokens=100, query="topic details")
+        assert messages[0]["role"] == "system"
+
+    @pytest.mark.asyncio
+    async def test_sessions_are_isolated(self, hub):
+        """Each session has its own window."""
+        first = EpisodicMemory(hub, session_id="a")
+        second = EpisodicMemory(hub, session_id="b")
+        await first.add("user", "from a")
+        await second.add("user", "from b")
+
+        assert [t.content for t in await first.turns()] == ["from a"]
+        assert [t.content for t in await second.turns()] == ["from b"]
+
+    @pytest.mark.asyncio
+    async def test_memory_context_cleanup_removes_episode(self, hub):
+        """MemoryContext cleanup removes the session's episode keys."""
+        async with MemoryContext(hub, session_id="s1"):
+            episodes = EpisodicMemory(hub, session_id="s1")
+            await episodes.add("user", "hello")
+
+        assert await episodes.turns() == []
+
+    def test_invalid_arguments(self, hub):
+        """Out-of-range configuration is rejected."""
+        with pytest.raises(ValueError, match="max_turns"):
+            EpisodicMemory(hub, max_turns=1)
+        with pytest.raises(ValueError, match="fold_target"):
+            EpisodicMemory(hub, fold_target=1.5)
@@ -0,0 +1,193 @@
+"""Tests for agenthelm.agent.llm_cache - LLMCache and cached agent runs."""
+
+import time
+import warnings
+
+import dspy
+from dspy.utils import DummyLM
+
+from agenthelm import LLMCache, PlannerAgent, ToolAgent
+from agenthelm.agent.llm_cache import CachedLM, resolve_llm_cache, track_llm_cache
+
+
+class TestLLMCache:
+    """Test the two-tier cache."""
+
+    def test_memory_hit_and_miss(self):
+        """Entries are found by key; unknown keys miss."""
+        cache = LLMCache(db_path=None)
+        cache.put("k", {"outputs": ["hi"], "latency": 1.0})
+
+        assert cache.get("k")["outputs"] == ["hi"]
+        assert cache.get("other") is None
+        assert cache.stats["hits"] == 1
+        assert cache.stats["misses"] == 1
+
+    def test_key_covers_model_messages_and_params(self):
+        """Any change to the request changes the key."""
+        messages = [{"role": "user", "content": "hi"}]
+        key = LLMCache.key("gpt-4o", messages, {"temperature": 0})
+
+        assert key == LLMCache.key("gpt-4o", messages, {"temperature": 0})
+        assert key != LLMCache.key("gpt-4o-mini", messages, {"temperature": 0})
+        assert key != LLMCache.key("gpt-4o", messages, {"temperature": 1})
+        assert key != LLMCache.key("gpt-4o", [{"role": "user", "content": "yo"}], {})
+
+    def test_sqlite_tier_persists(self, tmp_path):
+        """A new cache on the same file sees earlier entries."""
+        db_path = tmp_path / "llm_cache.db"
+        LLMCache(db_path=db_path).put("k", {"outputs": ["hi"]})
+
+        cache = LLMCache(db_path=db_path)
+        assert cache.get("k") == {"outputs": ["hi"]}
+        assert cache.stats["size"] == 1  # Promoted to memory
+
+        cache.clear()
+        assert LLMCache(db_path=db_path).get("k") is None
+
+    def test_ttl(self, tmp_path, monkeypatch):
+        """Expired entries miss in both tiers."""
+        cache = LLMCache(ttl=10, db_path=tmp_path / "llm_cache.db")
+        cache.put("k", {"outputs": ["hi"]})
+
+        now = time.time()
+        monkeypatch.setattr(time, "time", lambda: now + 11)
+        assert cache.get("k") is None
+
+    def test_lru_eviction(self):
+        """The least recently used entry is evicted past maxsize."""
+        cache = LLMCache(maxsize=2, db_path=None)
+        cache.put("a", {"outputs": []})
+        cache.put("b", {"outputs": []})
+        cache.get("a")
+        cache.put("c", {"outputs": []})
+
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+
+
+class TestCachedLM:
+    """Test the DSPy LM wrapper."""
+
+    def test_identical_calls_hit(self):
+        """A repeated prediction is served without calling the LM."""
+        lm = DummyLM([{"answer": "first"}, {"answer": "second"}])
+        cached = CachedLM(lm, LLMCache(db_path=None))
+        predict = dspy.Predict("question -> answer")
+
+        with dspy.context(lm=cached), track_llm_cache() as stats:
+            assert predict(question="q").answer == "first"
+            assert predict(question="q").answer == "first"
+            assert predict(question="other").answer == "second"
+
+        assert stats.hits == 1
+        assert stats.misses == 2
+        assert stats.saved_seconds > 0
+        assert len(lm.history) == 2
+
+    def test_saved_cost_is_this_calls(self):
+        """The cached cost comes from this call, not the newest history entry."""
+
+        class SharedLM(DummyLM):
+            """Another thread's call lands in history right after ours."""
+
+            def __call__(self, *args, **kwargs):
+                outputs = super().__call__(*args, **kwargs)
+                self.history[-1]["cost"] = 0.5
+                self.history.append({"outputs": ["other"], "cost": 9.0})
+                return outputs
+
+        cached = CachedLM(SharedLM([{"answer": "a"}]), LLMCache(db_path=None))
+        predict = dspy.Predict("question -> answer")
+
+        with dspy.context(lm=cached), track_llm_cache() as stats:
+            predict(question="q")
+            predict(question="q")
+
+        assert stats.saved_usd == 0.5
+
+    def test_forwarding_does_not_warn(self):
+        """Adapter calls pass through without DSPy deprecation warnings."""
+        cached = CachedLM(DummyLM([{"answer": "a"}]), LLMCache(db_path=None))
+        predict = dspy.Predict("question -> answer")
+
+        with dspy.context(lm=cached), warnings.catch_warnings():
+            warnings.simplefilter("error", DeprecationWarning)
+            assert predict(question="q").answer == "a"
+
+
+class TestAgentLLMCache:
+    """Test LLM caching configured per agent."""
+
+    @staticmethod
+    def react_lm():
+        """Scripted LM for one tool call followed by an answer."""
+        return DummyLM(
+            [
+                {
+                    "next_thought": "Look it up",
+                    "next_tool_name": "get_time",
+                    "next_tool_args": {"city": "Tokyo"},
+                },
+                {
+                    "next_thought": "Done",
+                    "next_tool_name": "finish",
+                    "next_tool_args": {},
+                },
+                {"reasoning": "Found it", "answer": "noon"},
+            ]
+        )
+
+    def test_replayed_run_hits(self):
+        """A replayed task skips the LM but still runs the tools."""
+        calls = []
+
+        def get_time(city: str) -> str:
+            """Get the time in a city."""
+            calls.append(city)
+            return "noon"
+
+        agent = ToolAgent(
+            name="clock",
+            lm=self.react_lm(),
+            tools=[get_time],
+            llm_cache=LLMCache(db_path=None),
+        )
+        first = agent.run("What time is it in Tokyo?")
+        second = agent.run("What time is it in Tokyo?")
+
+        assert first.answer == second.answer == "noon"
+        assert first.cache_hit is False
+        assert first.llm_cache_misses == 3
+        assert second.cache_hit is True
+        assert second.llm_cache_hits == 3
+        assert second.llm_cache_saved_seconds > 0
+        assert calls == ["Tokyo", "Tokyo"]
+
+    def test_no_cache_by_default(self):
+        """Agents call the model directly unless llm_cache is set."""
+        lm = self.react_lm()
+        agent = ToolAgent(name="clock", lm=lm, tools=[])
+        assert agent._run_lm is lm
+        assert agent.run("anything").llm_cache_misses == 0
+
+    def test_planner_cache_hit(self, tmp_path):
+        """Identical planning requests reuse the cached plan."""
+        steps = '[{"id": "s1", "tool": "search", "description": "Search"}]'
+        lm = DummyLM([{"reasoning": "r", "goal": "Find", "steps_json": steps}])
+        cache = LLMCache(db_path=tmp_path / "llm_cache.db")
+
+        first = PlannerAgent(name="planner", lm=lm, llm_cache=cache).plan("Find it")
+        second = PlannerAgent(name="planner", lm=lm, llm_cache=cache).plan("Find it")
+
+        assert first.cache_hit is False
+        assert second.cache_hit is True
+        assert second.steps[0].tool_name == "search"
+        assert len(lm.history) == 1
+
+    def test_resolve_llm_cache(self):
+        """llm_cache options resolve to LLMCache instances."""
+        cache = LLMCache(db_path=None)
+        assert resolve_llm_cache(None) is None
+        assert resolve_llm_cache(False) is None
+        assert resolve_llm_cache(cache) is cache
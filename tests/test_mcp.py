@@ -1,10 +1,30 @@
 """Tests for agenthelm.mcp - MCP integration."""
 
+import asyncio
+import sys
+import threading
+from pathlib import Path
+from typing import ClassVar
+
 import pytest
 
-from agenthelm.mcp import MCPClient, MCPToolAdapter
+from agenthelm.mcp import (
+    MCPClient,
+    MCPClientPool,
+    MCPToolAdapter,
+    MCPToolMesh,
+    ToolSchemaCache,
+)
+from agenthelm.mcp.client import gather_calls
+from agenthelm.mcp.mesh import server_name
+from agenthelm.core.blobs import BlobStore
 from agenthelm.core.tool import TOOL_REGISTRY
 
+try:
+    from mcp.shared.exceptions import MCPError
+except ImportError:  # mcp < 2
+    from mcp.shared.exceptions import McpError as MCPError
+
 
 class TestMCPClient:
     """Tests for MCPClient."""
@@ -60,3 +80,571 @@ class TestMCPToolAdapter:
 
         contract = TOOL_REGISTRY["create_file"]["contract"]
         assert contract["compensating_tool"] == "delete_file"
+
+
+class FakeClient:
+    """Stand-in for MCPClient that records the thread each call ran on."""
+
+    def __init__(self):
+        self.threads = []
+        self.connected = False
+        self.server_version = "1.0"
+        self.list_calls = 0
+
+    def on_tools_changed(self, callback):
+        self.tools_changed = callback
+
+    async def connect(self):
+        self.threads.append(threading.current_thread().name)
+        self.connected = True
+
+    async def list_tools(self):
+        self.list_calls += 1
+        return [{"name": "echo", "description": "Echo", "inputSchema": {}}]
+
+    async def call_tool(self, name, arguments):
+        self.threads.append(threading.current_thread().name)
+        if arguments.get("sleep"):
+            await asyncio.sleep(arguments["sleep"])
+        return arguments
+
+    async def close(self):
+        self.threads.append(threading.current_thread().name)
+
+
+class TestMCPToolAdapterLoop:
+    """Tests for running MCP calls on the adapter's background loop."""
+
+    @pytest.fixture
+    def adapter(self):
+        """Create an adapter around a fake client."""
+        adapter = MCPToolAdapter({"command": "test"}, timeout=0.5)
+        adapter._client = FakeClient()
+        yield adapter
+        adapter._loop.stop()
+
+    @pytest.mark.asyncio
+    async def test_sync_tool_inside_running_loop(self, adapter):
+        """Sync tool calls from a running loop run on the background loop."""
+        await adapter.connect()
+        (echo,) = adapter.get_tools()
+
+        assert echo(text="hi") == {"text": "hi"}
+        assert set(adapter._client.threads) == {"agenthelm-mcp"}
+
+    def test_sync_tool_without_loop(self, adapter):
+        """Sync tool calls work when no loop is running."""
+        asyncio.run(adapter.connect())
+        (echo,) = adapter.get_tools()
+        assert echo(text="hi") == {"text": "hi"}
+
+    @pytest.mark.asyncio
+    async def test_tool_timeout(self, adapter):
+        """Slow tool calls raise TimeoutError."""
+        await adapter.connect()
+        (echo,) = adapter.get_tools()
+        with pytest.raises(TimeoutError):
+            echo(sleep=5)
+
+    @pytest.mark.asyncio
+    async def test_close_stops_owned_loop(self, adapter):
+        """close() closes the session on its loop and stops the thread."""
+        await adapter.connect()
+        await adapter.close()
+
+        assert adapter._client.threads[-1] == "agenthelm-mcp"
+        assert not adapter._loop.is_running
+
+
+class TestMCPToolAdapterCache:
+    """Tests for result caching of MCP tools."""
+
+    @pytest.mark.asyncio
+    async def test_cached_tool(self):
+        """Repeat calls with the same arguments skip the server."""
+        adapter = MCPToolAdapter({"command": "test"}, cache={"echo": 60})
+        adapter._client = FakeClient()
+        try:
+            await adapter.connect()
+            (echo,) = adapter.get_tools()
+
+            assert echo(text="hi") == {"text": "hi"}
+            assert echo(text="hi") == {"text": "hi"}
+            assert echo(text="bye") == {"text": "bye"}
+            assert len(adapter._client.threads) == 3  # connect + 2 calls
+
+            cache = TOOL_REGISTRY["echo"]["contract"]["cache"]
+            assert cache.ttl == 60
+            assert echo.__wrapped__(text="hi") == {"text": "hi"}
+        finally:
+            await adapter.close()
+
+    def test_only_listed_tools_are_cached(self):
+        """A per-tool map leaves other tools uncached."""
+        adapter = MCPToolAdapter({"command": "test"}, cache={"lookup": True})
+        adapter._tools = [
+            {"name": "lookup", "inputSchema": {}},
+            {"name": "write", "inputSchema": {}},
+        ]
+        adapter.get_tools()
+
+        assert TOOL_REGISTRY["lookup"]["contract"]["cache"] is not None
+        assert TOOL_REGISTRY["write"]["contract"]["cache"] is None
+
+    def test_mesh_passes_cache_option(self):
+        """A server's cache option reaches its adapter."""
+        mesh = MCPToolMesh([{"name": "time", "command": "test", "cache": 30}])
+        adapter = mesh.adapters["time"]
+        assert adapter._default_cache.ttl == 30
+        assert "cache" not in adapter._server_config
+
+
+class TestToolSchemaCache:
+    """Tests for the on-disk tool schema cache."""
+
+    TOOLS: ClassVar[list[dict]] = [
+        {"name": "echo", "description": "Echo", "inputSchema": {}}
+    ]
+
+    def test_round_trip(self, tmp_path):
+        """Stored schemas are returned for the same config."""
+        cache = ToolSchemaCache(tmp_path)
+        config = {"command": "python", "args": ["server.py"]}
+        assert cache.get(config) is None
+
+        cache.put(config, self.TOOLS, server_version="1.2")
+        assert cache.get(config) == self.TOOLS
+        assert cache.get_entry(config)["server_version"] == "1.2"
+
+    def test_key_covers_args_env_and_version(self, tmp_path):
+        """Different args, env or version miss the cache."""
+        cache = ToolSchemaCache(tmp_path)
+        config = {"command": "python", "args": ["a.py"]}
+        cache.put(config, self.TOOLS)
+
+        assert cache.get({"command": "python", "args": ["b.py"]}) is None
+        assert cache.get({**config, "env": {"MODE": "x"}}) is None
+        assert cache.get({**config, "version": "2"}) is None
+
+    def test_ttl(self, tmp_path, monkeypatch):
+        """Entries older than the TTL are ignored."""
+        from agenthelm.mcp import schema_cache
+
+        cache = ToolSchemaCache(tmp_path, ttl=60)
+        config = {"command": "python"}
+        cache.put(config, self.TOOLS)
+
+        now = schema_cache.time.time()
+        monkeypatch.setattr(schema_cache.time, "time", lambda: now + 61)
+        assert cache.get(config) is None
+
+    def test_invalidate_and_clear(self, tmp_path):
+        """invalidate() drops one entry, clear() drops all."""
+        cache = ToolSchemaCache(tmp_path)
+        first, second = {"command": "python"}, {"command": "node"}
+        cache.put(first, self.TOOLS)
+        cache.put(second, self.TOOLS)
+
+        cache.invalidate(first)
+        assert cache.get(first) is None
+        assert cache.clear() == 1
+        assert cache.get(second) is None
+
+    def test_corrupt_file_is_a_miss(self, tmp_path):
+        """An unreadable cache file is ignored."""
+        cache = ToolSchemaCache(tmp_path)
+        config = {"command": "python"}
+        cache.put(config, self.TOOLS)
+        cache._path(config).write_text("{not json")
+        assert cache.get(config) is None
+
+
+class TestMCPToolAdapterSchemaCache:
+    """Tests for schema caching and lazy connection in MCPToolAdapter."""
+
+    def make_adapter(self, tmp_path, **kwargs):
+        """Create an adapter with a fake client and a temp schema cache."""
+        adapter = MCPToolAdapter(
+            {"command": "test"}, schema_cache=ToolSchemaCache(tmp_path), **kwargs
+        )
+        adapter._client = FakeClient()
+        adapter._client.on_tools_changed(adapter._on_tools_changed)
+        return adapter
+
+    @pytest.mark.asyncio
+    async def test_second_run_skips_discovery(self, tmp_path):
+        """A cache hit with the same server version skips list_tools."""
+        first = self.make_adapter(tmp_path)
+        await first.connect()
+        assert first._client.list_calls == 1
+        await first.close()
+
+        second = self.make_adapter(tmp_path)
+        await second.connect()
+        assert second._client.list_calls == 0
+        assert [t.__name__ for t in second.get_tools()] == ["echo"]
+        await second.close()
+
+    @pytest.mark.asyncio
+    async def test_server_version_change_refreshes(self, tmp_path):
+        """A different reported server version re-discovers tools."""
+        first = self.make_adapter(tmp_path)
+        await first.connect()
+        await first.close()
+
+        second = self.make_adapter(tmp_path)
+        second._client.server_version = "2.0"
+        await second.connect()
+        assert second._client.list_calls == 1
+        await second.close()
+
+    @pytest.mark.asyncio
+    async def test_lazy_connects_on_first_call(self, tmp_path):
+        """With lazy=True a cache hit defers starting the server."""
+        first = self.make_adapter(tmp_path)
+        await first.connect()
+        await first.close()
+
+        lazy = self.make_adapter(tmp_path, lazy=True)
+        await lazy.connect()
+        (echo,) = lazy.get_tools()
+        assert not lazy._client.connected
+
+        assert echo(text="hi") == {"text": "hi"}
+        assert lazy._client.connected
+        await lazy.close()
+
+    @pytest.mark.asyncio
+    async def test_list_changed_invalidates_cache(self, tmp_path):
+        """A tools/list_changed notification refreshes the cached schemas."""
+        adapter = self.make_adapter(tmp_path)
+        await adapter.connect()
+
+        async def notify():
+            adapter._client.tools_changed()
+            await adapter._refresh_task
+
+        adapter._loop.run(notify(), timeout=5)
+        assert adapter._client.list_calls == 2
+        assert adapter._schema_cache.get({"command": "test"}) is not None
+        await adapter.close()
+
+
+@pytest.fixture
+def server_config():
+    """Config for the local stdio test server in tests/mcp_server.py."""
+    try:
+        import mcp.server.mcpserver  # noqa: F401
+    except ImportError:
+        pytest.importorskip("mcp.server.fastmcp")
+    return {
+        "command": sys.executable,
+        "args": [str(Path(__file__).parent / "mcp_server.py")],
+    }
+
+
+def text_of(content) -> str:
+    """Extract the text of a single-item tool result."""
+    return content[0].text
+
+
+class TestMCPClientPool:
+    """Tests for MCPClientPool against a local stdio server."""
+
+    def test_invalid_size(self):
+        """A pool needs at least one active member."""
+        with pytest.raises(ValueError, match="size"):
+            MCPClientPool({"command": "test"}, size=0)
+
+    @pytest.mark.asyncio
+    async def test_routes_least_loaded(self, server_config):
+        """Concurrent calls are spread across server processes."""
+        async with MCPClientPool(server_config, size=2) as pool:
+            results = await asyncio.gather(
+                pool.call_tool("sleep", {"seconds": 0.3}),
+                pool.call_tool("sleep", {"seconds": 0.3}),
+            )
+            assert len({text_of(r) for r in results}) == 2
+            assert [m["in_flight"] for m in pool.stats] == [0, 0]
+
+    @pytest.mark.asyncio
+    async def test_spare_takes_over_and_dead_member_restarts(self, server_config):
+        """A crashed server is replaced by a spare, then restarted."""
+        pool = MCPClientPool(server_config, size=1, spares=1, backoff_base=0.05)
+        await pool.connect()
+        try:
+            first_pid = text_of(await pool.call_tool("pid", {}))
+            with pytest.raises(MCPError):
+                await pool.call_tool("crash", {})
+
+            # The spare serves the next call immediately
+            assert text_of(await pool.call_tool("pid", {})) != first_pid
+            assert [m["active"] for m in pool.stats] == [False, True]
+
+            for _ in range(100):
+                if pool.stats[0]["healthy"]:
+                    break
+                await asyncio.sleep(0.1)
+            assert pool.stats[0]["restarts"] == 1
+            assert pool.stats[0]["active"]
+        finally:
+            await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_timeouts_keep_member(self, server_config):
+        """A timed-out call doesn't take a healthy server out."""
+        async with MCPClientPool(server_config, size=1) as pool:
+            with pytest.raises(TimeoutError):
+                await pool.call_tool("sleep", {"seconds": 1}, timeout=0.1)
+            assert pool.stats[0]["healthy"]
+            assert text_of(await pool.call_tool("echo", {"text": "ok"})) == "ok"
+
+    @pytest.mark.asyncio
+    async def test_adapter_with_pool(self, server_config):
+        """MCPToolAdapter uses a pool when pool_size > 1."""
+        adapter = MCPToolAdapter(server_config, pool_size=2)
+        assert isinstance(adapter._client, MCPClientPool)
+        await adapter.connect()
+        tools = {tool.__name__: tool for tool in adapter.get_tools()}
+        assert text_of(tools["echo"](text="pooled")) == "pooled"
+        await adapter.close()
+
+
+class TestCallMany:
+    """Tests for concurrent, pipelined tool calls."""
+
+    @pytest.mark.asyncio
+    async def test_gather_calls_limits_concurrency(self):
+        """No more than `concurrency` calls are in flight; order is kept."""
+        in_flight = []
+        running = 0
+
+        async def call_tool(name, arguments, timeout):
+            nonlocal running
+            running += 1
+            in_flight.append(running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return arguments["n"]
+
+        calls = [("t", {"n": n}) for n in range(10)]
+        assert await gather_calls(call_tool, calls, concurrency=3) == list(range(10))
+        assert max(in_flight) == 3
+        with pytest.raises(ValueError):
+            await gather_calls(call_tool, calls, concurrency=0)
+
+    @pytest.mark.asyncio
+    async def test_client_pipelines_requests(self, server_config):
+        """Concurrent calls on one session overlap instead of queueing."""
+        async with MCPClient(server_config) as client:
+            start = asyncio.get_running_loop().time()
+            results = await client.call_many(
+                [("sleep", {"seconds": 0.5})] * 4, concurrency=4
+            )
+            elapsed = asyncio.get_running_loop().time() - start
+
+            assert len({text_of(r) for r in results}) == 1  # One process
+            assert elapsed < 1.5  # One at a time would take 2s
+
+            echoed = await client.call_many(
+                [("echo", {"text": str(n)}) for n in range(20)], concurrency=5
+            )
+            assert [text_of(r) for r in echoed] == [str(n) for n in range(20)]
+
+    def test_adapter_call_many(self):
+        """The sync adapter API returns results (or errors) in order."""
+        adapter = MCPToolAdapter({"command": "test"}, timeout=0.2)
+        adapter._client = FakeClient()
+        try:
+            calls = [("echo", {"n": n}) for n in range(5)]
+            assert adapter.call_many(calls) == [{"n": n} for n in range(5)]
+
+            results = adapter.call_many(
+                [("echo", {"n": 1}), ("echo", {"sleep": 5})], return_exceptions=True
+            )
+            assert results[0] == {"n": 1}
+            assert isinstance(results[1], TimeoutError)
+        finally:
+            adapter._loop.stop()
+
+    def test_mesh_call_many_checks_names_first(self):
+        """Unknown tools raise before any call is sent."""
+        mesh = MCPToolMesh([{"name": "a", "command": "test"}])
+        mesh.adapters["a"]._client = FakeClient()
+        try:
+            with pytest.raises(KeyError):
+                mesh.call_many([("a__echo", {}), ("b__echo", {})])
+            assert mesh.adapters["a"]._client.threads == []
+
+            assert mesh.call_many([("a__echo", {"x": 1})]) == [{"x": 1}]
+        finally:
+            mesh._loop.stop()
+
+
+class TestMCPLargeOutputs:
+    """Tests for output caps and progress against a local stdio server."""
+
+    @pytest.mark.asyncio
+    async def test_large_output_spilled(self, server_config, tmp_path):
+        """Outputs over max_output_bytes come back as a blob reference."""
+        blobs = BlobStore(tmp_path)
+        adapter = MCPToolAdapter(
+            server_config, max_output_bytes=1000, blob_store=blobs, preview_chars=20
+        )
+        await adapter.connect()
+        try:
+            assert text_of(adapter.call_tool("big", {"size": 10})) == "x" * 10
+
+            ref = adapter.call_tool("big", {"size": 50_000})
+            assert ref["truncated"] is True
+            assert ref["size"] == 50_000
+            assert ref["preview"].startswith("x" * 20 + "...")
+            assert blobs.read_text(ref["blob"]) == "x" * 50_000
+        finally:
+            await adapter.close()
+
+    @pytest.mark.asyncio
+    async def test_progress_callback(self, server_config):
+        """Progress notifications reach the callback before the result."""
+        updates = []
+        adapter = MCPToolAdapter(
+            server_config,
+            namespace="test",
+            on_progress=lambda *update: updates.append(update),
+        )
+        await adapter.connect()
+        try:
+            assert text_of(adapter.call_tool("count", {"steps": 3})) == "3"
+            assert updates == [
+                ("test__count", 1, 3, "step 1"),
+                ("test__count", 2, 3, "step 2"),
+                ("test__count", 3, 3, "step 3"),
+            ]
+
+            async def per_call(*update):
+                updates.append(update)
+
+            updates.clear()
+            adapter.call_tool("count", {"steps": 1}, on_progress=per_call)
+            assert updates == [("test__count", 1, 1, "step 1")]
+        finally:
+            await adapter.close()
+
+
+class TestMCPToolMesh:
+    """Tests for MCPToolMesh."""
+
+    def test_server_names(self):
+        """Names come from config or are derived and sanitized."""
+        assert server_name({"name": "my time", "command": "uvx"}) == "my_time"
+        assert server_name({"command": "uvx", "args": ["mcp-server-time"]}) == (
+            "mcp_server_time"
+        )
+        assert server_name({"command": "/usr/bin/srv", "args": ["--stdio"]}) == "srv"
+        assert server_name({"name": "a__b", "command": "x"}) == "a_b"
+
+    def test_duplicate_names_get_suffixes(self):
+        """Servers with the same name get unique namespaces."""
+        mesh = MCPToolMesh(
+            [{"name": "fs", "command": "a"}, {"name": "fs", "command": "b"}]
+        )
+        assert list(mesh.adapters) == ["fs", "fs_2"]
+
+    def test_from_config(self):
+        """from_config reads the mcp_servers list."""
+        mesh = MCPToolMesh.from_config(
+            {"mcp_servers": [{"name": "time", "command": "uvx", "args": ["x"]}]}
+        )
+        assert list(mesh.adapters) == ["time"]
+        assert mesh.adapters["time"]._server_config == {
+            "command": "uvx",
+            "args": ["x"],
+        }
+
+    def test_namespaced_registry_and_compensations(self):
+        """Tools and their compensations are registered under the namespace."""
+        mesh = MCPToolMesh(
+            [
+                {
+                    "name": "files",
+                    "command": "test",
+                    "compensations": {"create": "delete"},
+                }
+            ]
+        )
+        adapter = mesh.adapters["files"]
+        adapter._tools = [{"name": "create", "inputSchema": {}}]
+
+        (tool,) = mesh.get_tools()
+        assert tool.__name__ == "files__create"
+        contract = TOOL_REGISTRY["files__create"]["contract"]
+        assert contract["compensating_tool"] == "files__delete"
+
+    @pytest.mark.asyncio
+    async def test_connects_servers_concurrently(self):
+        """Startup takes as long as the slowest server, not the sum."""
+        import time
+
+        class SlowClient(FakeClient):
+            async def connect(self):
+                await asyncio.sleep(0.5)
+                await super().connect()
+
+        mesh = MCPToolMesh([{"name": n, "command": "test"} for n in "abc"])
+        for adapter in mesh.adapters.values():
+            adapter._client = SlowClient()
+
+        start = time.perf_counter()
+        await mesh.connect()
+        assert time.perf_counter() - start < 1.0
+        assert mesh.servers == ["a", "b", "c"]
+        await mesh.close()
+
+    @pytest.mark.asyncio
+    async def test_routes_calls_to_servers(self, server_config):
+        """Each namespaced tool calls its own server process."""
+        mesh = MCPToolMesh(
+            [{"name": "a", **server_config}, {"name": "b", **server_config}]
+        )
+        await mesh.connect()
+        try:
+            tools = {tool.__name__: tool for tool in mesh.get_tools()}
+            assert {"a__echo", "b__echo"} <= set(tools)
+
+            pid_a = text_of(mesh.call_tool("a__pid", {}))
+            pid_b = text_of(tools["b__pid"]())
+            assert pid_a != pid_b
+            with pytest.raises(KeyError):
+                mesh.call_tool("missing__echo", {})
+        finally:
+            await mesh.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_server_is_skipped(self, server_config):
+        """A server that can't start doesn't take the mesh down."""
+        mesh = MCPToolMesh(
+            [
+                {"name": "good", **server_config},
+                {"name": "bad", "command": "agenthelm-no-such-server"},
+            ]
+        )
+        await mesh.connect()
+        try:
+            assert mesh.servers == ["good"]
+            assert "bad" in mesh.errors
+            assert all(t.__name__.startswith("good__") for t in mesh.get_tools())
+        finally:
+            await mesh.close()
+
+    @pytest.mark.asyncio
+    async def test_strict_raises(self, server_config):
+        """strict=True raises if any server fails."""
+        mesh = MCPToolMesh(
+            [
+                {"name": "good", **server_config},
+                {"name": "bad", "command": "agenthelm-no-such-server"},
+            ],
+            strict=True,
+        )
+        with pytest.raises(FileNotFoundError):
+            await mesh.connect()
@@ -88,6 +88,19 @@ class TestMemoryContext:
         ctx2 = MemoryContext(hub, session_id=session_id, cleanup_on_exit=False)
         assert await ctx2.get("key") is None
 
+    @pytest.mark.asyncio
+    async def test_cleanup_leaves_other_sessions(self, hub):
+        """Cleanup deletes one session's keys in bulk and keeps the rest."""
+        other = MemoryContext(hub, session_id="s1-other", cleanup_on_exit=False)
+        await other.set("key", "kept")
+
+        async with MemoryContext(hub, session_id="s1") as ctx:
+            for i in range(50):
+                await ctx.set(f"key:{i}", i)
+
+        assert await hub.short_term.keys("session:s1:*") == []
+        assert await other.get("key") == "kept"
+
     @pytest.mark.asyncio
     async def test_no_cleanup_when_disabled(self, hub):
         """Test cleanup can be disabled."""
@@ -0,0 +1,119 @@
+"""Tests for memory instrumentation (MemoryMetrics and instrumented backends)."""
+
+import pytest
+
+from agenthelm.memory import MemoryHub, MemoryMetrics
+
+
+class TestMemoryMetrics:
+    """Tests for in-process aggregation."""
+
+    def test_snapshot_aggregates(self):
+        """Counts, latency stats, sizes and hit ratio per operation."""
+        metrics = MemoryMetrics()
+        metrics.record("redis", "get", 0.3, size=100, hit=True)
+        metrics.record("redis", "get", 7.0, size=300, hit=False)
+        metrics.record("redis", "set", 1.0)
+
+        get = metrics.snapshot()["redis"]["get"]
+        assert get["count"] == 2
+        assert get["latency_ms"]["min"] == 0.3
+        assert get["latency_ms"]["max"] == 7.0
+        assert get["latency_ms"]["buckets"]["0.5"] == 1
+        assert get["latency_ms"]["buckets"]["10.0"] == 1
+        assert get["latency_ms"]["p50"] == 0.5
+        assert get["avg_bytes"] == 200
+        assert get["hit_ratio"] == 0.5
+        assert metrics.snapshot()["redis"]["set"]["hit_ratio"] is None
+
+    def test_time_records_errors(self):
+        """Exceptions inside a timed block are counted and re-raised."""
+        metrics = MemoryMetrics()
+        with pytest.raises(RuntimeError), metrics.time("sqlite", "get"):
+            raise RuntimeError("boom")
+
+        assert metrics.snapshot()["sqlite"]["get"]["errors"] == 1
+
+    def test_reset(self):
+        """reset() drops all measurements."""
+        metrics = MemoryMetrics()
+        metrics.record("sqlite", "get", 1.0)
+        metrics.reset()
+        assert metrics.snapshot() == {}
+
+    def test_exports_to_opentelemetry(self):
+        """Measurements are mirrored to OTel instruments."""
+        from opentelemetry.sdk.metrics import MeterProvider
+        from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+
+        reader = InMemoryMetricReader()
+        meter = MeterProvider(metric_readers=[reader]).get_meter("test")
+        metrics = MemoryMetrics(meter=meter)
+        metrics.record("redis", "get", 2.0, size=10, hit=True)
+
+        names = {
+            metric.name
+            for resource in reader.get_metrics_data().resource_metrics
+            for scope in resource.scope_metrics
+            for metric in scope.metrics
+        }
+        assert {
+            "agenthelm.memory.duration",
+            "agenthelm.memory.operations",
+            "agenthelm.memory.payload_size",
+            "agenthelm.memory.lookups",
+        } <= names
+
+
+class TestInstrumentedHub:
+    """Tests for MemoryHub(instrument=True)."""
+
+    def test_disabled_by_default(self):
+        """Hubs are not instrumented unless asked."""
+        assert MemoryHub().metrics is None
+
+    @pytest.mark.asyncio
+    async def test_short_term_hit_ratio_and_serialization(self, tmp_path):
+        """SQLite operations record hits, misses and encoded sizes."""
+        hub = MemoryHub(data_dir=tmp_path, instrument=True)
+        await hub.short_term.set("key", {"a": 1})
+        await hub.short_term.get("key")
+        await hub.short_term.get("missing")
+
+        sqlite = hub.metrics.snapshot()["sqlite"]
+        assert sqlite["get"]["count"] == 2
+        assert sqlite["get"]["hit_ratio"] == 0.5
+        assert sqlite["serialize"]["bytes"] == len(b'{"a": 1}')
+        assert sqlite["deserialize"]["count"] == 1
+        await hub.close()
+
+    @pytest.mark.asyncio
+    async def test_tiered_reports_each_tier(self, tmp_path):
+        """A tiered short-term memory reports L1 and backend separately."""
+        hub = MemoryHub(data_dir=tmp_path, short_term_cache_size=10, instrument=True)
+        await hub.short_term.set("key", "value")
+        await hub.short_term.get("key")
+
+        snapshot = hub.metrics.snapshot()
+        assert snapshot["tiered"]["get"]["hit_ratio"] == 1.0
+        assert snapshot["l1"]["get"]["hits"] == 1
+        assert snapshot["sqlite"]["set_many"]["count"] == 1
+        assert "get" not in snapshot["sqlite"]
+        await hub.close()
+
+    @pytest.mark.asyncio
+    async def test_semantic_stage_breakdown(self, fake_embedder):
+        """Semantic search is split into embedding and Qdrant time."""
+        hub = MemoryHub(instrument=True)
+        await hub.semantic.store("the quick brown fox")
+        results = await hub.semantic.search("quick fox", top_k=1)
+        assert results
+
+        semantic = hub.metrics.snapshot()["semantic"]
+        assert semantic["search"]["hit_ratio"] == 1.0
+        assert semantic["store"]["bytes"] == len("the quick brown fox")
+        assert semantic["qdrant_search"]["count"] == 1
+        assert semantic["qdrant_upsert"]["count"] == 1
+        # Dimension probe, store and query
+        assert semantic["embed"]["count"] == 3
+        await hub.close()
@@ -1,5 +1,8 @@
 """Tests for agenthelm.orchestration - AgentRegistry and Orchestrator."""
 
+import threading
+import time
+
 import pytest
 from unittest.mock import MagicMock
 
@@ -308,6 +311,66 @@ class TestOrchestrator:
         assert not result.success
         assert plan.steps[0].status == StepStatus.FAILED
 
+    @pytest.fixture
+    def slow_plan(self):
+        """Three independent steps on an agent that blocks for 0.2s."""
+        return Plan(
+            goal="Slow",
+            approved=True,
+            steps=[
+                PlanStep(id=s, agent_name="slow", tool_name="t", description=s)
+                for s in ("a", "b", "c")
+            ],
+        )
+
+    @staticmethod
+    def slow_registry(calls):
+        """Registry with an agent whose run() sleeps and counts overlap."""
+        lock = threading.Lock()
+        state = {"running": 0}
+
+        def run(task):
+            with lock:
+                state["running"] += 1
+                calls.append(state["running"])
+            time.sleep(0.2)
+            with lock:
+                state["running"] -= 1
+            return AgentResult(success=True, answer=task, events=[])
+
+        agent = MagicMock()
+        agent.name = "slow"
+        agent.run.side_effect = run
+        registry = AgentRegistry()
+        registry.register(agent)
+        return registry
+
+    @pytest.mark.asyncio
+    async def test_parallel_steps_overlap(self, slow_plan):
+        """Sync agent.run() calls for ready steps run at the same time."""
+        calls = []
+        orchestrator = Orchestrator(self.slow_registry(calls))
+
+        start = time.monotonic()
+        result = await orchestrator.execute(slow_plan)
+
+        assert result.success
+        assert max(calls) > 1
+        assert time.monotonic() - start < 0.5
+
+    @pytest.mark.asyncio
+    async def test_max_parallel(self, slow_plan):
+        """max_parallel bounds how many steps run at once."""
+        calls = []
+        orchestrator = Orchestrator(self.slow_registry(calls), max_parallel=1)
+
+        result = await orchestrator.execute(slow_plan)
+
+        assert result.success
+        assert calls == [1, 1, 1]
+        with pytest.raises(ValueError):
+            Orchestrator(AgentRegistry(), max_parallel=0)
+
 
 class TestOrchestratorSaga:
     """Tests for Saga pattern (rollback on failure)."""
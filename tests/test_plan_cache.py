@@ -0,0 +1,225 @@
+"""Tests for agenthelm.agent.plan_cache - PlanCache and cached planning."""
+
+import json
+
+import pytest
+from dspy.utils import DummyLM
+
+from agenthelm import Plan, PlanCache, PlannerAgent, PlanStep
+from agenthelm.agent.plan_cache import rebind, task_bindings
+from agenthelm.memory.semantic import SemanticMemory
+
+
+@pytest.fixture
+def cache(fake_embedder):
+    """PlanCache over an in-memory SemanticMemory with a fake embedder."""
+    fake_embedder(64)
+    cache = PlanCache(SemanticMemory(vector_size=64), threshold=0.7)
+    yield cache
+    cache.close()
+
+
+def weather_plan(city: str) -> Plan:
+    """A one-step plan for a weather lookup."""
+    return Plan(
+        goal=f"Get the weather in {city}",
+        steps=[
+            PlanStep(
+                id="s1",
+                tool_name="get_weather",
+                description=f"Look up {city}",
+                args={"city": city, "units": "metric"},
+            )
+        ],
+    )
+
+
+def transfer_plan(amount: int, recipient: str) -> Plan:
+    """A one-step plan for a money transfer."""
+    return Plan(
+        goal=f"Transfer {amount} to {recipient}",
+        steps=[
+            PlanStep(
+                id="s1",
+                tool_name="send_money",
+                description=f"Send {amount} to {recipient}",
+                args={"amount": amount, "recipient": recipient},
+            )
+        ],
+    )
+
+
+def weather(city: str) -> str:
+    """Get the weather for a city."""
+    return "sunny"
+
+
+class TestBindings:
+    """Test re-binding args to a new task."""
+
+    def test_task_bindings(self):
+        """Differing word spans map old to new."""
+        bindings = task_bindings(
+            "Book a flight to New York on Friday.", "Book a flight to Paris on Monday."
+        )
+        assert bindings == ({"New York": "Paris", "Friday": "Monday"}, [])
+
+    def test_identical_tasks_have_no_bindings(self):
+        """Nothing is re-bound when the tasks match."""
+        assert task_bindings("weather in Paris", "weather in Paris") == ({}, [])
+
+    def test_stopwords_and_verbs_are_not_bound(self):
+        """Only entity-like spans are bound; other changes are reported."""
+        bindings, unbound = task_bindings(
+            "Delete the file to Alice", "Back up the file from Alice"
+        )
+        assert bindings == {}
+        assert unbound == ["Delete", "to"]
+
+    def test_rebind_numbers(self):
+        """Numbers are matched by their string form and keep their type."""
+        bindings, _ = task_bindings(
+            "Transfer 100 dollars to Alice", "Transfer 1000 dollars to Bob"
+        )
+        assert bindings == {"100": "1000", "Alice": "Bob"}
+        value = {"amount": 100, "rate": 1.5, "to": "Alice"}
+        assert rebind(value, bindings) == {"amount": 1000, "rate": 1.5, "to": "Bob"}
+
+    def test_rebind_nested_values(self):
+        """Strings are re-bound on whole words inside dicts and lists."""
+        bindings = {"Paris": "Tokyo"}
+        value = {"city": "Paris", "tags": ["Paris trip", "Parisian"], "n": 3}
+        assert rebind(value, bindings) == {
+            "city": "Tokyo",
+            "tags": ["Tokyo trip", "Parisian"],
+            "n": 3,
+        }
+
+
+class TestPlanCache:
+    """Test lookups against stored plans."""
+
+    def test_similar_task_hits_with_rebound_args(self, cache):
+        """A paraphrase above the threshold reuses the plan for the new task."""
+        cache.store("what is the weather in Paris today", weather_plan("Paris"))
+
+        plan = cache.lookup("what is the weather in Tokyo today")
+
+        assert plan is not None
+        assert plan.cache_hit is True
+        assert plan.cache_score >= 0.7
+        assert plan.goal == "Get the weather in Tokyo"
+        assert plan.steps[0].args == {"city": "Tokyo", "units": "metric"}
+        assert plan.steps[0].description == "Look up Tokyo"
+
+    def test_dissimilar_task_misses(self, cache):
+        """A task below the threshold is a miss."""
+        cache.store("what is the weather in Paris today", weather_plan("Paris"))
+
+        assert cache.lookup("summarize the quarterly sales report") is None
+        assert cache.stats["misses"] == 1
+
+    def test_scope_separates_tool_sets(self, cache):
+        """Plans are only reused with the same tools and role."""
+        scope = PlanCache.scope(["get_weather"])
+        cache.store("what is the weather in Paris today", weather_plan("Paris"), scope)
+
+        assert cache.lookup("what is the weather in Paris today", scope) is not None
+        other = PlanCache.scope(["get_weather"], role="pirate")
+        assert cache.lookup("what is the weather in Paris today", other) is None
+
+    def test_runtime_state_is_not_reused(self, cache):
+        """Cached steps start pending, without earlier results."""
+        plan = weather_plan("Paris")
+        plan.mark_completed("s1", "sunny")
+        cache.store("what is the weather in Paris today", plan)
+
+        cached = cache.lookup("what is the weather in Paris today")
+        assert cached.steps[0].status == "pending"
+        assert cached.steps[0].result is None
+
+    def test_validator_rejects(self, cache):
+        """A rejected candidate counts as a miss."""
+        cache.validator = lambda task, plan: "Tokyo" not in task
+        cache.store("what is the weather in Paris today", weather_plan("Paris"))
+
+        assert cache.lookup("what is the weather in Tokyo today") is None
+        assert cache.lookup("what is the weather in Rome today") is not None
+        assert cache.stats["rejected"] == 1
+        assert cache.stats["hits"] == 1
+        assert cache.stats["hit_rate"] == 0.5
+
+    def test_numeric_args_are_rebound(self, cache):
+        """A changed amount is re-bound in the args, not just the text."""
+        cache.store("Transfer 100 dollars to Alice", transfer_plan(100, "Alice"))
+
+        plan = cache.lookup("Transfer 1000 dollars to Alice")
+        assert plan is not None
+        assert plan.steps[0].args == {"amount": 1000, "recipient": "Alice"}
+        assert plan.steps[0].description == "Send 1000 to Alice"
+
+    def test_changed_stopword_misses(self, cache):
+        """A changed function word used in an arg can't be re-bound."""
+        plan = weather_plan("Paris")
+        plan.steps[0].args["direction"] = "to"
+        cache.store("Book a flight to Paris today", plan)
+
+        assert cache.lookup("Book a flight from Paris today") is None
+        assert cache.stats["misses"] == 1
+
+    def test_changed_verb_misses(self, cache):
+        """A change to the action named by the tool is never reused."""
+        plan = Plan(
+            goal="Delete report.txt",
+            steps=[
+                PlanStep(
+                    id="s1",
+                    tool_name="delete_file",
+                    description="Delete report.txt",
+                    args={"path": "report.txt"},
+                )
+            ],
+        )
+        cache.store("Delete the file report.txt now", plan)
+
+        assert cache.lookup("Delete the file report.txt now") is not None
+        assert cache.lookup("Back up the file report.txt now") is None
+
+    def test_binding_without_arg_misses(self, cache):
+        """A changed value the plan doesn't take as an arg is a miss."""
+        cache.store("what is the weather in Paris on Friday", weather_plan("Paris"))
+
+        assert cache.lookup("what is the weather in Paris on Monday") is None
+        assert cache.lookup("what is the weather in Rome on Friday") is not None
+
+    def test_clear(self, cache):
+        """clear() drops plans and resets the counters."""
+        cache.store("what is the weather in Paris today", weather_plan("Paris"))
+        cache.lookup("what is the weather in Paris today")
+
+        cache.clear()
+        assert cache.stats["hits"] == 0
+        assert cache.lookup("what is the weather in Paris today") is None
+
+
+class TestPlannerAgentPlanCache:
+    """Test PlannerAgent with a plan cache."""
+
+    def test_second_plan_skips_the_lm(self, cache):
+        """Only the first of two similar tasks calls the LM."""
+        steps = json.dumps([{"id": "s1", "tool": "weather", "args": {"city": "Paris"}}])
+        lm = DummyLM(
+            [{"reasoning": "r", "goal": "Weather in Paris", "steps_json": steps}]
+        )
+        planner = PlannerAgent(name="planner", lm=lm, tools=[weather], plan_cache=cache)
+
+        first = planner.plan("what is the weather in Paris today")
+        second = planner.plan("what is the weather in Lima today")
+
+        assert first.cache_hit is False
+        assert second.cache_hit is True
+        assert second.goal == "Weather in Lima"
+        assert second.steps[0].args == {"city": "Lima"}
+        assert len(lm.history) == 1
+        assert cache.stats["hits"] == 1
+        assert cache.stats["saved_seconds"] > 0
@@ -0,0 +1,522 @@
+"""Tests for SemanticMemory (Qdrant in-memory mode with a fake embedder)."""
+
+import threading
+import time
+
+import pytest
+from qdrant_client.models import BinaryQuantization, ScalarQuantization
+
+from agenthelm.memory import MemoryContext, MemoryHub, embeddings
+from agenthelm.memory.lexical import BM25Index, reciprocal_rank_fusion, tokenize
+from agenthelm.memory.semantic import SemanticMemory
+
+
+class TestVectorSize:
+    """Tests for embedding dimension handling."""
+
+    def test_vector_size_probed_from_model(self, fake_embedder):
+        """Collection is sized from the model, not a hard-coded 384."""
+        memory = SemanticMemory()
+        assert memory.vector_size == 32
+
+        memory._ensure_collection()
+        info = memory.client.get_collection(memory.collection_name)
+        assert info.config.params.vectors.size == 32
+
+    def test_vector_size_probed_once_per_model(self, fake_embedder, monkeypatch):
+        """The probe runs once and is shared across instances."""
+        fake_embedder(16)
+        calls = []
+        embed = SemanticMemory._embed_texts
+
+        def counting_embed(self, texts):
+            calls.append(texts)
+            return embed(self, texts)
+
+        monkeypatch.setattr(SemanticMemory, "_embed_texts", counting_embed)
+
+        assert SemanticMemory().vector_size == 16
+        assert SemanticMemory().vector_size == 16
+        assert len(calls) == 1
+
+    def test_explicit_vector_size_skips_probe(self, monkeypatch):
+        """An explicit vector_size never loads the model."""
+
+        def fail(self, texts):
+            raise AssertionError("model should not be loaded")
+
+        monkeypatch.setattr(SemanticMemory, "_embed_texts", fail)
+        memory = SemanticMemory(vector_size=8)
+        memory._ensure_collection()
+        assert memory.vector_size == 8
+
+    def test_dimension_mismatch_raises(self, fake_embedder):
+        """Opening a collection built for another model fails loudly."""
+        memory = SemanticMemory(vector_size=384)
+        memory._ensure_collection()
+
+        other = SemanticMemory(embedding_model="small-model")
+        other.client = memory.client
+        with pytest.raises(ValueError, match="migrate_collection"):
+            other._ensure_collection()
+
+
+class TestQuantization:
+    """Tests for collection-level quantization."""
+
+    @pytest.mark.parametrize(
+        "quantization, config_type",
+        [("scalar", ScalarQuantization), ("binary", BinaryQuantization)],
+    )
+    def test_quantization_config_applied(
+        self, fake_embedder, quantization, config_type
+    ):
+        """Quantized collections are created with the requested config."""
+        memory = SemanticMemory(quantization=quantization)
+        created = {}
+        create_collection = memory.client.create_collection
+
+        def spy(**kwargs):
+            created.update(kwargs)
+            return create_collection(**kwargs)
+
+        memory.client.create_collection = spy
+        memory._ensure_collection()
+
+        assert isinstance(created["quantization_config"], config_type)
+
+    def test_unknown_quantization_raises(self, fake_embedder):
+        """Unknown quantization names are rejected."""
+        memory = SemanticMemory(quantization="product")
+        with pytest.raises(ValueError, match="Unknown quantization"):
+            memory._ensure_collection()
+
+
+class TestMigration:
+    """Tests for migrating collections across embedding models."""
+
+    @pytest.mark.asyncio
+    async def test_migrate_collection_reembeds(self, fake_embedder):
+        """Entries are re-embedded into the new collection with IDs and metadata."""
+        fake_embedder(64)
+        old = SemanticMemory(collection_name="old", embedding_model="big-model")
+        ids = await old.store_many(
+            ["first memory", "second memory", "third memory"],
+            metadatas=[{"n": 1}, {"n": 2}, {"n": 3}],
+        )
+
+        fake_embedder(16)
+        new = SemanticMemory(collection_name="new", embedding_model="small-model")
+        new.client = old.client
+
+        migrated = await new.migrate_collection("old", batch_size=2, drop_source=True)
+
+        assert migrated == 3
+        assert not new.client.collection_exists("old")
+        records = new.client.retrieve("new", ids=ids)
+        assert sorted(r.payload["n"] for r in records) == [1, 2, 3]
+        info = new.client.get_collection("new")
+        assert info.config.params.vectors.size == 16
+
+    @pytest.mark.asyncio
+    async def test_migrate_into_itself_raises(self, fake_embedder):
+        """Migrating a collection into itself is rejected."""
+        memory = SemanticMemory()
+        with pytest.raises(ValueError, match="itself"):
+            await memory.migrate_collection(memory.collection_name)
+
+
+class FakeModel:
+    """Stand-in for fastembed.TextEmbedding."""
+
+    def __init__(self, model_name: str):
+        self.model_name = model_name
+
+    def embed(self, texts):
+        import numpy as np
+
+        for text in texts:
+            yield np.full(4, float(len(text)))
+
+
+class TestEmbeddingRegistry:
+    """Tests for the process-wide embedding model registry."""
+
+    @pytest.fixture(autouse=True)
+    def fake_loader(self, monkeypatch):
+        """Replace model loading with a counting fake."""
+        loads = []
+
+        def load(model_name):
+            loads.append(model_name)
+            time.sleep(0.05)
+            return FakeModel(model_name)
+
+        monkeypatch.setattr(embeddings, "_load_model", load)
+        embeddings.unload()
+        SemanticMemory._dimension_cache.clear()
+        yield loads
+        embeddings.unload()
+        SemanticMemory._dimension_cache.clear()
+
+    def test_model_shared_across_instances(self, fake_loader):
+        """Two SemanticMemory instances share a single loaded model."""
+        first = SemanticMemory()
+        second = SemanticMemory()
+
+        assert first._embed_text("abc") == [3.0] * 4
+        assert second._embed_text("abcd") == [4.0] * 4
+        assert fake_loader == [SemanticMemory.DEFAULT_EMBEDDING_MODEL]
+
+    def test_concurrent_first_use_loads_once(self, fake_loader):
+        """Concurrent first requests trigger one load."""
+        threads = [
+            threading.Thread(target=embeddings.get_embedding_model, args=("m",))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert fake_loader == ["m"]
+
+    def test_warmup_probes_dimension(self, fake_loader):
+        """warmup() loads the model and caches its dimension."""
+        memory = SemanticMemory(embedding_model="warm")
+        memory.warmup()
+
+        assert embeddings.is_loaded("warm")
+        assert SemanticMemory._dimension_cache["warm"] == 4
+
+    def test_eager_load_in_background(self, fake_loader):
+        """eager_load starts loading without blocking the constructor."""
+        thread = embeddings.warmup(["eager"], background=True)
+        thread.join()
+        assert embeddings.is_loaded("eager")
+
+        SemanticMemory(embedding_model="eager", eager_load=True)
+        assert fake_loader == ["eager"]
+
+    def test_hub_warmup(self, fake_loader):
+        """MemoryHub.warmup() warms the semantic backend's model."""
+        hub = MemoryHub(embedding_model="hub-model")
+        hub.warmup()
+        assert embeddings.is_loaded("hub-model")
+
+
+class TestSearch:
+    """Tests for store/search and payload projection."""
+
+    @pytest.fixture
+    def memory(self, fake_embedder):
+        """Semantic memory with inline text."""
+        return SemanticMemory()
+
+    @pytest.fixture
+    def external(self, fake_embedder, tmp_path):
+        """Semantic memory with text bodies in a SQLite side store."""
+        return SemanticMemory(text_store=tmp_path / "texts.db")
+
+    @pytest.mark.asyncio
+    async def test_store_and_search(self, memory):
+        """The closest text ranks first, with its metadata."""
+        await memory.store("the cat sat on the mat", metadata={"kind": "pet"})
+        await memory.store("quarterly revenue grew", metadata={"kind": "finance"})
+
+        results = await memory.search("cat on a mat", top_k=1)
+
+        assert results[0].text == "the cat sat on the mat"
+        assert results[0].metadata == {"kind": "pet"}
+
+    @pytest.mark.asyncio
+    async def test_payload_projection(self, memory):
+        """with_payload limits the returned metadata fields."""
+        await memory.store("order 123 shipped", metadata={"a": 1, "b": 2})
+
+        results = await memory.search("order shipped", with_payload=["a"])
+        assert results[0].metadata == {"a": 1}
+        assert results[0].text == "order 123 shipped"
+
+        results = await memory.search("order shipped", with_payload=False)
+        assert results[0].metadata == {}
+
+    @pytest.mark.asyncio
+    async def test_without_text_then_fetch(self, memory):
+        """with_text=False skips bodies; fetch_texts loads them on demand."""
+        memory_id = await memory.store("a long document body")
+
+        results = await memory.search("document", with_text=False)
+        assert results[0].text == ""
+
+        texts = await memory.fetch_texts([memory_id])
+        assert texts == {memory_id: "a long document body"}
+
+    @pytest.mark.asyncio
+    async def test_external_text_not_in_payload(self, external):
+        """With a text store, Qdrant payloads hold metadata only."""
+        memory_id = await external.store("kept out of line", metadata={"k": "v"})
+
+        record = external.client.retrieve(external.collection_name, ids=[memory_id])[0]
+        assert record.payload == {"k": "v"}
+
+        results = await external.search("kept out of line")
+        assert results[0].text == "kept out of line"
+        assert results[0].metadata == {"k": "v"}
+
+    @pytest.mark.asyncio
+    async def test_external_text_store_many_and_delete(self, external):
+        """Batch stores and deletes keep the side store in sync."""
+        ids = await external.store_many(["first text", "second text"])
+        assert await external.fetch_texts(ids) == {
+            ids[0]: "first text",
+            ids[1]: "second text",
+        }
+
+        await external.delete([ids[0]])
+        assert await external.fetch_texts(ids) == {ids[1]: "second text"}
+
+    @pytest.mark.asyncio
+    async def test_clear_drops_external_texts(self, external):
+        """clear() removes the collection's bodies from the side store."""
+        ids = await external.store_many(["first text", "second text"])
+        external.text_store.put_many({"other": "another collection's text"})
+
+        external.clear()
+        assert external.text_store.get_many([*ids, "other"]) == {
+            "other": "another collection's text"
+        }
+
+    @pytest.mark.asyncio
+    async def test_migrate_inline_into_external(self, memory, tmp_path):
+        """Migrating inline texts into a text-store collection moves them out."""
+        ids = await memory.store_many(["first text"], metadatas=[{"n": 1}])
+        target = SemanticMemory(collection_name="new", text_store=tmp_path / "t.db")
+        target.client = memory.client
+
+        assert await target.migrate_collection(memory.collection_name) == 1
+
+        record = target.client.retrieve("new", ids=ids)[0]
+        assert record.payload == {"n": 1}
+        assert target.text_store.get_many(ids) == {ids[0]: "first text"}
+
+
+class TestBM25Index:
+    """Tests for the BM25 inverted index."""
+
+    def test_identifier_tokens(self):
+        """Identifiers are indexed whole and by their parts."""
+        assert tokenize("See ORD-1042 in report.pdf") == [
+            "see",
+            "ord-1042",
+            "ord",
+            "1042",
+            "in",
+            "report.pdf",
+            "report",
+            "pdf",
+        ]
+
+    def test_ranks_by_term_rarity(self):
+        """Documents matching rarer terms rank higher."""
+        index = BM25Index()
+        index.add("a", "order shipped")
+        index.add("b", "order ORD-1042 shipped")
+        index.add("c", "order cancelled")
+
+        ranking = index.search("ORD-1042 order")
+        assert ranking[0][0] == "b"
+        assert {doc_id for doc_id, _ in ranking} == {"a", "b", "c"}
+
+    def test_filter_and_remove(self):
+        """Filters restrict matches; removed docs disappear."""
+        index = BM25Index()
+        index.add("a", "invoice 7", {"session_id": "s1"})
+        index.add("b", "invoice 7", {"session_id": "s2"})
+
+        ranking = index.search("invoice", filter={"session_id": "s2"})
+        assert [doc_id for doc_id, _ in ranking] == ["b"]
+
+        index.remove(["a", "missing"])
+        assert [doc_id for doc_id, _ in index.search("invoice")] == ["b"]
+        assert len(index) == 1
+
+    def test_reciprocal_rank_fusion(self):
+        """Items ranked well in both lists win."""
+        fused = reciprocal_rank_fusion([[("x", 0.9), ("y", 0.8)], [("y", 5.0)]])
+        assert fused[0][0] == "y"
+
+
+class TestHybridSearch:
+    """Tests for lexical, hybrid and auto search modes."""
+
+    @pytest.fixture
+    def memory(self, fake_embedder):
+        """Hybrid-enabled semantic memory."""
+        return SemanticMemory(hybrid=True)
+
+    @pytest.mark.asyncio
+    async def test_lexical_mode_skips_embedding(self, memory, monkeypatch):
+        """Lexical search never embeds the query."""
+        await memory.store_many(
+            ["Order ORD-1042 shipped to Berlin", "Order ORD-2001 delayed"],
+            metadatas=[{"n": 1}, {"n": 2}],
+        )
+
+        def fail(self, texts):
+            raise AssertionError("query should not be embedded")
+
+        monkeypatch.setattr(SemanticMemory, "_embed_texts", fail)
+        results = await memory.search("ORD-1042", top_k=1, mode="lexical")
+
+        assert results[0].text == "Order ORD-1042 shipped to Berlin"
+        assert results[0].metadata == {"n": 1}
+
+    @pytest.mark.asyncio
+    async def test_auto_mode_routes_identifier_lookups(self, memory, monkeypatch):
+        """Identifier queries with lexical hits skip the vector search."""
+        await memory.store("build artifact deploy-config.yaml updated")
+        calls = []
+        vector_search = SemanticMemory._vector_search
+
+        def spy(self, *args, **kwargs):
+            calls.append(args)
+            return vector_search(self, *args, **kwargs)
+
+        monkeypatch.setattr(SemanticMemory, "_vector_search", spy)
+
+        results = await memory.search("deploy-config.yaml", mode="auto")
+        assert results[0].text == "build artifact deploy-config.yaml updated"
+        assert calls == []
+
+        await memory.search("what changed in the build", mode="auto")
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_hybrid_mode_fuses_rankings(self, memory):
+        """Hybrid search returns results from both retrievers."""
+        await memory.store("the cat sat on the mat")
+        await memory.store("ticket INC-77 escalated")
+
+        results = await memory.search("cat INC-77", top_k=2, mode="hybrid")
+        assert {r.text for r in results} == {
+            "the cat sat on the mat",
+            "ticket INC-77 escalated",
+        }
+
+    @pytest.mark.asyncio
+    async def test_delete_updates_index(self, memory):
+        """Deleted memories are no longer found lexically."""
+        memory_id = await memory.store("ticket INC-77 escalated")
+        await memory.delete([memory_id])
+        assert await memory.search("INC-77", mode="lexical") == []
+
+    @pytest.mark.asyncio
+    async def test_index_rebuilt_for_existing_collection(self, memory):
+        """A new instance over an existing collection builds the index on first use."""
+        await memory.store("ticket INC-77 escalated", metadata={"session_id": "s"})
+
+        reopened = SemanticMemory(hybrid=True)
+        reopened.client = memory.client
+        await reopened.search("INC-77")  # Vector search doesn't build the index
+        assert len(reopened.lexical) == 0
+
+        results = await reopened.search(
+            "INC-77", mode="lexical", filter={"session_id": "s"}
+        )
+        assert results[0].text == "ticket INC-77 escalated"
+
+    @pytest.mark.asyncio
+    async def test_non_vector_mode_requires_hybrid(self, fake_embedder):
+        """Lexical modes fail clearly without an index."""
+        memory = SemanticMemory()
+        with pytest.raises(ValueError, match="hybrid=True"):
+            await memory.search("x", mode="lexical")
+
+    @pytest.mark.asyncio
+    async def test_recall_with_mode(self, fake_embedder):
+        """MemoryContext.recall passes the mode through."""
+        hub = MemoryHub(hybrid_search=True)
+        ctx = MemoryContext(hub, session_id="s1", cleanup_on_exit=False)
+        await ctx.store_memory("invoice INV-9 paid")
+
+        results = await ctx.recall("INV-9", session_only=True, mode="lexical")
+        assert results[0].text == "invoice INV-9 paid"
+
+
+class TestSessionIndexing:
+    """Tests for payload indexes and filtered deletion."""
+
+    def test_payload_indexes_created_in_network_mode(self, fake_embedder):
+        """Declared filter fields get payload indexes on the server."""
+        memory = SemanticMemory(indexed_fields={"tenant": "keyword"})
+        memory.mode = "network"
+        created = []
+        memory.client.create_payload_index = lambda **kwargs: created.append(kwargs)
+
+        memory._ensure_collection()
+
+        assert {c["field_name"] for c in created} == {"session_id", "tenant"}
+
+    def test_payload_indexes_skipped_locally(self, fake_embedder):
+        """Local Qdrant ignores payload indexes, so none are requested."""
+        memory = SemanticMemory()
+        memory.client.create_payload_index = lambda **kwargs: pytest.fail(
+            "local mode should not create payload indexes"
+        )
+        memory._ensure_collection()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("options", [{}, {"hybrid": True}])
+    async def test_delete_by_filter(self, fake_embedder, tmp_path, options):
+        """Only entries matching the filter are deleted, side stores included."""
+        memory = SemanticMemory(text_store=tmp_path / "texts.db", **options)
+        ids = await memory.store_many(
+            ["keep INC-1", "drop INC-2", "drop INC-3"],
+            metadatas=[{"session_id": "a"}, {"session_id": "b"}, {"session_id": "b"}],
+        )
+
+        await memory.delete_by_filter({"session_id": "b"})
+
+        assert memory.client.count(memory.collection_name).count == 1
+        assert await memory.fetch_texts(ids) == {ids[0]: "keep INC-1"}
+        if memory.lexical is not None:
+            results = await memory.search("INC-2", mode="lexical")
+            assert [r.text for r in results] == ["keep INC-1"]
+
+    @pytest.mark.asyncio
+    async def test_delete_by_filter_requires_filter(self, fake_embedder):
+        """An empty filter would delete everything, so it is rejected."""
+        with pytest.raises(ValueError, match="non-empty"):
+            await SemanticMemory().delete_by_filter({})
+
+    @pytest.mark.asyncio
+    async def test_cleanup_semantic_after_restart(self, fake_embedder):
+        """A fresh context for the same session removes earlier memories."""
+        hub = MemoryHub()
+        first = MemoryContext(hub, session_id="s1", cleanup_on_exit=False)
+        await first.store_memory("from the previous process")
+        other = MemoryContext(hub, session_id="s2", cleanup_on_exit=False)
+        await other.store_memory("another session")
+
+        restarted = MemoryContext(hub, session_id="s1", cleanup_on_exit=False)
+        await restarted.cleanup_semantic()
+
+        results = await other.recall("session process", top_k=5)
+        assert [r.metadata["session_id"] for r in results] == ["s2"]
+
+    @pytest.mark.asyncio
+    async def test_cleanup_semantic_without_filter_delete(
+        self, fake_embedder, monkeypatch
+    ):
+        """Backends without delete_by_filter drop the IDs tracked in-process."""
+        monkeypatch.setattr(SemanticMemory, "supports_filter_delete", False)
+        hub = MemoryHub()
+        ctx = MemoryContext(hub, session_id="s1", cleanup_on_exit=False)
+        await ctx.store_memory("tracked memory")
+        await hub.semantic.store("untracked memory", metadata={"session_id": "s1"})
+
+        await ctx.cleanup_semantic()
+
+        results = await ctx.recall("memory", top_k=5)
+        assert [r.text for r in results] == ["untracked memory"]
@@ -1,10 +1,16 @@
 """Tests for short-term memory backends."""
 
 import asyncio
+import json
+import pickle
+
 import pytest
 
+from agenthelm.memory.short_term import in_memory
+from agenthelm.memory.short_term.codec import MAGIC, ValueSerializer
 from agenthelm.memory.short_term.in_memory import InMemoryShortTermMemory
 from agenthelm.memory.short_term.sqlite import SqliteShortTermMemory
+from agenthelm.memory.short_term.tiered import TieredShortTermMemory
 
 
 class TestInMemoryShortTermMemory:
@@ -55,6 +61,39 @@ class TestInMemoryShortTermMemory:
         assert "user:1:name" in user_keys
         assert "user:2:name" in user_keys
 
+    @pytest.mark.asyncio
+    async def test_keys_glob_patterns(self, memory):
+        """Test prefix, suffix, mid-segment and exact patterns."""
+        await memory.set("session:abc:turn:1", 1)
+        await memory.set("session:abc:turn:2", 2)
+        await memory.set("session:abd:turn:1", 3)
+        await memory.set("user:1:name", "Alice")
+
+        assert sorted(await memory.keys("session:abc:*")) == [
+            "session:abc:turn:1",
+            "session:abc:turn:2",
+        ]
+        assert len(await memory.keys("session:ab*")) == 3
+        assert sorted(await memory.keys("session:*:turn:1")) == [
+            "session:abc:turn:1",
+            "session:abd:turn:1",
+        ]
+        assert await memory.keys("*:name") == ["user:1:name"]
+        assert await memory.keys("user:1:name") == ["user:1:name"]
+        assert await memory.keys("user:2:name") == []
+
+    @pytest.mark.asyncio
+    async def test_namespace_index_follows_deletes(self, memory):
+        """Deleted keys leave the namespace index."""
+        await memory.set("session:abc:a", 1)
+        await memory.set("session:abc:b", 2)
+        await memory.delete("session:abc:a")
+        assert await memory.keys("session:abc:*") == ["session:abc:b"]
+
+        await memory.delete("session:abc:b")
+        assert await memory.keys("session:abc:*") == []
+        assert memory._namespaces == {}
+
     @pytest.mark.asyncio
     async def test_ttl_expiration(self, memory):
         """Test that keys expire after TTL."""
@@ -88,6 +127,157 @@ class TestInMemoryShortTermMemory:
         result = asyncio.get_event_loop().run_until_complete(memory.get("key1"))
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_delete_prefix(self, memory):
+        """delete_prefix removes only keys under the prefix."""
+        await memory.set_many({f"session:abc:{i}": i for i in range(20)})
+        await memory.set("session:abcd:1", "other session")
+        await memory.set("user:1", "kept")
+
+        assert await memory.delete_prefix("session:abc:") == 20
+        assert sorted(await memory.keys("*")) == ["session:abcd:1", "user:1"]
+        assert await memory.delete_prefix("session:missing:") == 0
+
+    @pytest.mark.asyncio
+    async def test_incr(self, memory):
+        """incr creates counters at 0 and adds to existing integers."""
+        assert await memory.incr("counter") == 1
+        assert await memory.incr("counter", 5) == 6
+        await memory.set("preset", 10)
+        assert await memory.incr("preset", -3) == 7
+        assert await memory.get("counter") == 6
+
+    @pytest.mark.asyncio
+    async def test_incr_rejects_non_integer(self, memory):
+        """incr on a non-integer value raises TypeError."""
+        await memory.set("key", {"a": 1})
+        with pytest.raises(TypeError, match="not an integer"):
+            await memory.incr("key")
+
+    @pytest.mark.asyncio
+    async def test_concurrent_incr_is_exact(self, memory):
+        """Concurrent increments are not lost."""
+        await asyncio.gather(*[memory.incr("counter") for _ in range(50)])
+        assert await memory.get("counter") == 50
+
+    @pytest.mark.asyncio
+    async def test_compare_and_set(self, memory):
+        """compare_and_set writes only when the current value matches."""
+        assert await memory.compare_and_set("key", None, "v1") is True
+        assert await memory.compare_and_set("key", None, "v2") is False
+        assert await memory.compare_and_set("key", "v1", "v2") is True
+        assert await memory.compare_and_set("key", "v1", "v3") is False
+        assert await memory.get("key") == "v2"
+
+    @pytest.mark.asyncio
+    async def test_set_if_absent(self, memory):
+        """set_if_absent writes missing keys only."""
+        assert await memory.set_if_absent("lock", "owner-a") is True
+        assert await memory.set_if_absent("lock", "owner-b") is False
+        assert await memory.get("lock") == "owner-a"
+
+
+class TestInMemoryEviction:
+    """Tests for active expiry and LRU bounds in InMemoryShortTermMemory."""
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        """Controllable clock for the in-memory backend."""
+        now = [1000.0]
+        monkeypatch.setattr(in_memory.time, "time", lambda: now[0])
+        return now
+
+    @pytest.mark.asyncio
+    async def test_delete_prefix_skips_expired_in_count(self, clock):
+        """Keys that already expired are removed but not counted as deleted."""
+        memory = InMemoryShortTermMemory()
+        await memory.set("session:s1:old", "data", ttl=10)
+        await memory.set("session:s1:new", "data", ttl=100)
+
+        clock[0] += 11
+        assert await memory.delete_prefix("session:s1:") == 1
+        assert len(memory._store) == 0
+
+    @pytest.mark.asyncio
+    async def test_unread_keys_expire_on_write(self, clock):
+        """Keys written once and never read are evicted by later writes."""
+        memory = InMemoryShortTermMemory()
+        for i in range(100):
+            await memory.set(f"session:{i}", "data", ttl=10)
+
+        clock[0] += 11
+        await memory.set("fresh", "data", ttl=10)
+
+        assert len(memory._store) == 1
+        assert memory.stats["evicted_expired"] == 100
+
+    @pytest.mark.asyncio
+    async def test_len_reports_live_entries(self, clock):
+        """__len__ excludes expired entries."""
+        memory = InMemoryShortTermMemory()
+        await memory.set("short", "data", ttl=5)
+        await memory.set("permanent", "data", ttl=0)
+        assert len(memory) == 2
+
+        clock[0] += 6
+        assert len(memory) == 1
+
+    @pytest.mark.asyncio
+    async def test_overwrite_keeps_new_expiry(self, clock):
+        """A stale heap entry does not evict a key re-set with a longer TTL."""
+        memory = InMemoryShortTermMemory()
+        await memory.set("key", "old", ttl=5)
+        await memory.set("key", "new", ttl=60)
+
+        clock[0] += 10
+        await memory.set("other", "data")
+        assert await memory.get("key") == "new"
+
+    @pytest.mark.asyncio
+    async def test_incr_keeps_expiry(self, clock):
+        """Increments keep the counter's original expiry."""
+        memory = InMemoryShortTermMemory()
+        await memory.incr("counter", ttl=10)
+        clock[0] += 6
+        assert await memory.incr("counter", ttl=10) == 2
+
+        clock[0] += 6
+        assert await memory.get("counter") is None
+        assert await memory.set_if_absent("counter", 0) is True
+
+    @pytest.mark.asyncio
+    async def test_heap_compacted_under_overwrites(self, clock):
+        """Repeated overwrites do not grow the heap without bound."""
+        memory = InMemoryShortTermMemory()
+        for _ in range(1000):
+            await memory.set("hot", "value", ttl=60)
+        assert len(memory._expiry_heap) <= 2 * len(memory) + 65
+
+    @pytest.mark.asyncio
+    async def test_max_entries_evicts_lru(self):
+        """The least recently used entry is evicted first."""
+        memory = InMemoryShortTermMemory(max_entries=2)
+        await memory.set("a", 1)
+        await memory.set("b", 2)
+        await memory.get("a")
+        await memory.set("c", 3)
+
+        assert await memory.get("b") is None
+        assert await memory.get("a") == 1
+        assert memory.stats["evicted_lru"] == 1
+
+    @pytest.mark.asyncio
+    async def test_max_bytes_evicts_lru(self):
+        """Entries are evicted once the approximate size bound is exceeded."""
+        memory = InMemoryShortTermMemory(max_bytes=2000)
+        await memory.set("big1", "x" * 900)
+        await memory.set("big2", "x" * 900)
+        await memory.set("big3", "x" * 900)
+
+        assert await memory.get("big1") is None
+        assert memory.stats["bytes"] <= 2000
+        assert memory.stats["entries"] == 2
+
 
 class TestSqliteShortTermMemory:
     """Tests for SqliteShortTermMemory."""
@@ -138,6 +328,38 @@ class TestSqliteShortTermMemory:
         assert "user:1:name" in user_keys
         assert "user:2:name" in user_keys
 
+    @pytest.mark.asyncio
+    async def test_keys_glob_patterns(self, memory):
+        """Test prefix, suffix, mid-segment and exact patterns."""
+        await memory.set("session:abc:turn:1", 1)
+        await memory.set("session:abc:turn:2", 2)
+        await memory.set("session:abd:turn:1", 3)
+        await memory.set("user:1:name", "Alice")
+
+        assert sorted(await memory.keys("session:abc:*")) == [
+            "session:abc:turn:1",
+            "session:abc:turn:2",
+        ]
+        assert len(await memory.keys("session:ab*")) == 3
+        assert sorted(await memory.keys("session:*:turn:1")) == [
+            "session:abc:turn:1",
+            "session:abd:turn:1",
+        ]
+        assert await memory.keys("*:name") == ["user:1:name"]
+        assert await memory.keys("user:1:name") == ["user:1:name"]
+        assert await memory.keys("user:2:name") == []
+
+    @pytest.mark.asyncio
+    async def test_keys_wildcards_are_glob(self, memory):
+        """'_' and '%' are literal characters, not SQL wildcards."""
+        await memory.set("user_1", 1)
+        await memory.set("userx1", 2)
+        await memory.set("100%", 3)
+
+        assert await memory.keys("user_*") == ["user_1"]
+        assert sorted(await memory.keys("user?1")) == ["user_1", "userx1"]
+        assert await memory.keys("100%") == ["100%"]
+
     @pytest.mark.asyncio
     async def test_ttl_expiration(self, memory):
         """Test that keys expire after TTL."""
@@ -168,9 +390,643 @@ class TestSqliteShortTermMemory:
         result = await mem2.get("key")
         assert result == "value"
 
+    @pytest.mark.asyncio
+    async def test_set_many_and_get_many(self, memory):
+        """Batched writes and reads round-trip, skipping missing keys."""
+        items = {f"key:{i}": {"n": i} for i in range(1500)}
+        await memory.set_many(items, ttl=60)
+
+        result = await memory.get_many(list(items) + ["missing"])
+        assert result == items
+
+    @pytest.mark.asyncio
+    async def test_get_many_drops_expired(self, memory):
+        """Expired keys are omitted from get_many and removed."""
+        await memory.set_many({"short": 1}, ttl=1)
+        await memory.set("long", 2, ttl=60)
+        await asyncio.sleep(1.1)
+
+        assert await memory.get_many(["short", "long"]) == {"long": 2}
+        assert await memory.exists("short") is False
+
+    @pytest.mark.asyncio
+    async def test_delete_many(self, memory):
+        """delete_many removes only the given keys."""
+        await memory.set_many({"a": 1, "b": 2, "c": 3})
+        await memory.delete_many(["a", "b", "nonexistent"])
+        assert await memory.keys("*") == ["c"]
+
+    @pytest.mark.asyncio
+    async def test_runs_off_event_loop_thread(self, memory):
+        """Statements execute on the dedicated worker thread."""
+        import threading
+
+        thread_names = []
+        original = memory._get_many_sync
+
+        def spy(keys):
+            thread_names.append(threading.current_thread().name)
+            return original(keys)
+
+        memory._get_many_sync = spy
+        await memory.get("key")
+        assert thread_names[0].startswith("agenthelm-sqlite")
+
+    @pytest.mark.asyncio
+    async def test_close_is_idempotent(self, memory):
+        """close() can be called more than once."""
+        await memory.set("key", "value")
+        await memory.close()
+        await memory.close()
+
     def test_clear(self, memory):
         """Test clearing all data."""
         asyncio.get_event_loop().run_until_complete(memory.set("key1", "v1"))
         memory.clear()
         result = asyncio.get_event_loop().run_until_complete(memory.get("key1"))
         assert result is None
+
+    @pytest.mark.asyncio
+    async def test_delete_prefix(self, memory):
+        """delete_prefix removes only keys under the prefix."""
+        await memory.set_many({f"session:abc:{i}": i for i in range(20)})
+        await memory.set("session:abcd:1", "other session")
+        await memory.set("user:1", "kept")
+
+        assert await memory.delete_prefix("session:abc:") == 20
+        assert sorted(await memory.keys("*")) == ["session:abcd:1", "user:1"]
+        assert await memory.delete_prefix("session:missing:") == 0
+
+    @pytest.mark.asyncio
+    async def test_delete_prefix_skips_expired_in_count(self, memory, monkeypatch):
+        """Expired keys are removed but not counted as deleted."""
+        now = [1000.0]
+        monkeypatch.setattr(in_memory.time, "time", lambda: now[0])
+        await memory.set("session:s1:old", "data", ttl=10)
+        await memory.set("session:s1:new", "data", ttl=100)
+
+        now[0] += 11
+        assert await memory.delete_prefix("session:s1:") == 1
+
+    @pytest.mark.asyncio
+    async def test_reads_legacy_json_rows(self, memory):
+        """Rows written as JSON text by earlier versions still decode."""
+        import sqlite3
+
+        with sqlite3.connect(memory.db_path) as conn:
+            conn.execute(
+                "INSERT INTO kv_store (key, value, expiry) VALUES (?, ?, NULL)",
+                ("legacy", '{"a": [1, 2]}'),
+            )
+        assert await memory.get("legacy") == {"a": [1, 2]}
+
+    @pytest.mark.asyncio
+    async def test_msgpack_codec_round_trips_bytes_and_arrays(self, tmp_path):
+        """The msgpack codec stores bytes and NumPy arrays."""
+        pytest.importorskip("msgpack")
+        np = pytest.importorskip("numpy")
+
+        memory = SqliteShortTermMemory(tmp_path / "mp.db", codec="msgpack")
+        array = np.arange(6, dtype=np.float32).reshape(2, 3)
+        await memory.set("state", {"blob": b"\x00\xff", "embedding": array})
+
+        result = await memory.get("state")
+        assert result["blob"] == b"\x00\xff"
+        assert result["embedding"].dtype == np.float32
+        assert (result["embedding"] == array).all()
+        await memory.close()
+
+    @pytest.mark.asyncio
+    async def test_codec_change_keeps_old_values_readable(self, tmp_path):
+        """JSON values stay readable after switching to another codec."""
+        db_path = tmp_path / "switch.db"
+        mem1 = SqliteShortTermMemory(db_path)
+        await mem1.set("key", {"n": 1})
+        await mem1.close()
+
+        mem2 = SqliteShortTermMemory(db_path, codec="pickle")
+        assert await mem2.get("key") == {"n": 1}
+        await mem2.close()
+
+    @pytest.mark.asyncio
+    async def test_incr(self, memory):
+        """incr creates counters at 0 and adds to existing integers."""
+        assert await memory.incr("counter") == 1
+        assert await memory.incr("counter", 5) == 6
+        await memory.set("preset", 10)
+        assert await memory.incr("preset", -3) == 7
+        assert await memory.get("counter") == 6
+
+    @pytest.mark.asyncio
+    async def test_incr_rejects_non_integer(self, memory):
+        """incr on a non-integer value raises TypeError."""
+        await memory.set("key", {"a": 1})
+        with pytest.raises(TypeError, match="not an integer"):
+            await memory.incr("key")
+
+    @pytest.mark.asyncio
+    async def test_concurrent_incr_is_exact(self, memory):
+        """Concurrent increments are not lost."""
+        await asyncio.gather(*[memory.incr("counter") for _ in range(50)])
+        assert await memory.get("counter") == 50
+
+    @pytest.mark.asyncio
+    async def test_compare_and_set(self, memory):
+        """compare_and_set writes only when the current value matches."""
+        assert await memory.compare_and_set("key", None, "v1") is True
+        assert await memory.compare_and_set("key", None, "v2") is False
+        assert await memory.compare_and_set("key", "v1", "v2") is True
+        assert await memory.compare_and_set("key", "v1", "v3") is False
+        assert await memory.get("key") == "v2"
+
+    @pytest.mark.asyncio
+    async def test_set_if_absent(self, memory):
+        """set_if_absent writes missing keys only."""
+        assert await memory.set_if_absent("lock", "owner-a") is True
+        assert await memory.set_if_absent("lock", "owner-b") is False
+        assert await memory.get("lock") == "owner-a"
+
+    @pytest.mark.asyncio
+    async def test_incr_and_set_if_absent_after_expiry(self, memory):
+        """Expired keys count as absent and restart counters at 0."""
+        await memory.set("counter", 41, ttl=1)
+        await memory.set("lock", "stale", ttl=1)
+        await asyncio.sleep(1.1)
+
+        assert await memory.incr("counter") == 1
+        assert await memory.set_if_absent("lock", "fresh") is True
+        assert await memory.get("lock") == "fresh"
+
+
+class TestTieredShortTermMemory:
+    """Tests for TieredShortTermMemory over a SQLite backend."""
+
+    @pytest.fixture
+    def backend(self, tmp_path):
+        """Create the durable SQLite tier."""
+        return SqliteShortTermMemory(db_path=tmp_path / "tiered.db")
+
+    @pytest.mark.asyncio
+    async def test_reads_served_from_l1(self, backend, monkeypatch):
+        """Repeat reads don't touch the backend."""
+        memory = TieredShortTermMemory(backend)
+        await memory.set("key", {"a": 1})
+
+        async def fail(key):
+            raise AssertionError("unexpected backend read")
+
+        monkeypatch.setattr(backend, "get", fail)
+        assert await memory.get("key") == {"a": 1}
+
+    @pytest.mark.asyncio
+    async def test_miss_fills_l1(self, backend):
+        """Backend hits are cached in L1."""
+        await backend.set("key", "value")
+        memory = TieredShortTermMemory(backend)
+
+        assert await memory.get("key") == "value"
+        assert await memory.l1.get("key") == "value"
+        assert await memory.get_many(["key", "missing"]) == {"key": "value"}
+
+    @pytest.mark.asyncio
+    async def test_write_through(self, backend):
+        """Write-through writes reach the backend before returning."""
+        memory = TieredShortTermMemory(backend)
+        await memory.set("key", "value")
+        assert await backend.get("key") == "value"
+
+        await memory.delete("key")
+        assert await backend.get("key") is None
+        assert await memory.get("key") is None
+
+    @pytest.mark.asyncio
+    async def test_l1_respects_write_ttl(self, backend, monkeypatch):
+        """L1 entries expire with the TTL they were written with."""
+        now = [1000.0]
+        monkeypatch.setattr(in_memory.time, "time", lambda: now[0])
+        memory = TieredShortTermMemory(backend, l1_ttl=60)
+        await memory.set("key", "value", ttl=5)
+
+        now[0] += 6
+        assert await memory.l1.get("key") is None
+        assert await memory.get("key") is None
+
+    @pytest.mark.asyncio
+    async def test_l1_respects_backend_ttl_on_read(self, backend, monkeypatch):
+        """A read never caches a value in L1 past its backend expiry."""
+        now = [1000.0]
+        monkeypatch.setattr(in_memory.time, "time", lambda: now[0])
+        await backend.set_many({"a": 1, "b": 2}, ttl=1)
+        await backend.set("forever", 3, ttl=0)
+        memory = TieredShortTermMemory(backend, l1_ttl=60)
+
+        assert await memory.get("a") == 1
+        assert await memory.get_many(["b", "forever"]) == {"b": 2, "forever": 3}
+
+        now[0] += 2
+        assert await memory.get("a") is None
+        assert await memory.get_many(["b", "forever"]) == {"forever": 3}
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_requeues_and_raises(self, backend, monkeypatch):
+        """A backend error during flush keeps pending writes for a retry."""
+        memory = TieredShortTermMemory(backend, write_mode="behind", flush_interval=60)
+        await memory.set("key", "value")
+
+        async def fail(items, ttl):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(backend, "set_many", fail)
+        with pytest.raises(OSError, match="disk full"):
+            await memory.flush()
+        assert "key" in memory._pending
+
+        monkeypatch.undo()
+        await memory.flush()
+        assert await backend.get("key") == "value"
+        await memory.close()
+
+    @pytest.mark.asyncio
+    async def test_write_behind_buffers_until_flush(self, backend):
+        """Write-behind writes are visible immediately and land on flush."""
+        memory = TieredShortTermMemory(backend, write_mode="behind", flush_interval=60)
+        await memory.set_many({"a": 1, "b": 2})
+        await memory.delete("b")
+
+        assert await backend.get("a") is None
+        assert await memory.get("a") == 1
+        assert await memory.get("b") is None
+        assert await memory.exists("b") is False
+
+        await memory.flush()
+        assert await backend.get_many(["a", "b"]) == {"a": 1}
+        await memory.close()
+
+    @pytest.mark.asyncio
+    async def test_write_behind_flushes_in_background(self, backend):
+        """Pending writes are flushed after flush_interval."""
+        memory = TieredShortTermMemory(
+            backend, write_mode="behind", flush_interval=0.01
+        )
+        await memory.set("key", "value")
+        await asyncio.sleep(0.1)
+        assert await backend.get("key") == "value"
+
+    @pytest.mark.asyncio
+    async def test_write_behind_flushes_when_full(self, backend):
+        """Reaching max_pending triggers an immediate flush."""
+        memory = TieredShortTermMemory(
+            backend, write_mode="behind", flush_interval=60, max_pending=3
+        )
+        for i in range(3):
+            await memory.set(f"k{i}", i)
+        assert len(await backend.get_many(["k0", "k1", "k2"])) == 3
+        await memory.close()
+
+    @pytest.mark.asyncio
+    async def test_close_flushes_pending(self, tmp_path, backend):
+        """close() writes pending entries before closing the backend."""
+        memory = TieredShortTermMemory(backend, write_mode="behind", flush_interval=60)
+        await memory.set("key", "value")
+        await memory.close()
+
+        reopened = SqliteShortTermMemory(db_path=tmp_path / "tiered.db")
+        assert await reopened.get("key") == "value"
+        await reopened.close()
+
+    @pytest.mark.asyncio
+    async def test_close_after_failed_flush(self, backend, monkeypatch):
+        """close() still stops the flush task and closes the backend."""
+        memory = TieredShortTermMemory(backend, write_mode="behind", flush_interval=60)
+        await memory.set("key", "value")
+        closed = []
+
+        async def fail(items, ttl):
+            raise OSError("disk full")
+
+        async def close():
+            closed.append(True)
+
+        monkeypatch.setattr(backend, "set_many", fail)
+        monkeypatch.setattr(backend, "close", close)
+        with pytest.raises(OSError, match="disk full"):
+            await memory.close()
+
+        await asyncio.sleep(0)
+        assert memory._flush_task.cancelled()
+        assert closed == [True]
+
+        monkeypatch.undo()
+        await backend.close()
+
+    @pytest.mark.asyncio
+    async def test_delete_prefix_drops_pending(self, backend):
+        """delete_prefix covers L1, pending writes and the backend."""
+        await backend.set("session:s1:old", 0)
+        memory = TieredShortTermMemory(backend, write_mode="behind", flush_interval=60)
+        await memory.set("session:s1:new", 1)
+        await memory.set("session:s2:other", 2)
+
+        await memory.delete_prefix("session:s1:")
+        await memory.flush()
+        assert await memory.keys("session:*") == ["session:s2:other"]
+        assert await memory.get("session:s1:new") is None
+
+    def test_invalid_write_mode(self, backend):
+        """Unknown write modes are rejected."""
+        with pytest.raises(ValueError, match="write_mode"):
+            TieredShortTermMemory(backend, write_mode="around")
+
+    def test_hub_wraps_backend(self, tmp_path):
+        """MemoryHub adds the L1 tier when short_term_cache_size is set."""
+        from agenthelm.memory import MemoryHub
+
+        hub = MemoryHub(data_dir=tmp_path, short_term_cache_size=128)
+        assert isinstance(hub.short_term, TieredShortTermMemory)
+        assert isinstance(hub.short_term.backend, SqliteShortTermMemory)
+        assert isinstance(MemoryHub().short_term, InMemoryShortTermMemory)
+
+    @pytest.mark.asyncio
+    async def test_atomic_ops_see_pending_writes(self, backend):
+        """Atomic operations flush buffered writes and invalidate L1."""
+        memory = TieredShortTermMemory(backend, write_mode="behind", flush_interval=60)
+        await memory.set("counter", 10)
+        assert await memory.incr("counter") == 11
+        assert await memory.get("counter") == 11
+
+        assert await memory.compare_and_set("counter", 11, 0) is True
+        assert await memory.get("counter") == 0
+        assert await memory.set_if_absent("counter", 5) is False
+
+
+class TestValueSerializer:
+    """Tests for value codecs, framing and compression."""
+
+    def test_plain_json_is_unframed(self):
+        """Small JSON values are stored exactly as before codecs existed."""
+        serializer = ValueSerializer()
+        assert serializer.dumps({"a": 1}) == b'{"a": 1}'
+
+    def test_loads_legacy_str(self):
+        """Legacy JSON strings decode."""
+        assert ValueSerializer().loads('["x", 1]') == ["x", 1]
+
+    def test_large_values_are_compressed(self):
+        """Values at or above the threshold are zlib-compressed."""
+        serializer = ValueSerializer(compress_threshold=100)
+        value = {"text": "agent state " * 100}
+        data = serializer.dumps(value)
+
+        assert data.startswith(MAGIC)
+        assert len(data) < len(json.dumps(value))
+        assert serializer.loads(data) == value
+
+    def test_compression_disabled(self):
+        """compress_threshold=None never compresses."""
+        serializer = ValueSerializer(compress_threshold=None)
+        value = "x" * 10_000
+        assert serializer.dumps(value) == json.dumps(value).encode()
+
+    def test_pickle_round_trip(self):
+        """The pickle codec round-trips arbitrary Python objects."""
+        serializer = ValueSerializer(codec="pickle")
+        value = {"when": (1, 2), "tags": {"a", "b"}}
+        assert serializer.loads(serializer.dumps(value)) == value
+
+    def test_json_serializer_rejects_pickle_frames(self):
+        """A frame's codec id can't make a JSON store unpickle untrusted data."""
+
+        class Exploit:
+            def __reduce__(self):
+                return (pytest.fail, ("pickle payload was executed",))
+
+        frame = MAGIC + bytes((3, 0)) + pickle.dumps(Exploit())
+        with pytest.raises(ValueError, match="'pickle' codec"):
+            ValueSerializer("json").loads(frame)
+        with pytest.raises(ValueError, match="'pickle' codec"):
+            ValueSerializer("msgpack").loads(frame)
+
+    def test_configured_codec_and_json_decode(self):
+        """A serializer reads its own frames and JSON frames."""
+        compressed_json = ValueSerializer(compress_threshold=10).dumps("x" * 100)
+        serializer = ValueSerializer(codec="msgpack")
+        assert serializer.loads(compressed_json) == "x" * 100
+        assert serializer.loads(serializer.dumps(b"\x00")) == b"\x00"
+
+    def test_unknown_codec(self):
+        """Unknown codec names raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown codec"):
+            ValueSerializer(codec="xml")
+
+
+class TestRedisShortTermMemory:
+    """Tests for RedisShortTermMemory against fakeredis."""
+
+    @pytest.fixture
+    def client(self):
+        """Create an in-process fake Redis client."""
+        fakeredis = pytest.importorskip("fakeredis")
+        return fakeredis.FakeAsyncRedis()
+
+    @pytest.fixture
+    def memory(self, client):
+        """Create a Redis store backed by fakeredis."""
+        from agenthelm.memory.short_term.redis import RedisShortTermMemory
+
+        return RedisShortTermMemory(client=client)
+
+    @pytest.mark.asyncio
+    async def test_set_and_get(self, memory):
+        """Test basic set and get operations."""
+        await memory.set("key1", {"a": 1})
+        assert await memory.get("key1") == {"a": 1}
+        assert await memory.get("missing") is None
+
+    @pytest.mark.asyncio
+    async def test_get_many_uses_single_mget(self, memory, monkeypatch):
+        """get_many fetches a batch with one MGET."""
+        await memory.set_many({f"k{i}": i for i in range(10)})
+
+        calls = []
+        original = memory._redis.mget
+
+        async def spy(keys):
+            calls.append(keys)
+            return await original(keys)
+
+        monkeypatch.setattr(memory._redis, "mget", spy)
+        result = await memory.get_many([f"k{i}" for i in range(10)] + ["missing"])
+
+        assert result == {f"k{i}": i for i in range(10)}
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_get_many_with_ttl(self, memory):
+        """Values come back with their remaining TTL (None without expiry)."""
+        await memory.set("a", 1, ttl=60)
+        await memory.set("b", 2, ttl=0)
+
+        result = await memory.get_many_with_ttl(["a", "b", "missing"])
+        assert set(result) == {"a", "b"}
+        assert result["a"][0] == 1
+        assert 0 < result["a"][1] <= 60
+        assert result["b"] == (2, None)
+
+    @pytest.mark.asyncio
+    async def test_set_many_applies_ttl(self, memory, client):
+        """set_many writes every key with the given TTL."""
+        await memory.set_many({"a": 1, "b": 2}, ttl=60)
+        await memory.set_many({"c": 3}, ttl=0)
+
+        assert 0 < await client.ttl("agenthelm:a") <= 60
+        assert await client.ttl("agenthelm:c") == -1
+
+    @pytest.mark.asyncio
+    async def test_delete_many_in_chunks(self, memory):
+        """delete_many removes keys across several UNLINK batches."""
+        memory._BATCH_SIZE = 3
+        await memory.set_many({f"k{i}": i for i in range(10)})
+        await memory.delete_many([f"k{i}" for i in range(8)])
+        assert sorted(await memory.keys("*")) == ["k8", "k9"]
+
+    @pytest.mark.asyncio
+    async def test_clear_only_removes_prefixed_keys(self, memory, client):
+        """clear() unlinks this instance's keys in batches and nothing else."""
+        memory._BATCH_SIZE = 2
+        await memory.set_many({f"k{i}": i for i in range(5)})
+        await client.set("other:key", "kept")
+
+        await memory._unlink_matching("*")
+
+        assert await memory.keys("*") == []
+        assert await client.get("other:key") == b"kept"
+
+    @pytest.mark.asyncio
+    async def test_local_cache_serves_repeat_reads(self, client, monkeypatch):
+        """Repeat reads hit the local cache instead of Redis."""
+        from agenthelm.memory.short_term.redis import RedisShortTermMemory
+
+        memory = RedisShortTermMemory(client=client, local_cache_size=10)
+        await memory.set("key", "value")
+        await memory.get("key")
+
+        async def fail(key):
+            raise AssertionError("unexpected round-trip")
+
+        monkeypatch.setattr(client, "get", fail)
+        assert await memory.get("key") == "value"
+        assert await memory.get_many(["key"]) == {"key": "value"}
+
+    @pytest.mark.asyncio
+    async def test_local_cache_invalidated_by_writes(self, client):
+        """set/delete through the instance invalidate cached values."""
+        from agenthelm.memory.short_term.redis import RedisShortTermMemory
+
+        memory = RedisShortTermMemory(client=client, local_cache_size=10)
+        await memory.set("key", "old")
+        assert await memory.get("key") == "old"
+
+        await memory.set("key", "new")
+        assert await memory.get("key") == "new"
+
+        await memory.delete("key")
+        assert await memory.get("key") is None
+
+    @pytest.mark.asyncio
+    async def test_delete_prefix(self, memory):
+        """delete_prefix removes only keys under the prefix."""
+        await memory.set_many({f"session:abc:{i}": i for i in range(20)})
+        await memory.set("session:abcd:1", "other session")
+        await memory.set("user:1", "kept")
+
+        assert await memory.delete_prefix("session:abc:") == 20
+        assert sorted(await memory.keys("*")) == ["session:abcd:1", "user:1"]
+        assert await memory.delete_prefix("session:missing:") == 0
+
+    @pytest.mark.asyncio
+    async def test_delete_prefix_escapes_glob_characters(self, memory):
+        """Glob characters in the prefix are matched literally."""
+        await memory.set("tag:[a]:1", 1)
+        await memory.set("tag:a:1", 2)
+
+        assert await memory.delete_prefix("tag:[a]:") == 1
+        assert await memory.keys("*") == ["tag:a:1"]
+
+    @pytest.mark.asyncio
+    async def test_reads_legacy_json_values(self, memory, client):
+        """Values written as JSON by earlier versions still decode."""
+        await client.set("agenthelm:legacy", '{"a": 1}')
+        assert await memory.get("legacy") == {"a": 1}
+
+    @pytest.mark.asyncio
+    async def test_binary_codec(self, client):
+        """Binary codecs round-trip bytes through Redis."""
+        pytest.importorskip("msgpack")
+        from agenthelm.memory.short_term.redis import RedisShortTermMemory
+
+        memory = RedisShortTermMemory(client=client, codec="msgpack")
+        await memory.set_many({"a": b"\x00\x01", "b": {"nested": [1, 2]}})
+        assert await memory.get_many(["a", "b"]) == {
+            "a": b"\x00\x01",
+            "b": {"nested": [1, 2]},
+        }
+
+    @pytest.mark.asyncio
+    async def test_incr(self, memory):
+        """incr creates counters at 0 and adds to existing integers."""
+        assert await memory.incr("counter") == 1
+        assert await memory.incr("counter", 5) == 6
+        await memory.set("preset", 10)
+        assert await memory.incr("preset", -3) == 7
+        assert await memory.get("counter") == 6
+
+    @pytest.mark.asyncio
+    async def test_incr_rejects_non_integer(self, memory):
+        """incr on a non-integer value raises TypeError."""
+        await memory.set("key", {"a": 1})
+        with pytest.raises(TypeError, match="not an integer"):
+            await memory.incr("key")
+
+    @pytest.mark.asyncio
+    async def test_concurrent_incr_is_exact(self, memory):
+        """Concurrent increments are not lost."""
+        await asyncio.gather(*[memory.incr("counter") for _ in range(50)])
+        assert await memory.get("counter") == 50
+
+    @pytest.mark.asyncio
+    async def test_compare_and_set(self, memory):
+        """compare_and_set writes only when the current value matches."""
+        assert await memory.compare_and_set("key", None, "v1") is True
+        assert await memory.compare_and_set("key", None, "v2") is False
+        assert await memory.compare_and_set("key", "v1", "v2") is True
+        assert await memory.compare_and_set("key", "v1", "v3") is False
+        assert await memory.get("key") == "v2"
+
+    @pytest.mark.asyncio
+    async def test_set_if_absent(self, memory):
+        """set_if_absent writes missing keys only."""
+        assert await memory.set_if_absent("lock", "owner-a") is True
+        assert await memory.set_if_absent("lock", "owner-b") is False
+        assert await memory.get("lock") == "owner-a"
+
+    @pytest.mark.asyncio
+    async def test_incr_keeps_existing_ttl(self, memory, client):
+        """A new counter gets the TTL; increments don't reset it."""
+        await memory.incr("counter", ttl=60)
+        await client.expire("agenthelm:counter", 30)
+        await memory.incr("counter", ttl=60)
+        assert 0 < await client.ttl("agenthelm:counter") <= 30
+
+    @pytest.mark.asyncio
+    async def test_atomic_ops_invalidate_local_cache(self, client):
+        """incr and compare_and_set are visible through the local cache."""
+        from agenthelm.memory.short_term.redis import RedisShortTermMemory
+
+        memory = RedisShortTermMemory(client=client, local_cache_size=10)
+        await memory.set("counter", 1)
+        assert await memory.get("counter") == 1
+
+        await memory.incr("counter")
+        assert await memory.get("counter") == 2
+        assert await memory.compare_and_set("counter", 2, "done") is True
+        assert await memory.get("counter") == "done"
@@ -165,3 +165,52 @@ def test_sqlite_storage_query_no_filters(sqlite_storage):
     loaded_events = sqlite_storage.query()
     assert len(loaded_events) == 1
     assert loaded_events[0]["tool_name"] == "tool_a"
+
+
+def test_sqlite_storage_cache_hit(sqlite_storage):
+    sqlite_storage.save(
+        {
+            "timestamp": "2025-11-03T10:00:00Z",
+            "tool_name": "tool_a",
+            "execution_time": 0.0,
+            "cache_hit": True,
+        }
+    )
+    sqlite_storage.save(
+        {
+            "timestamp": "2025-11-03T10:01:00Z",
+            "tool_name": "tool_a",
+            "execution_time": 0.5,
+        }
+    )
+
+    assert [e["cache_hit"] for e in sqlite_storage.load()] == [False, True]
+    hits = sqlite_storage.query(filters={"cache_hit": True})
+    assert len(hits) == 1
+    assert hits[0]["timestamp"] == "2025-11-03T10:00:00Z"
+
+
+def test_sqlite_storage_migrates_old_table(sqlite_storage_file):
+    conn = sqlite3.connect(sqlite_storage_file)
+    conn.execute(
+        "CREATE TABLE traces (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+        "timestamp TEXT NOT NULL, tool_name TEXT NOT NULL, inputs TEXT, "
+        "outputs TEXT, execution_time REAL, error_state TEXT, "
+        "llm_reasoning_trace TEXT, confidence_score REAL, token_usage TEXT, "
+        "estimated_cost_usd REAL DEFAULT 0.0, retry_count INTEGER DEFAULT 0, "
+        "agent_name TEXT, session_id TEXT, trace_id TEXT)"
+    )
+    conn.execute(
+        "INSERT INTO traces (timestamp, tool_name) VALUES ('2025-11-03', 'old')"
+    )
+    conn.commit()
+    conn.close()
+
+    storage = SqliteStorage(sqlite_storage_file)
+    storage.save({"timestamp": "2025-11-04", "tool_name": "new", "cache_hit": True})
+
+    events = storage.load()
+    assert [(e["tool_name"], e["cache_hit"]) for e in events] == [
+        ("new", True),
+        ("old", False),
+    ]
@@ -1,6 +1,6 @@
 """Tests for agenthelm.core.tool - Tool decorator and registry."""
 
-from agenthelm import tool, TOOL_REGISTRY
+from agenthelm import tool, TOOL_REGISTRY, ToolCache
 
 
 class TestToolDecorator:
@@ -90,6 +90,29 @@ class TestToolDecorator:
         result = add(2, 3)
         assert result == 5
 
+    def test_tool_cache_memoizes(self):
+        """cache=... serves repeat calls without running the function."""
+        calls = []
+
+        @tool(cache=True)
+        def lookup(city: str) -> str:
+            calls.append(city)
+            return city.upper()
+
+        assert lookup("paris") == "PARIS"
+        assert lookup(city="paris") == "PARIS"
+        assert calls == ["paris"]
+        assert isinstance(TOOL_REGISTRY["lookup"]["contract"]["cache"], ToolCache)
+
+    def test_tool_without_cache(self):
+        """Tools are not cached by default."""
+
+        @tool()
+        def counter() -> int:
+            return len(TOOL_REGISTRY)
+
+        assert TOOL_REGISTRY["counter"]["contract"]["cache"] is None
+
 
 class TestToolRegistry:
     """Test TOOL_REGISTRY functionality."""
@@ -0,0 +1,161 @@
+"""Tests for agenthelm.core.cache - ToolCache."""
+
+import time
+
+import pytest
+
+from agenthelm import InMemoryShortTermMemory, ToolCache
+from agenthelm.core.cache import bind_arguments, canonical_arguments, resolve_cache
+
+
+class TestCanonicalArguments:
+    """Test argument binding and canonical keys."""
+
+    def test_binding_applies_defaults(self):
+        """Positional, keyword and default arguments bind the same way."""
+
+        def lookup(city: str, units: str = "metric"):
+            pass
+
+        expected = {"city": "Paris", "units": "metric"}
+        assert bind_arguments(lookup, ("Paris",), {}) == expected
+        assert bind_arguments(lookup, (), {"city": "Paris"}) == expected
+        assert bind_arguments(lookup, ("Paris", "metric"), {}) == expected
+
+    def test_binding_flattens_var_keyword(self):
+        """**kwargs are merged into the top level."""
+
+        def mcp_tool(**kwargs):
+            pass
+
+        assert bind_arguments(mcp_tool, (), {"a": 1}) == {"a": 1}
+
+    def test_order_does_not_matter(self):
+        """Key order never changes the canonical form."""
+        assert canonical_arguments({"a": 1, "b": {"y": 2, "x": 1}}) == (
+            canonical_arguments({"b": {"x": 1, "y": 2}, "a": 1})
+        )
+
+    def test_unencodable_arguments(self):
+        """Arguments that can't be encoded as JSON give None."""
+        assert canonical_arguments({"f": object()}) is None
+        assert canonical_arguments({"s": {2, 1}}) == '{"s":[1,2]}'
+
+
+class TestToolCache:
+    """Test the in-process ToolCache."""
+
+    def test_hit_and_miss(self):
+        """A stored result is returned for the same arguments only."""
+        cache = ToolCache()
+        cache.set("lookup", {"city": "Paris"}, "CET")
+
+        assert cache.get("lookup", {"city": "Paris"}) == (True, "CET")
+        assert cache.get("lookup", {"city": "Tokyo"}) == (False, None)
+        assert cache.get("other", {"city": "Paris"}) == (False, None)
+        assert cache.stats["hits"] == 1
+        assert cache.stats["misses"] == 2
+
+    def test_caches_none(self):
+        """A None result is a hit, not a miss."""
+        cache = ToolCache()
+        cache.set("lookup", {}, None)
+        assert cache.get("lookup", {}) == (True, None)
+
+    def test_ttl(self, monkeypatch):
+        """Entries expire after ttl seconds."""
+        cache = ToolCache(ttl=10)
+        cache.set("lookup", {}, "value")
+
+        now = time.time()
+        monkeypatch.setattr(time, "time", lambda: now + 11)
+        assert cache.get("lookup", {}) == (False, None)
+        assert cache.stats["size"] == 0
+
+    def test_lru_eviction(self):
+        """The least recently used entry is evicted past maxsize."""
+        cache = ToolCache(maxsize=2)
+        cache.set("t", {"n": 1}, 1)
+        cache.set("t", {"n": 2}, 2)
+        cache.get("t", {"n": 1})
+        cache.set("t", {"n": 3}, 3)
+
+        assert cache.get("t", {"n": 1}) == (True, 1)
+        assert cache.get("t", {"n": 2}) == (False, None)
+        assert cache.get("t", {"n": 3}) == (True, 3)
+
+    def test_call_memoizes(self):
+        """call() runs the function once per distinct arguments."""
+        calls = []
+
+        def lookup(city: str, units: str = "metric") -> str:
+            calls.append(city)
+            return city.upper()
+
+        cache = ToolCache()
+        assert cache.call(lookup, "lookup", ("paris",), {}) == "PARIS"
+        assert cache.call(lookup, "lookup", (), {"city": "paris"}) == "PARIS"
+        assert calls == ["paris"]
+
+    def test_errors_are_not_cached(self):
+        """A call that raises is retried on the next call."""
+        calls = []
+
+        def flaky() -> str:
+            calls.append(1)
+            if len(calls) == 1:
+                raise ValueError("boom")
+            return "ok"
+
+        cache = ToolCache()
+        with pytest.raises(ValueError):
+            cache.call(flaky, "flaky", (), {})
+        assert cache.call(flaky, "flaky", (), {}) == "ok"
+        assert len(calls) == 2
+
+    def test_invalidate(self):
+        """invalidate() drops one tool's entries; clear() drops all."""
+        cache = ToolCache()
+        cache.set("a", {}, 1)
+        cache.set("b", {}, 2)
+
+        cache.invalidate("a")
+        assert cache.get("a", {}) == (False, None)
+        assert cache.get("b", {}) == (True, 2)
+
+        cache.clear()
+        assert cache.get("b", {}) == (False, None)
+
+    def test_resolve_cache(self):
+        """Cache options resolve to ToolCache instances."""
+        cache = ToolCache()
+        assert resolve_cache(None) is None
+        assert resolve_cache(False) is None
+        assert resolve_cache(cache) is cache
+        assert isinstance(resolve_cache(True), ToolCache)
+        assert resolve_cache(60).ttl == 60
+        with pytest.raises(TypeError):
+            resolve_cache("yes")
+
+
+class TestToolCacheStore:
+    """Test ToolCache backed by short-term memory."""
+
+    def test_round_trip_through_store(self):
+        """Entries are written to and read from the store."""
+        store = InMemoryShortTermMemory()
+        cache = ToolCache(ttl=60, store=store)
+        try:
+            cache.set("lookup", {"city": "Paris"}, {"tz": "CET"})
+            assert cache.get("lookup", {"city": "Paris"}) == (True, {"tz": "CET"})
+            assert cache.get("lookup", {"city": "Tokyo"}) == (False, None)
+
+            # Another cache on the same store sees the entry
+            other = ToolCache(store=store)
+            assert other.get("lookup", {"city": "Paris"})[0] is True
+            other.close()
+
+            cache.invalidate("lookup")
+            assert cache.get("lookup", {"city": "Paris"}) == (False, None)
+        finally:
+            cache.close()
@@ -1,9 +1,12 @@
 """Tests for agenthelm.core.tracer - ExecutionTracer."""
 
+import threading
+
 import pytest
 from unittest.mock import MagicMock
 
-from agenthelm import ExecutionTracer, tool, TOOL_REGISTRY, Event
+from agenthelm import BlobStore, ExecutionTracer, tool, TOOL_REGISTRY, Event
+from agenthelm.core import blobs as blobs_module
 from agenthelm.core.handlers import AutoApproveHandler, AutoDenyHandler
 from agenthelm.core.storage.base import BaseStorage
 
@@ -175,6 +178,32 @@ class TestExecutionTracerContext:
         assert event1["llm_reasoning_trace"] == "First"
         assert event2["llm_reasoning_trace"] == ""  # Cleared
 
+    def test_context_is_per_thread(self):
+        """Concurrent callers sharing a tracer keep their own context."""
+        barrier = threading.Barrier(2)
+
+        @tool()
+        def whoami(name: str) -> str:
+            return name
+
+        def step(name: str) -> None:
+            self.tracer.set_trace_context(
+                reasoning=f"{name} thinks", confidence=0.5, agent_name=name
+            )
+            barrier.wait()  # Both contexts are set before either traces
+            self.tracer.trace_and_execute(whoami, name)
+
+        threads = [threading.Thread(target=step, args=(n,)) for n in ("a", "b")]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for event in self.storage.events:
+            name = event["inputs"]["name"]
+            assert event["agent_name"] == name
+            assert event["llm_reasoning_trace"] == f"{name} thinks"
+
 
 class TestExecutionTracerRetry:
     """Test retry logic."""
@@ -312,3 +341,104 @@ class TestExecutionTracerIntegration:
         assert event.tool_name == "my_tool"
         assert event.inputs == {"name": "World"}
         assert event.outputs == {"result": "Hello, World"}
+
+
+class TestExecutionTracerCache:
+    """Test tracing of cached tools."""
+
+    def setup_method(self):
+        TOOL_REGISTRY.clear()
+        self.storage = MockStorage()
+        self.tracer = ExecutionTracer(
+            storage=self.storage,
+            approval_handler=AutoApproveHandler(),
+        )
+
+    def test_cache_hit_recorded_in_event(self):
+        """A repeat call is served from cache and flagged in its event."""
+        calls = []
+
+        @tool(cache=True)
+        def lookup(city: str) -> str:
+            calls.append(city)
+            return city.upper()
+
+        _, first = self.tracer.trace_and_execute(lookup, city="paris")
+        output, second = self.tracer.trace_and_execute(lookup, "paris")
+
+        assert output == "PARIS"
+        assert calls == ["paris"]
+        assert first.cache_hit is False
+        assert second.cache_hit is True
+        assert second.outputs == {"result": "PARIS"}
+        assert self.storage.events[1]["cache_hit"] is True
+
+    def test_failures_are_not_cached(self):
+        """A failed call is not cached, so the next call runs the tool."""
+        calls = []
+
+        @tool(cache=True)
+        def flaky() -> str:
+            calls.append(1)
+            if len(calls) == 1:
+                raise ValueError("boom")
+            return "ok"
+
+        with pytest.raises(RuntimeError):
+            self.tracer.trace_and_execute(flaky)
+        output, event = self.tracer.trace_and_execute(flaky)
+
+        assert output == "ok"
+        assert event.cache_hit is False
+
+
+class TestExecutionTracerLargeOutputs:
+    """Test size caps on traced outputs."""
+
+    def setup_method(self):
+        TOOL_REGISTRY.clear()
+        self.storage = MockStorage()
+
+    def test_large_output_truncated_in_trace(self, tmp_path):
+        """The event keeps a preview and blob reference; the caller gets it all."""
+        blobs = BlobStore(tmp_path)
+        tracer = ExecutionTracer(
+            storage=self.storage, max_output_bytes=100, blob_store=blobs
+        )
+
+        @tool()
+        def listing() -> str:
+            return "file\n" * 1000
+
+        output, event = tracer.trace_and_execute(listing)
+
+        assert output == "file\n" * 1000
+        ref = event.outputs["result"]
+        assert ref["truncated"] is True
+        assert ref["size"] == 5000
+        assert blobs.read_text(ref["blob"]) == output
+        assert self.storage.events[0]["outputs"]["result"]["blob"] == ref["blob"]
+
+    def test_capped_output_is_always_recoverable(self, tmp_path, monkeypatch):
+        """Without a blob_store, capped outputs go to the default BlobStore."""
+        monkeypatch.setattr(blobs_module, "DEFAULT_BLOB_DIR", tmp_path)
+        tracer = ExecutionTracer(storage=self.storage, max_output_bytes=100)
+
+        @tool()
+        def listing() -> str:
+            return "file\n" * 1000
+
+        output, event = tracer.trace_and_execute(listing)
+        ref = event.outputs["result"]
+        assert BlobStore(tmp_path).read_text(ref["blob"]) == output
+
+    def test_cap_off_by_default(self):
+        """Outputs are stored in full unless max_output_bytes is set."""
+        tracer = ExecutionTracer(storage=self.storage)
+
+        @tool()
+        def listing() -> str:
+            return "x" * 100_000
+
+        _, event = tracer.trace_and_execute(listing)
+        assert event.outputs == {"result": "x" * 100_000}
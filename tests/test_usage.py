@@ -0,0 +1,190 @@
+"""Tests for agenthelm.core.usage - LM usage capture and attribution."""
+
+import dspy
+import pytest
+from dspy.utils import DummyLM
+from dspy.utils.usage_tracker import UsageTracker
+
+from agenthelm import (
+    AutoApproveHandler,
+    CostTracker,
+    ExecutionTracer,
+    Plan,
+    PlannerAgent,
+    PlanStep,
+    ToolAgent,
+)
+from agenthelm.core.storage.json_storage import JsonStorage
+from agenthelm.core.usage import UsageRecorder, take_usage, token_usage
+from agenthelm.orchestration import AgentRegistry, Orchestrator
+
+# $10 / $30 per 1M tokens: each call below costs 100 * 10e-6 + 20 * 30e-6
+PRICING = {"dummy": {"input": 10.0, "output": 30.0}}
+CALL_COST = 0.0016
+
+
+class MeteredLM(DummyLM):
+    """DummyLM that reports 100 input / 20 output tokens per call, like a provider."""
+
+    def __call__(self, *args, **kwargs):
+        outputs = super().__call__(*args, **kwargs)
+        if dspy.settings.usage_tracker:
+            dspy.settings.usage_tracker.add_usage(
+                self.model, {"prompt_tokens": 100, "completion_tokens": 20}
+            )
+        return outputs
+
+
+def react_lm() -> MeteredLM:
+    """Scripted LM for one tool call followed by an answer (3 calls)."""
+    return MeteredLM(
+        [
+            {
+                "next_thought": "Look it up",
+                "next_tool_name": "get_time",
+                "next_tool_args": {"city": "Tokyo"},
+            },
+            {"next_thought": "Done", "next_tool_name": "finish", "next_tool_args": {}},
+            {"reasoning": "Found it", "answer": "noon"},
+        ]
+    )
+
+
+def get_time(city: str) -> str:
+    """Get the time in a city."""
+    return "noon"
+
+
+class TestUsageRecorder:
+    """Test recording and pricing LM calls."""
+
+    def test_token_usage_keys(self):
+        """OpenAI and Anthropic usage keys are both understood."""
+        openai = token_usage("m", {"prompt_tokens": 3, "completion_tokens": 4})
+        anthropic = token_usage("m", {"input_tokens": 3, "output_tokens": 4})
+        assert openai == anthropic
+        assert token_usage("m", {}).total_tokens == 0
+
+    def test_take_drains_pending(self):
+        """take() returns the priced usage once."""
+        tracker = CostTracker(pricing=PRICING)
+        recorder = UsageRecorder(tracker)
+        recorder.add_usage("dummy", {"prompt_tokens": 100, "completion_tokens": 20})
+        recorder.add_usage("dummy", {"prompt_tokens": 100, "completion_tokens": 20})
+
+        usage, cost = recorder.take()
+        assert usage.input_tokens == 200
+        assert usage.output_tokens == 40
+        assert cost == pytest.approx(2 * CALL_COST)
+        assert recorder.take() == (None, 0.0)
+        assert tracker.get_summary()["num_calls"] == 2
+
+    def test_forwards_to_parent(self):
+        """A tracker that was already installed still sees every call."""
+        parent = UsageTracker()
+        recorder = UsageRecorder(CostTracker(), parent=parent)
+        recorder.add_usage("dummy", {"prompt_tokens": 1, "completion_tokens": 1})
+        assert parent.usage_data["dummy"]
+
+    def test_take_usage_without_recorder(self):
+        """Outside a recorder there is nothing to take."""
+        assert take_usage() == (None, 0.0)
+
+
+class TestAgentUsage:
+    """Test usage captured by agents and the orchestrator."""
+
+    @pytest.fixture
+    def tracer(self, tmp_path):
+        return ExecutionTracer(
+            storage=JsonStorage(str(tmp_path / "events.json")),
+            approval_handler=AutoApproveHandler(),
+        )
+
+    def test_tool_agent_attributes_usage(self, tracer):
+        """The call that chose a tool is charged to its event, the rest to the run."""
+        agent = ToolAgent(
+            name="clock",
+            lm=react_lm(),
+            tools=[get_time],
+            tracer=tracer,
+            cost_tracker=CostTracker(pricing=PRICING),
+        )
+        result = agent.run("What time is it in Tokyo?")
+
+        assert result.success
+        assert len(result.events) == 1
+        event = result.events[0]
+        assert event.token_usage.input_tokens == 100
+        assert event.estimated_cost_usd == pytest.approx(CALL_COST)
+
+        # 3 LM calls in total, each counted once
+        assert result.token_usage.input_tokens == 300
+        assert result.token_usage.output_tokens == 60
+        assert result.total_cost_usd == pytest.approx(3 * CALL_COST)
+        assert agent.cost_tracker.get_total_cost() == pytest.approx(3 * CALL_COST)
+
+    def test_tool_agent_without_tracer(self):
+        """Without events, all usage goes to the run totals."""
+        agent = ToolAgent(
+            name="clock",
+            lm=react_lm(),
+            tools=[get_time],
+            cost_tracker=CostTracker(pricing=PRICING),
+        )
+        result = agent.run("What time is it in Tokyo?")
+        assert result.token_usage.input_tokens == 300
+        assert result.total_cost_usd == pytest.approx(3 * CALL_COST)
+
+    def test_tool_agent_events_outside_run(self, tracer):
+        """Outside run() there are no events to add to."""
+        agent = ToolAgent(name="clock", lm=react_lm(), tools=[get_time], tracer=tracer)
+        agent.run("What time is it in Tokyo?")
+
+        assert agent._events == ()
+        with pytest.raises(RuntimeError, match="outside run"):
+            agent._react.tools["get_time"](city="Tokyo")
+
+    def test_planner_records_usage(self):
+        """Plans carry the usage spent generating them."""
+        steps = '[{"id": "s1", "tool": "get_time", "description": "Look up"}]'
+        lm = MeteredLM([{"reasoning": "r", "goal": "Time", "steps_json": steps}])
+        planner = PlannerAgent(
+            name="planner", lm=lm, cost_tracker=CostTracker(pricing=PRICING)
+        )
+
+        plan = planner.plan("What time is it?")
+        assert plan.token_usage.input_tokens == 100
+        assert plan.estimated_cost_usd == pytest.approx(CALL_COST)
+
+    async def test_orchestrator_aggregates(self, tracer):
+        """Plan, step and event usage add up once in the orchestrated result."""
+        agent = ToolAgent(
+            name="clock",
+            lm=react_lm(),
+            tools=[get_time],
+            tracer=tracer,
+            cost_tracker=CostTracker(pricing=PRICING),
+        )
+        registry = AgentRegistry()
+        registry.register(agent)
+        plan = Plan(
+            goal="Time",
+            steps=[
+                PlanStep(
+                    id="s1",
+                    agent_name="clock",
+                    tool_name="get_time",
+                    description="Tokyo",
+                )
+            ],
+            approved=True,
+            estimated_cost_usd=0.01,
+        )
+
+        result = await Orchestrator(registry).execute(plan)
+
+        assert result.success
+        assert len(result.events) == 1
+        assert result.token_usage.input_tokens == 300
+        assert result.total_cost_usd == pytest.approx(0.01 + 3 * CALL_COST)